@@ -1,35 +1,227 @@
 from datetime import datetime as dt
 
+import numpy as np
 import pandas as pd
 
+# Trend window label -> number of trading days
+TREND_WINDOWS = {"5d": 5, "20d": 20, "60d": 60, "252d": 252}
+
+# Resample alias -> period a date's bucket is, labelled by its last day
+BUCKET_PERIODS = {"W": "W-SUN", "ME": "M"}
+
+
+def _resample_prices(df: pd.DataFrame, freq: str, func_to_apply: str):
+    """Per-asset resample of a Date-indexed price frame."""
+    return (
+        df.groupby("Asset", observed=True)["Price"]
+        .resample(freq)
+        .agg(func_to_apply)  # Applies .mean() or .last() dynamically
+        .reset_index()
+    )
+
+
+def _aggregate_runs(codes, labels, values, func_to_apply):
+    """
+    Aggregates each run of equal (asset code, bucket label) in rows that
+    are grouped by asset and date-sorted, as Dataset.select returns them.
+    Returns the (codes, labels, values) of one row per run.
+    """
+    if not len(codes):
+        return codes, labels, values
+    new_run = np.r_[
+        True, (codes[1:] != codes[:-1]) | (labels[1:] != labels[:-1])
+    ]
+    starts = np.flatnonzero(new_run)
+    ends = np.r_[starts[1:], len(codes)]
+    if func_to_apply == "mean":
+        values = np.add.reduceat(values, starts) / (ends - starts)
+    else:
+        values = values[ends - 1]
+    return codes[starts], labels[starts], values
+
+
+def _rollup_slice(view, filtered_df, materialized, assets, freq, func):
+    """
+    Stored rollup buckets for the `materialized` rows (those of `assets`)
+    of `filtered_df`, as one (Date, Asset, Price) frame.
+
+    The first and last bucket may straddle the edge of the selection
+    (e.g. a week running into January), so their stored values include
+    days that were filtered out. Those two are aggregated from the
+    selected rows; every bucket in between lies wholly inside the
+    selection. Built from arrays, as this runs on every chart rerun.
+    """
+    dates = filtered_df.index.to_numpy()
+    selected = dates[materialized]
+    if not len(selected):
+        return view.frame.iloc[:0].reset_index()
+
+    period = BUCKET_PERIODS[freq]
+    first = pd.Timestamp(selected.min()).to_period(period)
+    last = pd.Timestamp(selected.max()).to_period(period)
+    first_label = first.end_time.normalize().to_datetime64()
+    last_label = last.end_time.normalize().to_datetime64()
+
+    inner = view.select(assets, first.end_time.year, last.end_time.year)
+    inner_dates = inner.index.to_numpy()
+    keep = (inner_dates > first_label) & (inner_dates < last_label)
+    asset_dtype = inner["Asset"].dtype
+
+    # Blank prices are skipped, as resampling does
+    prices = filtered_df["Price"].to_numpy()
+    in_last = dates >= last.start_time.to_datetime64()
+    in_first = dates <= first.end_time.to_datetime64()
+    edge = materialized & ~np.isnan(prices) & (in_first | in_last)
+    # The selection's asset codes, renumbered to the view's categories
+    to_view = asset_dtype.categories.get_indexer(
+        filtered_df["Asset"].cat.categories
+    )
+    edge_codes, edge_labels, edge_prices = _aggregate_runs(
+        to_view[filtered_df["Asset"].cat.codes.to_numpy()[edge]],
+        np.where(in_last[edge], last_label, first_label),
+        prices[edge].astype("float64"),
+        func,
+    )
+
+    codes = np.concatenate(
+        [inner["Asset"].cat.codes.to_numpy()[keep], edge_codes]
+    )
+    return pd.DataFrame(
+        {
+            "Date": np.concatenate([inner_dates[keep], edge_labels]),
+            "Asset": pd.Categorical.from_codes(codes, dtype=asset_dtype),
+            "Price": np.concatenate(
+                [inner["Price"].to_numpy()[keep], edge_prices]
+            ).astype(inner["Price"].dtype),
+        }
+    )
+
 
 def data_granularity_and_aggregate_stats(
-    freq_selection, agg_method, filtered_assets_df
+    freq_selection, agg_method, filtered_assets_df, rollups=None
 ):
+    """
+    Resample a Date-indexed price frame (see app.dataset) to the selected
+    frequency. Returns a frame with 'Date', 'Asset' and 'Price' columns.
+
+    If `rollups` (see app.rollups) holds a materialized view for the
+    selection, that view is sliced to the assets and buckets covered by
+    `filtered_assets_df` instead of resampling it.
+    """
     # Map UI text to Pandas offset aliases
     freq_map = {"Daily": None, "Weekly": "W", "Monthly": "ME"}
 
     # Map UI text to specific pandas function names
     agg_map = {"Average Price": "mean", "Close Price": "last"}
 
-    if freq_map[freq_selection]:
+    view = (rollups or {}).get((freq_selection, agg_method))
+
+    if freq_map[freq_selection] and view is not None and not view.empty:
+        if filtered_assets_df.empty:
+            return view.frame.iloc[:0].reset_index()
+
+        selected_assets = filtered_assets_df["Asset"].unique()
+        stored = [a for a in selected_assets if a in view.offsets]
+        materialized = filtered_assets_df["Asset"].isin(stored).to_numpy()
+
+        parts = [
+            _rollup_slice(
+                view,
+                filtered_assets_df,
+                materialized,
+                stored,
+                freq_map[freq_selection],
+                agg_map[agg_method],
+            )
+        ]
+
+        # Series without a stored rollup (e.g. derived spreads) are resampled
+        remaining_df = filtered_assets_df[~materialized]
+        if not remaining_df.empty:
+            parts.append(
+                _resample_prices(
+                    remaining_df,
+                    freq_map[freq_selection],
+                    agg_map[agg_method],
+                )
+            )
+
+        df_plot = pd.concat(parts, ignore_index=True)
+
+    elif freq_map[freq_selection]:
         # Set the aggregation function dynamically based on the toggle
-        func_to_apply = agg_map[agg_method]
-
-        df_plot = (
-            filtered_assets_df.set_index("Date")
-            .groupby("Asset")["Price"]
-            .resample(freq_map[freq_selection])
-            .agg(func_to_apply)  # Applies .mean() or .last() dynamically
-            .reset_index()
+        df_plot = _resample_prices(
+            filtered_assets_df,
+            freq_map[freq_selection],
+            agg_map[agg_method],
         )
     else:
         # Daily data is already discrete; no aggregation needed
-        df_plot = filtered_assets_df
+        df_plot = filtered_assets_df.reset_index()
 
     return df_plot
 
 
+def rolling_ols_slopes(values: np.ndarray, windows) -> np.ndarray:
+    """
+    OLS slope of `values` against their position over every trailing window.
+
+    Returns a (len(windows), len(values)) array where row k, column i holds
+    the slope fitted to values[i - w_k + 1 : i + 1], or NaN when fewer than
+    w_k values are available. Every window length and end position is
+    evaluated at once from cumulative sums, so the cost is O(n) per window
+    with no Python loop over positions or windows.
+    """
+    y = np.asarray(values, dtype="float64")
+    n = len(y)
+    # The slope ignores a constant offset, and removing it keeps the prefix
+    # sums small enough that differencing them doesn't cancel away digits
+    if n:
+        y = y - y.mean()
+    w = np.asarray(windows, dtype="float64")[:, None]
+
+    # Prefix sums of y and i*y, with a leading zero
+    position = np.arange(n, dtype="float64")
+    cum_y = np.concatenate([[0.0], np.cumsum(y)])
+    cum_iy = np.concatenate([[0.0], np.cumsum(position * y)])
+
+    end = np.arange(1, n + 1)[None, :]
+    start = np.clip(end - w.astype(np.int64), 0, None)
+    sum_y = cum_y[end] - cum_y[start]
+    # Shift x so every window runs 0..w-1
+    sum_xy = (cum_iy[end] - cum_iy[start]) - start * sum_y
+
+    sum_x = w * (w - 1) / 2
+    sum_xx = (w - 1) * w * (2 * w - 1) / 6
+    slopes = (w * sum_xy - sum_x * sum_y) / (w * sum_xx - sum_x**2)
+
+    slopes[end < w] = np.nan
+    return slopes
+
+
+def compute_trends(dataset, windows=None) -> pd.DataFrame:
+    """
+    Latest rolling OLS slope (value units per observation) for every asset
+    in a Dataset (see app.dataset) over each trend window.
+    Returns a frame indexed by Asset with one column per window label.
+    """
+    windows = windows or TREND_WINDOWS
+    values = dataset.frame[dataset.value_col].to_numpy()
+
+    rows = {}
+    for asset, (start, stop) in dataset.offsets.items():
+        block = values[start:stop]
+        block = block[~np.isnan(block)]
+        if len(block) == 0:
+            continue
+        slopes = rolling_ols_slopes(block, list(windows.values()))
+        rows[asset] = slopes[:, -1]
+
+    return pd.DataFrame.from_dict(
+        rows, orient="index", columns=list(windows.keys())
+    ).rename_axis("Asset")
+
+
 def calculate_slope_over_time_period(
     df: pd.DataFrame,
     date_col: str,
@@ -38,9 +230,25 @@ def calculate_slope_over_time_period(
 ):
     """
     Calculates the slope of a time series over a specified period.
+    Returns the OLS slope in value units per day, or None if fewer than
+    two observations fall in the period.
     """
 
-    values_in_period = df[df[date_col] >= start_date][value_col]
+    in_period = df[df[date_col] >= start_date][[date_col, value_col]].dropna()
 
-    if len(values_in_period) < 2:
+    if len(in_period) < 2:
         return None
+
+    days = (
+        (in_period[date_col] - in_period[date_col].min())
+        / pd.Timedelta(days=1)
+    ).to_numpy(dtype="float64")
+    values = in_period[value_col].to_numpy(dtype="float64")
+
+    days_centered = days - days.mean()
+    denominator = (days_centered**2).sum()
+    if denominator == 0:
+        return None
+
+    covariance = (days_centered * (values - values.mean())).sum()
+    return float(covariance / denominator)
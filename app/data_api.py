@@ -0,0 +1,334 @@
+"""
+Read-only HTTP API over the normalized series the dashboard plots, for
+tools that would otherwise parse data/spot_prices.json themselves:
+
+    uv run python -m app.data_api --port 8502
+
+    GET /assets
+    GET /series?asset=Gulf Coast Jet Fuel&from=2023&to=2024-06-30
+                &freq=weekly&agg=last&format=csv
+
+`dataset` picks commodity (default, spot prices plus spreads and ratios)
+or refinery. `asset` may be repeated or comma-separated. `freq` is daily,
+weekly or monthly and `agg` mean or last, resampled through the same
+rollups as the commodity chart; buckets with no data are left out.
+`format` is csv (default), json (array of records) or arrow (Arrow IPC
+stream). Bodies are streamed in chunks.
+
+Every response carries an ETag built from the data version, so polling
+with If-None-Match costs a 304 until new data lands.
+"""
+
+import argparse
+import json
+import logging
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from traceback import format_exc
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from app.analytics import data_granularity_and_aggregate_stats
+from app.dataset import Dataset, get_refinery_data
+from app.price_matrix import get_commodity_series
+from app.rollups import get_spot_rollups, rollups_version
+from app.series_export import (
+    frame_chunks,
+    stream_arrow,
+    stream_csv,
+    stream_json,
+)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8502
+
+# Query values -> the UI labels app.analytics expects
+FREQ_LABELS = {"daily": "Daily", "weekly": "Weekly", "monthly": "Monthly"}
+AGG_LABELS = {"mean": "Average Price", "last": "Close Price"}
+
+CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "json": "application/json",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+
+class BadRequest(ValueError):
+    """A query the API cannot answer; the message is sent to the client."""
+
+
+# -----------------------------------------------------------------------------
+# Query
+# -----------------------------------------------------------------------------
+
+
+def _single(params: dict, name: str, default: str) -> str:
+    return params.get(name, [default])[-1].strip().lower() or default
+
+
+def _parse_bound(value: str | None, name: str) -> pd.Timestamp | None:
+    """'2024' or '2024-06-30' -> Timestamp; missing -> None."""
+    if not value:
+        return None
+    try:
+        return pd.Timestamp(value)
+    except ValueError:
+        raise BadRequest(f"'{name}' must be a year or YYYY-MM-DD date")
+
+
+def open_source(params: dict) -> tuple[Dataset, dict | None, str]:
+    """
+    (dataset, rollups, version) for the query's `dataset`. Cheap on a warm
+    cache, so conditional requests are answered before any filtering.
+    """
+    source = _single(params, "dataset", "commodity")
+    if source == "commodity":
+        dataset = get_commodity_series()
+        rollups = get_spot_rollups()
+        version = f"{dataset.version}:{rollups_version(rollups)}"
+        return dataset, rollups, version
+    if source == "refinery":
+        dataset = get_refinery_data()
+        return dataset, None, dataset.version
+    raise BadRequest("'dataset' must be commodity or refinery")
+
+
+@dataclass(frozen=True)
+class SeriesQuery:
+    """A validated /series query."""
+
+    assets: list[str]
+    freq: str
+    agg: str
+    start: pd.Timestamp | None
+    end: pd.Timestamp | None
+
+
+def parse_query(params: dict, dataset: Dataset) -> SeriesQuery:
+    """
+    Validates a /series query against `dataset`. Raises BadRequest for
+    anything it cannot answer, before any conditional-request check.
+    """
+    if dataset.empty:
+        raise BadRequest("No data available")
+
+    assets = [
+        name.strip()
+        for value in params.get("asset", [])
+        for name in value.split(",")
+        if name.strip()
+    ]
+    if not assets:
+        raise BadRequest("'asset' is required, see /assets")
+    unknown = [a for a in assets if a not in dataset.offsets]
+    if unknown:
+        raise BadRequest(f"Unknown asset(s): {', '.join(unknown)}")
+
+    freq = FREQ_LABELS.get(_single(params, "freq", "daily"))
+    agg = AGG_LABELS.get(_single(params, "agg", "mean"))
+    if freq is None or agg is None:
+        raise BadRequest(
+            "'freq' must be daily, weekly or monthly and 'agg' mean or last"
+        )
+
+    start = _parse_bound(params.get("from", [None])[-1], "from")
+    end = _parse_bound(params.get("to", [None])[-1], "to")
+    # A bare year for 'to' means through the end of that year
+    if end is not None and len(params["to"][-1].strip()) == 4:
+        end = end + pd.offsets.YearEnd(0)
+    if start is not None and end is not None and start > end:
+        raise BadRequest("'from' must not be after 'to'")
+
+    return SeriesQuery(assets, freq, agg, start, end)
+
+
+def load_series(
+    query: SeriesQuery, dataset: Dataset, rollups: dict | None
+) -> pd.DataFrame:
+    """
+    The rows a /series query selects as a (Date, Asset, value) frame sorted
+    by asset and date, without empty buckets. Weekly and monthly buckets
+    aggregate only the days in [from, to]; the first and last may be
+    partial and keep their usual end-of-period label.
+    """
+    assets, start, end = query.assets, query.start, query.end
+    min_year, max_year = dataset.year_range
+    rows = dataset.select(
+        assets,
+        start.year if start is not None else min_year,
+        end.year if end is not None else max_year,
+    )
+    # Trim to the exact dates before aggregating, so a bucket that runs
+    # past either bound only aggregates the days inside [from, to]
+    if start is not None or end is not None:
+        dates = rows.index
+        in_range = np.ones(len(rows), dtype=bool)
+        if start is not None:
+            in_range &= dates >= start
+        if end is not None:
+            in_range &= dates <= end
+        rows = rows[in_range]
+
+    value_col = dataset.value_col
+    columns = ["Date", "Asset", value_col]
+    if rows.empty:
+        # Resampling nothing loses the Asset column; answer with a header
+        return rows.reset_index()[columns]
+
+    # app.analytics resamples a 'Price' column
+    series = data_granularity_and_aggregate_stats(
+        query.freq,
+        query.agg,
+        rows.rename(columns={value_col: "Price"}),
+        rollups,
+    ).rename(columns={"Price": value_col})
+
+    # Buckets with no observations (e.g. weeks of the monthly refinery
+    # series) come back blank; stored rollups drop them too
+    series = series[columns].dropna(subset=[value_col])
+    series = series.sort_values(by=["Asset", "Date"], kind="stable")
+    return series.reset_index(drop=True)
+
+
+STREAMS = {"csv": stream_csv, "json": stream_json, "arrow": stream_arrow}
+
+
+# -----------------------------------------------------------------------------
+# Server
+# -----------------------------------------------------------------------------
+
+
+class DataAPIHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 for chunked transfer encoding and keep-alive polling
+    protocol_version = "HTTP/1.1"
+    server_version = "JetDashDataAPI/1.0"
+
+    def do_GET(self):
+        # Set once a 200 has been sent and the body is being streamed
+        self._streaming = False
+        url = urlsplit(self.path)
+        params = parse_qs(url.query)
+        try:
+            if url.path == "/series":
+                self._series(params)
+            elif url.path == "/assets":
+                self._assets()
+            else:
+                self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+        except BadRequest as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+        except Exception:
+            self.log_error("Error serving %s\n%s", self.path, format_exc())
+            if self._streaming:
+                # The status line is gone; cut the chunked body short
+                self.close_connection = True
+            else:
+                self._send_json(
+                    HTTPStatus.INTERNAL_SERVER_ERROR,
+                    {"error": "Internal server error"},
+                )
+
+    def _not_modified(self, etag: str) -> bool:
+        """Sends 304 and returns True if the client already has `etag`."""
+        tags = self.headers.get("If-None-Match", "").strip()
+        # If-None-Match uses weak comparison: W/"x" matches "x"
+        held = [t.strip().removeprefix("W/") for t in tags.split(",")]
+        if etag not in held and tags != "*":
+            return False
+        self.send_response(HTTPStatus.NOT_MODIFIED)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+        return True
+
+    def _series(self, params: dict):
+        fmt = _single(params, "format", "csv")
+        if fmt not in STREAMS:
+            raise BadRequest("'format' must be csv, json or arrow")
+
+        dataset, rollups, version = open_source(params)
+        # A bad query is a 400 even when the client holds the current tag
+        query = parse_query(params, dataset)
+        etag = f'"{version}"'
+        if self._not_modified(etag):
+            return
+
+        series = load_series(query, dataset, rollups)
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", CONTENT_TYPES[fmt])
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        self._streaming = True
+
+        try:
+            for chunk in STREAMS[fmt](frame_chunks([series])):
+                if chunk:
+                    self.wfile.write(f"{len(chunk):X}\r\n".encode())
+                    self.wfile.write(chunk + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # Client hung up mid-stream (e.g. it only wanted the headers)
+            self.close_connection = True
+
+    def _assets(self):
+        commodity, refinery = get_commodity_series(), get_refinery_data()
+        etag = f'"{commodity.version}:{refinery.version}"'
+        if self._not_modified(etag):
+            return
+
+        listing = {
+            name: {
+                "version": dataset.version,
+                "value": dataset.value_col,
+                "assets": list(dataset.assets),
+            }
+            for name, dataset in [
+                ("commodity", commodity),
+                ("refinery", refinery),
+            ]
+        }
+        self._send_json(HTTPStatus.OK, listing, etag)
+
+    def _send_json(self, status: HTTPStatus, payload, etag: str = None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", CONTENT_TYPES["json"])
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Read-only HTTP API over the dashboard series"
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+
+    # The loaders are st.cache_resource functions; outside `streamlit run`
+    # they use in-process caches and warn about the missing session
+    logging.getLogger(
+        "streamlit.runtime.scriptrunner_utils.script_run_context"
+    ).setLevel(logging.ERROR)
+
+    server = ThreadingHTTPServer((args.host, args.port), DataAPIHandler)
+    print(f"Serving data API on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,363 @@
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from app.fingerprint import data_version
+from app.timing import timed
+
+DATA_DIR = Path(__file__).parents[1] / "data"
+SPOT_PRICES_FILE = DATA_DIR / "spot_prices.json"
+REFINERY_FILE = DATA_DIR / "refinery_utilization.json"
+
+# Keys are lowercased here to match the normalized column data later
+JSON_ASSET_NAME_MAP = {
+    "u.s. gulf coast kerosene-type jet fuel spot price fob (dollars per gallon)": "Gulf Coast Jet Fuel",  # noqa E501
+    "u.s. gulf coast ultra-low sulfur no 2 diesel spot price (dollars per gallon)": "Gulf Coast No 2 Diesel",  # noqa E501
+    "u.s. gulf coast conventional gasoline regular spot price fob (dollars per gallon)": "Gulf Coast Regular Gasoline",  # noqa E501
+}
+
+REFINERY_NAME_MAP = {
+    "gulf coast (padd 3) refinery net production of distillate fuel oil (thousand barrels per day)": "Gulf Coast Distillate Fuel Oil",  # noqa E501
+    "u.s. refinery net production of other conventional motor gasoline (thousand barrels per day)": "U.S. Motor Gasoline (Other Conv.)",  # noqa E501
+    "gulf coast (padd 3) refinery net production of conventional motor gasoline (thousand barrels per day)": "Gulf Coast Motor Gasoline (Conv.)",  # noqa E501
+    "u.s. refinery net production of commercial kerosene-type jet fuel (thousand barrels per day)": "U.S. Jet Fuel",  # noqa E501
+    "gulf coast (padd 3) refinery net production of commercial kerosene-type jet fuel (thousand barrels per day)": "Gulf Coast Jet Fuel",  # noqa E501
+    "u.s. refinery net production of distillate fuel oil (thousand barrels per day)": "U.S. Distillate Fuel Oil",  # noqa E501
+}
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """
+    A long-format series frame shared by the dashboard sections.
+
+    `frame` is indexed by a DatetimeIndex named 'Date' and holds a
+    categorical 'Asset', a float32 value column and int16/int8 'Year' and
+    'Month' calendar fields. Rows are stored as one contiguous, date-sorted
+    block per asset; `offsets` maps each asset to its [start, stop) rows.
+    `version` is the content fingerprint of the source files it was parsed
+    from (see app.fingerprint).
+
+    The same instance is handed to every session, so its column buffers are
+    read-only. Filter or `.copy()` before modifying anything.
+    """
+
+    frame: pd.DataFrame
+    assets: tuple[str, ...]
+    value_col: str
+    version: str = ""
+    offsets: dict[str, tuple[int, int]] = field(default_factory=dict)
+
+    @property
+    def empty(self) -> bool:
+        return self.frame.empty
+
+    @property
+    def year_range(self) -> tuple[int, int]:
+        """(first, last) Year across all assets, read off the block edges."""
+        years = self.frame["Year"].to_numpy()
+        starts = [start for start, _ in self.offsets.values()]
+        stops = [stop - 1 for _, stop in self.offsets.values()]
+        return int(years[starts].min()), int(years[stops].max())
+
+    def select(self, assets, from_year: int, to_year: int) -> pd.DataFrame:
+        """
+        Rows for `assets` with from_year <= Year <= to_year, found by binary
+        search inside each asset block, so the cost scales with the rows
+        returned rather than the full history.
+        """
+        years = self.frame["Year"].to_numpy()
+        bounds = []
+        for asset in assets:
+            if asset not in self.offsets:
+                continue
+            start, stop = self.offsets[asset]
+            block = years[start:stop]
+            lo = start + int(np.searchsorted(block, from_year, side="left"))
+            hi = start + int(np.searchsorted(block, to_year, side="right"))
+            if lo < hi:
+                bounds.append((lo, hi))
+
+        if len(bounds) == 1:
+            lo, hi = bounds[0]
+            return self.frame.iloc[lo:hi]
+
+        rows = [np.arange(lo, hi) for lo, hi in bounds]
+        return self.frame.iloc[
+            np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+        ]
+
+
+# -----------------------------------------------------------------------------
+# Parsing
+# -----------------------------------------------------------------------------
+
+
+def clean_df(df: pd.DataFrame, commodity_name: str):
+    """
+    Clean up the Excel dataframe:
+    1. Convert 'Date' to datetime.
+    2. Rename the price column to a standard 'Price'.
+    3. Add a metadata column for the 'Asset'.
+    """
+    df["Date"] = pd.to_datetime(df["Date"])
+    # Rename the value column (index 1) to 'Price'
+    df.rename(columns={df.columns[1]: "Price"}, inplace=True)
+    df["Asset"] = commodity_name
+    return df
+
+
+def load_spot_prices_json(file_path: Path) -> pd.DataFrame:
+    """
+    Load and transform the EIA spot prices JSON data.
+    Expected JSON keys per record: 'period', 'value', 'series-description'
+    """
+    try:
+        with open(file_path, "r") as f:
+            data = json.load(f)
+
+        if not data:
+            return pd.DataFrame()
+
+        df = pd.DataFrame(data)
+
+        # 1. Normalize Columns
+        rename_map = {"period": "Date", "value": "Price"}
+        df.rename(columns=rename_map, inplace=True)
+
+        # 2. Determine Initial Asset Name
+        if "series-description" in df.columns:
+            df["Asset"] = df["series-description"]
+        elif "series" in df.columns:
+            df["Asset"] = df["series"]
+        else:
+            df["Asset"] = "Unknown Commodity"
+
+        # 3. Apply Name Mapping
+        # We create a temporary series of lowercased names to lookup in the map
+        mapped_assets = (
+            df["Asset"]
+            .astype(str)
+            .str.lower()
+            .str.strip()
+            .map(JSON_ASSET_NAME_MAP)
+        )
+        # We fill NaNs with the original (non-lowercased) names
+        df["Asset"] = mapped_assets.fillna(df["Asset"])
+
+        # 4. Type Conversion
+        df["Date"] = pd.to_datetime(df["Date"])
+        df["Price"] = pd.to_numeric(df["Price"], errors="coerce")
+
+        return df[["Date", "Price", "Asset"]]
+
+    except Exception as e:
+        st.warning(f"Error loading JSON data from {file_path.name}: {e}")
+        return pd.DataFrame()
+
+
+def load_refinery_json(file_path: Path) -> pd.DataFrame:
+    """
+    Load and transform the EIA refinery utilization JSON data.
+    """
+    try:
+        with open(file_path, "r") as f:
+            data = json.load(f)
+
+        if not data:
+            return pd.DataFrame()
+
+        df = pd.DataFrame(data)
+
+        # 1. Normalize Columns
+        # EIA API usually returns 'period' for date, 'value' for amount
+        rename_map = {"period": "Date", "value": "Production"}
+        df.rename(columns=rename_map, inplace=True)
+
+        # 2. Determine Asset Name (Series Description)
+        # Fallback to 'series' ID if description is missing
+        if "series-description" in df.columns:
+            df["Asset"] = df["series-description"]
+        elif "series" in df.columns:
+            df["Asset"] = df["series"]
+        else:
+            df["Asset"] = "Unknown Series"
+
+        # 3. Filter for 'Barrels per Day' ONLY
+        # We lowercase for consistent filtering, then filter
+        df = df[
+            df["Asset"]
+            .astype(str)
+            .str.lower()
+            .str.contains("thousand barrels per day")
+        ].copy()
+
+        # 4. Apply Name Mapping
+        mapped_assets = (
+            df["Asset"]
+            .astype(str)
+            .str.lower()
+            .str.strip()
+            .map(REFINERY_NAME_MAP)
+        )
+        # Fill NaNs with original name if mapping fails
+        df["Asset"] = mapped_assets.fillna(df["Asset"])
+
+        # 5. Type Conversion
+        df["Date"] = pd.to_datetime(df["Date"])
+        df["Production"] = pd.to_numeric(df["Production"], errors="coerce")
+
+        return df[["Date", "Production", "Asset"]]
+
+    except Exception as e:
+        st.warning(f"Error loading refinery JSON from {file_path.name}: {e}")
+        return pd.DataFrame()
+
+
+def load_commodity_excel(data_dir: Path) -> pd.DataFrame:
+    """Stack the legacy commodity_*_prices.xlsx downloads vertically."""
+    commodity_data = []
+
+    for child in sorted(os.listdir(data_dir)):
+        if child.endswith(".xlsx") and "commodity_" in child:
+            commodity_name = child.replace("commodity_", "").replace(
+                "_prices.xlsx", ""
+            )
+            file_path = data_dir / child
+
+            try:
+                df = pd.read_excel(file_path, skiprows=2, sheet_name="Data 1")
+                df = clean_df(df, commodity_name=commodity_name)
+
+                if not df.empty:
+                    commodity_data.append(df[["Date", "Price", "Asset"]])
+
+            except Exception as e:
+                st.warning(f"Could not process {child}: {e}")
+
+    if not commodity_data:
+        return pd.DataFrame()
+
+    return pd.concat(commodity_data, axis=0, ignore_index=True)
+
+
+# -----------------------------------------------------------------------------
+# Typed Frames
+# -----------------------------------------------------------------------------
+
+
+def _read_only(values: np.ndarray) -> np.ndarray:
+    """Lock a column buffer so in-place writes raise instead of leaking."""
+    values.flags.writeable = False
+    return values
+
+
+def to_dataset(
+    df: pd.DataFrame, value_col: str, version: str = ""
+) -> Dataset:
+    """
+    Convert a parsed (Date, value, Asset) frame into the compact shared
+    layout. Calendar fields are derived here once for every section.
+    """
+    if df.empty:
+        return Dataset(pd.DataFrame(), (), value_col, version)
+
+    # One contiguous, date-sorted block per asset
+    df = df.sort_values(by=["Asset", "Date"], kind="stable")
+    asset_names = df["Asset"].astype(str)
+    assets = tuple(sorted(asset_names.unique().tolist()))
+    dates = pd.DatetimeIndex(df["Date"], name="Date")
+
+    codes = pd.Categorical(asset_names, categories=assets).codes.copy()
+    block_edges = np.searchsorted(codes, np.arange(len(assets) + 1))
+    offsets = {
+        asset: (int(block_edges[i]), int(block_edges[i + 1]))
+        for i, asset in enumerate(assets)
+    }
+
+    frame = pd.DataFrame(
+        {
+            "Asset": pd.Categorical.from_codes(
+                _read_only(codes), categories=list(assets)
+            ),
+            value_col: _read_only(df[value_col].to_numpy(dtype="float32")),
+            "Year": _read_only(dates.year.to_numpy(dtype="int16")),
+            "Month": _read_only(dates.month.to_numpy(dtype="int8")),
+        },
+        index=dates,
+        copy=False,
+    )
+
+    return Dataset(frame, assets, value_col, version, offsets)
+
+
+def commodity_files() -> list[Path]:
+    """The files get_commodity_data reads: the JSON, else the Excel exports."""
+    if SPOT_PRICES_FILE.exists():
+        return [SPOT_PRICES_FILE]
+    return sorted(DATA_DIR.glob("commodity_*_prices.xlsx"))
+
+
+@timed()
+def get_commodity_data() -> Dataset:
+    """
+    Grab commodity data, reparsing only when the source files changed.
+    PRIORITY: Checks for 'spot_prices.json' first.
+    If JSON exists and is valid, returns THAT ONLY (ignoring Excel).
+    If JSON fails or is missing, falls back to Excel files.
+    """
+    if not DATA_DIR.exists():
+        st.error(f"Data directory not found at {DATA_DIR}")
+        return to_dataset(pd.DataFrame(), "Price")
+
+    return _load_commodity_data(data_version(*commodity_files()))
+
+
+@st.cache_resource(max_entries=1)
+def _load_commodity_data(version: str) -> Dataset:
+    # Imported here: app.shared_store depends on Dataset from this module
+    from app.shared_store import load_shared_dataset
+
+    return load_shared_dataset(
+        "commodity", version, lambda: _parse_commodity_data(version)
+    )
+
+
+def _parse_commodity_data(version: str) -> Dataset:
+    if SPOT_PRICES_FILE.exists():
+        json_df = load_spot_prices_json(SPOT_PRICES_FILE)
+        if not json_df.empty:
+            # We do NOT load Excel files to avoid duplicates.
+            return to_dataset(json_df, "Price", version)
+
+    return to_dataset(load_commodity_excel(DATA_DIR), "Price", version)
+
+
+@timed()
+def get_refinery_data() -> Dataset:
+    """
+    Grab refinery data from JSON, reparsing only when the file changed.
+    """
+    if not REFINERY_FILE.exists():
+        st.error(f"Refinery data not found at {REFINERY_FILE}")
+        return to_dataset(pd.DataFrame(), "Production")
+
+    return _load_refinery_data(data_version(REFINERY_FILE))
+
+
+@st.cache_resource(max_entries=1)
+def _load_refinery_data(version: str) -> Dataset:
+    from app.shared_store import load_shared_dataset
+
+    return load_shared_dataset(
+        "refinery",
+        version,
+        lambda: to_dataset(
+            load_refinery_json(REFINERY_FILE), "Production", version
+        ),
+    )
@@ -0,0 +1,91 @@
+import plotly.graph_objects as go
+
+from app.dataset import get_refinery_data
+from app.figure_cache import get_figure_cache
+from app.lead_lag import get_lead_lag
+from app.price_matrix import get_commodity_series
+from app.rolling_stats import get_rolling_stats
+from app.rollups import get_spot_rollups, rollups_version
+from app.sections import commodity, lead_lag, refinery, volatility
+
+# Each function returns the figure a new session first sees in that
+# dashboard section, through the shared figure cache so the section then
+# gets a hit. None when the section has no data.
+
+
+def commodity_figure() -> go.Figure | None:
+    dataset = get_commodity_series()
+    if dataset.empty:
+        return None
+    rollups = get_spot_rollups()
+    _, max_year = dataset.year_range
+    selected = list(dataset.assets[:1])
+    freq, agg = commodity.FREQ_OPTIONS[0], commodity.AGG_OPTIONS[0]
+
+    return get_figure_cache().get_or_build(
+        "commodity",
+        f"{dataset.version}:{rollups_version(rollups)}",
+        (tuple(selected), commodity.DEFAULT_FROM_YEAR, max_year, freq, agg),
+        lambda: commodity.build_commodity_figure(
+            dataset,
+            rollups,
+            selected,
+            commodity.DEFAULT_FROM_YEAR,
+            max_year,
+            freq,
+            agg,
+        ),
+    )
+
+
+def volatility_figure() -> go.Figure | None:
+    vol, _, version = get_rolling_stats()
+    if vol.empty:
+        return None
+    min_year, max_year = int(vol.index[0].year), int(vol.index[-1].year)
+    from_year = max(min_year, max_year - volatility.DEFAULT_YEARS_SHOWN)
+    metric = volatility.METRIC_OPTIONS[0]
+
+    return get_figure_cache().get_or_build(
+        "volatility",
+        version,
+        (metric, from_year, max_year),
+        lambda: volatility.build_rolling_stats_figure(
+            vol, metric, from_year, max_year
+        ),
+    )
+
+
+def refinery_figure() -> go.Figure | None:
+    dataset = get_refinery_data()
+    if dataset.empty:
+        return None
+    _, max_year = dataset.year_range
+    selected = list(
+        dataset.assets[
+            refinery.DEFAULT_ASSET_INDEX : refinery.DEFAULT_ASSET_INDEX + 1
+        ]
+    )
+
+    return get_figure_cache().get_or_build(
+        "refinery",
+        dataset.version,
+        (tuple(selected), refinery.DEFAULT_FROM_YEAR, max_year),
+        lambda: refinery.build_refinery_figure(
+            dataset, selected, refinery.DEFAULT_FROM_YEAR, max_year
+        ),
+    )
+
+
+def lead_lag_figure() -> go.Figure | None:
+    result, version = get_lead_lag()
+    if result.empty:
+        return None
+    series = result["Refinery Series"].iloc[0]
+
+    return get_figure_cache().get_or_build(
+        "lead_lag",
+        version,
+        series,
+        lambda: lead_lag.build_lead_lag_figure(result, series),
+    )
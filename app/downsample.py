@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+
+# Streamlit's centered layout renders charts ~704px wide; two points per
+# pixel is the most a line can show without overplotting.
+DEFAULT_CHART_WIDTH_PX = 704
+POINTS_PER_PIXEL = 2
+
+# Above this many points per figure the SVG renderer gets sluggish, so we
+# switch plotly to its WebGL (scattergl) traces.
+WEBGL_POINT_THRESHOLD = 2000
+
+
+def target_points(width_px: int = DEFAULT_CHART_WIDTH_PX) -> int:
+    """Number of points per series worth sending for a chart this wide."""
+    return max(3, int(width_px * POINTS_PER_PIXEL))
+
+
+def line_render_mode(n_points: int) -> str:
+    """Plotly Express render_mode for a figure with `n_points` points."""
+    return "webgl" if n_points > WEBGL_POINT_THRESHOLD else "svg"
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: picks `n_out` indices of (x, y) that
+    keep the visual shape of the line, including its peaks and troughs.
+    The first and last points are always kept.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = x.astype("float64")
+    y = y.astype("float64")
+
+    # Bucket edges for the n - 2 interior points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    # Mean of every bucket, used as the third triangle vertex
+    sums_x = np.add.reduceat(x[1 : n - 1], edges[:-1] - 1)
+    sums_y = np.add.reduceat(y[1 : n - 1], edges[:-1] - 1)
+    counts = np.diff(edges)
+    avg_x = np.append(sums_x / counts, x[-1])
+    avg_y = np.append(sums_y / counts, y[-1])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    prev = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        bucket_x = x[start:stop]
+        bucket_y = y[start:stop]
+        # Twice the triangle area; the constant factor does not matter
+        area = np.abs(
+            (x[prev] - avg_x[i + 1]) * (bucket_y - y[prev])
+            - (x[prev] - bucket_x) * (avg_y[i + 1] - y[prev])
+        )
+        prev = start + int(np.argmax(area))
+        selected[i + 1] = prev
+
+    return selected
+
+
+def downsample_long(
+    df: pd.DataFrame,
+    value_col: str,
+    n_out: int,
+    x_col: str = "Date",
+    group_col: str = "Asset",
+) -> pd.DataFrame:
+    """
+    Apply LTTB to every series of a long (Date, Asset, value) frame that has
+    more than `n_out` points. Shorter series are passed through untouched.
+    """
+    if df.empty or df.groupby(group_col, observed=True).size().max() <= n_out:
+        return df
+
+    parts = []
+    for _, series in df.groupby(group_col, observed=True, sort=False):
+        if len(series) <= n_out:
+            parts.append(series)
+            continue
+        series = series.dropna(subset=[value_col])
+        idx = lttb_indices(
+            series[x_col].to_numpy().astype("datetime64[ns]").astype("int64"),
+            series[value_col].to_numpy(),
+            n_out,
+        )
+        parts.append(series.iloc[idx])
+
+    return pd.concat(parts, ignore_index=True)
@@ -0,0 +1,340 @@
+"""
+Renders the default Dashboard and Analysis views to plain HTML under
+site/, so the public pages can be served by any static file host with no
+Python per request. The Streamlit app stays the place for custom views.
+Run as the last step of the update pipeline:
+
+    uv run python -m app.export_static
+"""
+
+import html
+import logging
+import os
+import re
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import plotly.graph_objects as go
+from plotly.offline import get_plotlyjs_version
+
+from app import default_views
+from app.lead_lag import get_lead_lag, peak_lags
+from app.sections.analysis.actuals import accuracy_scorecard
+from app.sections.analysis.report_renderer import (
+    JOHN_AVATAR,
+    load_all_reports,
+    load_report,
+)
+from app.sections.analysis.report_store import get_report_store
+from app.sections.llm_prediction import load_prediction
+from app.sections.news import get_article_details, load_data
+
+ROOT_DIR = Path(__file__).parents[1]
+SITE_DIR = ROOT_DIR / "site"
+
+# Dashboard sections in page order: (title, default figure)
+DASHBOARD_FIGURES = [
+    ("US Commodity Prices ($/Gallon)", default_views.commodity_figure),
+    ("Spot Price Volatility & Correlation", default_views.volatility_figure),
+    ("US Refinery Utilization Rates", default_views.refinery_figure),
+    ("Price & Refinery Lead/Lag", default_views.lead_lag_figure),
+]
+
+EIA_SOURCE = "Data Source: U.S. Energy Information Administration (EIA)"
+
+PAGE_STYLE = """
+body { font-family: "Source Sans Pro", sans-serif; max-width: 1100px;
+       margin: 0 auto; padding: 1rem 2rem; color: #31333f; }
+nav a { margin-right: 1.5rem; }
+h2 { border-bottom: 2px solid #d6d6d9; padding-bottom: .3rem; }
+.caption { color: #808495; font-size: .85rem; }
+.right { text-align: right; }
+.cards { display: flex; gap: 1rem; overflow-x: auto; }
+.card { flex: 0 0 31%; height: 300px; overflow-y: auto; padding: 1rem;
+        border: 1px solid #d6d6d9; border-radius: .5rem; }
+.badge { padding: .75rem 1rem; border-radius: .5rem; margin: .5rem 0; }
+.info { background: #e8f0fe; } .success { background: #e6f4ea; }
+.error { background: #fce8e6; }
+.metrics { display: flex; gap: 3rem; }
+.metric b { display: block; font-size: 2rem; }
+.avatar { width: 40px; vertical-align: middle; margin-right: .5rem; }
+table { border-collapse: collapse; }
+td, th { padding: .3rem .8rem; border-bottom: 1px solid #d6d6d9; }
+"""
+
+
+# -----------------------------------------------------------------------------
+# HTML Helpers
+# -----------------------------------------------------------------------------
+
+
+def _safe_url(url: str) -> bool:
+    """Only web links; LLM and scraped text could carry javascript: URLs."""
+    return urlsplit(html.unescape(url).strip()).scheme.lower() in (
+        "http",
+        "https",
+    )
+
+
+def _link(match: re.Match) -> str:
+    label, url = match.group(1), match.group(2)
+    # Anything but http(s) is shown as plain text
+    return f'<a href="{url}">{label}</a>' if _safe_url(url) else label
+
+
+def _inline_markdown(text: str) -> str:
+    text = html.escape(text)
+    text = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", text)
+    text = re.sub(r"\*(\S.*?)\*", r"<em>\1</em>", text)
+    return re.sub(r"\[([^\]]+)\]\(([^)\s]+)\)", _link, text)
+
+
+def markdown_html(text: str) -> str:
+    """
+    HTML for the markdown the prediction and reports use: '#' headings,
+    '*'/'-' bullets, bold, italics, links and blank-line paragraphs.
+    """
+    blocks, items = [], []
+
+    def close_list():
+        if items:
+            blocks.append("<ul>" + "".join(items) + "</ul>")
+            items.clear()
+
+    for line in (text or "").splitlines():
+        stripped = line.strip()
+        heading = re.match(r"(#{1,6})\s+(.*)", stripped)
+        bullet = re.match(r"[*-]\s+(.*)", stripped)
+        if bullet:
+            items.append(f"<li>{_inline_markdown(bullet.group(1))}</li>")
+            continue
+        close_list()
+        if heading:
+            level = min(len(heading.group(1)) + 1, 6)
+            blocks.append(
+                f"<h{level}>{_inline_markdown(heading.group(2))}</h{level}>"
+            )
+        elif stripped:
+            blocks.append(f"<p>{_inline_markdown(stripped)}</p>")
+    close_list()
+    return "\n".join(blocks)
+
+
+def figure_html(fig: go.Figure) -> str:
+    # plotly.js is loaded once per page from the CDN (see page())
+    return fig.to_html(
+        full_html=False,
+        include_plotlyjs=False,
+        config={"displaylogo": False},
+    )
+
+
+def page(title: str, body: str) -> str:
+    exported = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(title)}</title>
+<script src="https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"></script>
+<style>{PAGE_STYLE}</style>
+</head>
+<body>
+<nav><a href="index.html">Dashboard</a><a href="analysis.html">Analysis</a></nav>
+{body}
+<p class="caption right">Snapshot exported {exported}</p>
+</body>
+</html>
+"""  # noqa E501
+
+
+def _article_card(title, date, summary, link) -> str:
+    source = (
+        f'<a href="{html.escape(link)}">Read Source</a>'
+        if link and _safe_url(link)
+        else ""
+    )
+    return (
+        '<div class="card">'
+        f"<strong>{html.escape(title)}</strong>"
+        f'<p class="caption">📅 {html.escape(date)}</p>'
+        f"{markdown_html(summary)}{source}</div>"
+    )
+
+
+# -----------------------------------------------------------------------------
+# Pages
+# -----------------------------------------------------------------------------
+
+
+def render_dashboard() -> str:
+    parts = ["<h1>Dashboard</h1>"]
+
+    for title, build in DASHBOARD_FIGURES:
+        parts.append(f"<h2>{html.escape(title)}</h2>")
+        fig = build()
+        if fig is None:
+            parts.append("<p>No data available to display.</p>")
+            continue
+        parts.append(figure_html(fig))
+        if build is default_views.lead_lag_figure:
+            lead_lag, _ = get_lead_lag()
+            peaks = peak_lags(lead_lag)
+            series = lead_lag["Refinery Series"].iloc[0]
+            parts.append(
+                peaks[peaks["Refinery Series"] == series].to_html(
+                    index=False, float_format="%.2f", border=0
+                )
+            )
+        parts.append(f'<p class="caption right">{EIA_SOURCE}</p>')
+
+    parts.append("<h2>Jet Fuel Current Events and News</h2>")
+    cards = [_article_card(*get_article_details(a)) for a in load_data()]
+    parts.append(
+        f'<div class="cards">{"".join(cards)}</div>'
+        if cards
+        else "<p>No news articles available.</p>"
+    )
+    parts.append('<p class="caption right">Powered by Argus Media</p>')
+
+    parts.append("<h2>John the Eagle Market Analysis</h2>")
+    snapshot = load_prediction()
+    if snapshot:
+        parts.append(
+            f'<p class="caption">Last Analysis Run: '
+            f'{html.escape(snapshot.get("last_updated", "Unknown"))}</p>'
+            f'<h3><img class="avatar" src="{JOHN_AVATAR}" alt="">'
+            "Market Outlook</h3>"
+            f'{markdown_html(snapshot.get("prediction", ""))}'
+            f'<p class="caption">Analysis based on '
+            f'{snapshot.get("news_source_count", 0)} news sources and '
+            "recent EIA quantitative data.</p>"
+        )
+    else:
+        parts.append("<p>No prediction data found.</p>")
+    parts.append('<p class="caption right">Powered by Gemini</p>')
+
+    return page("Dashboard", "\n".join(parts))
+
+
+def render_report_body(report: dict) -> str:
+    """Static counterpart of report_renderer.render_report_body."""
+    predicted = html.escape(str(report.get("predicted", "❓")))
+    actual = report.get("actual")
+    if actual is None:
+        kind, shown = "info", "Pending"
+    else:
+        kind = "success" if report.get("predicted") == actual else "error"
+        shown = html.escape(str(actual))
+    parts = [
+        f'<div class="badge {kind}"><strong>Predicted:</strong> {predicted}'
+        f"  |  <strong>Actual:</strong> {shown}</div>"
+    ]
+
+    if report.get("commentary"):
+        parts.append(
+            f'<h3><img class="avatar" src="{JOHN_AVATAR}" alt="">'
+            "Analyst Commentary</h3>"
+            f'{markdown_html(report["commentary"])}'
+        )
+
+    articles = report.get("selected_articles", [])
+    if articles:
+        cards = [
+            _article_card(
+                a.get("title", "Untitled"),
+                a.get("date", ""),
+                a.get("analyst_note") or a.get("summary", ""),
+                a.get("link"),
+            )
+            for a in articles
+        ]
+        parts.append(
+            "<p><strong>Key Articles</strong></p>"
+            f'<div class="cards">{"".join(cards)}</div>'
+        )
+    return "\n".join(parts)
+
+
+def render_analysis() -> str:
+    current_week = get_report_store().current_week
+    parts = [
+        "<h1>Market Analysis</h1>",
+        f"<h2>Week {current_week} Analysis Report</h2>",
+    ]
+
+    report = load_report(current_week)
+    parts.append(
+        render_report_body(report)
+        if report
+        else f"<p>The analysis for Week {current_week} has not been "
+        "published yet. Please check back later.</p>"
+    )
+
+    parts.append("<h2>Historical Analysis Archive</h2>")
+    historical = [
+        r for r in load_all_reports() if r.get("week") != current_week
+    ]
+    if not historical:
+        parts.append("<p>No historical reports available yet.</p>")
+        return page("Market Analysis", "\n".join(parts))
+
+    scorecard = accuracy_scorecard(historical)
+    accuracy = scorecard["accuracy"]
+    parts.append(
+        '<div class="metrics">'
+        '<div class="metric">Prediction Accuracy<b>'
+        f'{f"{accuracy:.0%}" if accuracy is not None else "—"}</b></div>'
+        '<div class="metric">Correct Calls<b>'
+        f'{scorecard["correct"]} / {scorecard["resolved"]}</b></div>'
+        '<div class="metric">Pending Weeks<b>'
+        f'{scorecard["pending"]}</b></div></div>'
+    )
+    for report in historical:
+        parts.append(
+            f'<details><summary><strong>Week {report.get("week")}</strong> '
+            f'{html.escape(str(report.get("date_range", "")))}</summary>'
+            f"{render_report_body(report)}</details>"
+        )
+
+    return page("Market Analysis", "\n".join(parts))
+
+
+# -----------------------------------------------------------------------------
+# Export
+# -----------------------------------------------------------------------------
+
+
+def _write_atomic(path: Path, text: str):
+    """Replace `path` in one rename so the host never serves a torn file."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(text)
+    # mkstemp creates owner-only files; the host needs to read them
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, path)
+
+
+def export_site(site_dir: Path = SITE_DIR):
+    """Writes index.html, analysis.html and the avatar into `site_dir`."""
+    site_dir.mkdir(parents=True, exist_ok=True)
+    avatar = site_dir / JOHN_AVATAR
+    avatar.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(ROOT_DIR / JOHN_AVATAR, avatar)
+
+    _write_atomic(site_dir / "index.html", render_dashboard())
+    _write_atomic(site_dir / "analysis.html", render_analysis())
+    print(f"Exported static snapshot to {site_dir}")
+
+
+if __name__ == "__main__":
+    # The loaders are st.cache_* functions; outside `streamlit run` they
+    # use in-process caches and warn about the missing session
+    logging.getLogger(
+        "streamlit.runtime.scriptrunner_utils.script_run_context"
+    ).setLevel(logging.ERROR)
+    export_site()
@@ -0,0 +1,90 @@
+import json
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+import plotly.graph_objects as go
+import streamlit as st
+
+DEFAULT_MAX_FIGURES = 64
+
+
+class FigureCache:
+    """
+    Bounded LRU of serialized Plotly figures shared by every session.
+
+    Entries are keyed by (section, data version, filter parameters). When a
+    section is asked for a data version it has not seen before, all of that
+    section's entries for older versions are dropped.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_FIGURES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, str] = OrderedDict()
+        self._versions: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _invalidate_section(self, section: str, version: str):
+        """Drops `section` entries built from any other data version."""
+        if self._versions.get(section) == version:
+            return
+        self._versions[section] = version
+        for key in [k for k in self._entries if k[0] == section]:
+            del self._entries[key]
+
+    def get_or_build(
+        self,
+        section: str,
+        version: str,
+        params: Hashable,
+        build: Callable[[], go.Figure],
+    ) -> go.Figure:
+        """
+        The figure for `params`, built on a miss. A hit is not free: the
+        stored JSON spec is parsed into a new Figure on every call, which
+        is what lets each session change its copy.
+        """
+        key = (section, version, params)
+
+        with self._lock:
+            self._invalidate_section(section, version)
+            spec = self._entries.get(key)
+            if spec is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if spec is None:
+            spec = build().to_json()
+            with self._lock:
+                # A newer version may have invalidated the section while
+                # this one was building; don't bring the old one back
+                if self._versions.get(section) == version:
+                    self._entries[key] = spec
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+
+        # The spec was produced by a validated figure, so skip re-validation
+        return go.Figure(json.loads(spec), _validate=False)
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current occupancy."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+            }
+
+
+@st.cache_resource
+def get_figure_cache() -> FigureCache:
+    """The process-wide figure cache."""
+    return FigureCache()
@@ -0,0 +1,60 @@
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import NamedTuple
+
+
+class Fingerprint(NamedTuple):
+    mtime_ns: int
+    size: int
+    digest: str
+
+
+# path -> last seen fingerprint, so unchanged files are never re-hashed
+_FINGERPRINTS: dict[str, Fingerprint] = {}
+_LOCK = threading.Lock()
+
+
+def file_fingerprint(path: Path | str) -> Fingerprint | None:
+    """
+    Returns the (mtime, size, hash) fingerprint of a file, or None if it
+    does not exist. Only a stat() is paid per call; the file is re-hashed
+    when its mtime or size moves.
+    """
+    key = str(path)
+    try:
+        stat = os.stat(key)
+    except FileNotFoundError:
+        return None
+
+    cached = _FINGERPRINTS.get(key)
+    if cached and (cached.mtime_ns, cached.size) == (
+        stat.st_mtime_ns,
+        stat.st_size,
+    ):
+        return cached
+
+    with open(key, "rb") as f:
+        digest = hashlib.file_digest(f, "sha1").hexdigest()
+
+    fingerprint = Fingerprint(stat.st_mtime_ns, stat.st_size, digest)
+    with _LOCK:
+        _FINGERPRINTS[key] = fingerprint
+    return fingerprint
+
+
+def data_version(*paths: Path | str) -> str:
+    """
+    Combines the content hashes of `paths` into one short version string.
+
+    Loaders take this as their cache key: a rewritten file with new content
+    gets a new version, while a file that was only touched keeps its old
+    one and is not reparsed.
+    """
+    combined = hashlib.sha1()
+    for path in paths:
+        fingerprint = file_fingerprint(path)
+        combined.update(str(path).encode())
+        combined.update(fingerprint.digest.encode() if fingerprint else b"-")
+    return combined.hexdigest()[:16]
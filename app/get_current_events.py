@@ -6,6 +6,8 @@ import google.generativeai as genai
 import requests
 import streamlit as st
 
+from app.news_store import load_article_bodies, load_news_index
+
 # -----------------------------------------------------------------------------
 # Configuration
 # -----------------------------------------------------------------------------
@@ -95,14 +97,13 @@ def load_local_data(filename):
 
 
 def load_argus_articles():
-    """Loads Argus Media articles from cache, extracting llm_context."""
-    filepath = os.path.join(DATA_DIR, "argus_news_cache.json")
-    try:
-        with open(filepath, "r") as f:
-            data = json.load(f)
-            return [article["llm_context"] for article in data if "llm_context" in article]
-    except Exception:
-        return []
+    """Loads Argus Media article bodies (llm_context), newest first."""
+    bodies = load_article_bodies()
+    return [
+        bodies[entry["id"]]
+        for entry in load_news_index()
+        if entry["id"] in bodies
+    ]
 
 
 # -----------------------------------------------------------------------------
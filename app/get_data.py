@@ -5,6 +5,11 @@ import os
 import requests
 import streamlit as st
 
+from app.fingerprint import file_fingerprint
+from app.rolling_stats import refresh_rolling_stats
+from app.rollups import refresh_spot_rollups
+from app.seasonal import refresh_seasonal_cubes
+
 # Setup EIA API Key
 EIA_API_KEY = os.getenv("EIA_API_KEY") or st.secrets.get("EIA_API_KEY")
 
@@ -138,6 +143,13 @@ def get_latest_period(data):
     return max(record["period"] for record in data)
 
 
+def get_earliest_period(data):
+    """Helper to find the min date in a list of records."""
+    if not data:
+        return None
+    return min(record["period"] for record in data)
+
+
 if __name__ == "__main__":
     today = dt.date.today()
 
@@ -185,6 +197,28 @@ if __name__ == "__main__":
     new_spot_data = fetch_spot_price_data(start_date_spot, end_date_spot)
 
     if new_spot_data:
+        base_digest = file_fingerprint(spot_file)
         save_merged_data(new_spot_data, spot_file)
+
+        # -----------------------------------------------------------------
+        # 3. Materialize Weekly/Monthly Rollups
+        # -----------------------------------------------------------------
+        refresh_spot_rollups(
+            since=get_earliest_period(new_spot_data),
+            base_digest=base_digest.digest if base_digest else None,
+        )
+
+        # -----------------------------------------------------------------
+        # 4. Fold New Days into Rolling Volatility/Correlation
+        # -----------------------------------------------------------------
+        refresh_rolling_stats(
+            base_digest=base_digest.digest if base_digest else None,
+            since=get_earliest_period(new_spot_data),
+        )
     else:
         print("Spot price data is already up to date.")
+
+    # ---------------------------------------------------------
+    # 5. Rebuild Seasonal Overlay Cubes
+    # ---------------------------------------------------------
+    refresh_seasonal_cubes()
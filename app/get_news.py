@@ -1,5 +1,3 @@
-import json
-import os
 import time
 from datetime import datetime
 
@@ -11,10 +9,11 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 
+from app.news_store import NEWS_INDEX_FILE, load_news_records, save_news
+
 # -------------------------------------------------------------------------
 # CONSTANTS & CONFIGURATION
 # -------------------------------------------------------------------------
-CACHE_FILENAME = "data/argus_news_cache.json"
 START_URL = (
     "https://www.argusmedia.com/en/news-and-insights/latest-market-news"
     "?filters=%7B%22language%22%3A%22%27en-gb%27%22%2C%22commodity%22%3A"
@@ -59,18 +58,14 @@ def is_recent(date_obj):
 
 def save_to_cache(data):
     try:
-        with open(CACHE_FILENAME, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
-        print(f"✅ Saved {len(data)} articles to {CACHE_FILENAME}")
+        save_news(data)
+        print(f"✅ Saved {len(data)} articles to {NEWS_INDEX_FILE}")
     except Exception as e:
         print(f"❌ Error saving cache: {e}")
 
 
 def load_from_cache():
-    if os.path.exists(CACHE_FILENAME):
-        with open(CACHE_FILENAME, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return []
+    return load_news_records()
 
 
 # -------------------------------------------------------------------------
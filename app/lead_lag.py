@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from app.dataset import Dataset, get_commodity_data, get_refinery_data
+from app.price_matrix import get_price_matrix
+from app.timing import timed
+
+# Lags are in months; positive means prices lead refinery output
+MAX_LAG_MONTHS = 6
+
+# Refinery series are stamped on the first of the month
+MONTH_FREQ = "MS"
+
+
+# -----------------------------------------------------------------------------
+# Computation
+# -----------------------------------------------------------------------------
+
+
+def monthly_matrix(dataset: Dataset) -> pd.DataFrame:
+    """Pivot a monthly Dataset into a month x asset float64 matrix."""
+    values = dataset.frame[dataset.value_col]
+    columns = {
+        asset: values.iloc[start:stop]
+        for asset, (start, stop) in dataset.offsets.items()
+    }
+    return pd.DataFrame(columns).astype("float64").asfreq(MONTH_FREQ)
+
+
+def monthly_changes(wide: pd.DataFrame) -> pd.DataFrame:
+    """Month-over-month log changes of month-start stamped series."""
+    return np.log(wide).diff().iloc[1:]
+
+
+def align_monthly(prices: pd.DataFrame, refinery: pd.DataFrame):
+    """
+    Monthly average prices and refinery output as month-over-month changes,
+    restricted to the months where every series has a value.
+    """
+    price_months = prices.resample(MONTH_FREQ).mean()
+    combined = pd.concat(
+        [monthly_changes(price_months), monthly_changes(refinery)],
+        axis=1,
+        keys=["price", "refinery"],
+    ).dropna(how="any")
+    return combined["price"], combined["refinery"]
+
+
+def fft_cross_correlation(
+    x: np.ndarray, y: np.ndarray, max_lag: int
+) -> np.ndarray:
+    """
+    Cross-correlation of every column of `x` (n, p) with every column of
+    `y` (n, r) at lags -max_lag..max_lag, using one batched real FFT.
+
+    Returns an array of shape (2 * max_lag + 1, p, r) where entry
+    [max_lag + k, i, j] is corr(x[t, i], y[t + k, j]).
+    """
+    n = len(x)
+    x = (x - x.mean(axis=0)) / x.std(axis=0)
+    y = (y - y.mean(axis=0)) / y.std(axis=0)
+
+    nfft = 1 << (2 * n - 1).bit_length()
+    fx = np.fft.rfft(x, nfft, axis=0)
+    fy = np.fft.rfft(y, nfft, axis=0)
+    spectrum = np.conj(fx)[:, :, None] * fy[:, None, :]
+    cross = np.fft.irfft(spectrum, nfft, axis=0)
+
+    # Circular layout: lag k >= 0 at index k, lag -k at nfft - k
+    lags = np.arange(-max_lag, max_lag + 1)
+    return cross[lags % nfft] / n
+
+
+def compute_lead_lag(
+    prices: pd.DataFrame, refinery: pd.DataFrame, max_lag=MAX_LAG_MONTHS
+) -> pd.DataFrame:
+    """
+    Lagged correlations for all price x refinery pairs as a long frame with
+    'Price Asset', 'Refinery Series', 'Lag' and 'Correlation' columns.
+    """
+    price_changes, refinery_changes = align_monthly(prices, refinery)
+    if len(price_changes) <= 2 * max_lag:
+        return pd.DataFrame(
+            columns=["Price Asset", "Refinery Series", "Lag", "Correlation"]
+        )
+
+    correlations = fft_cross_correlation(
+        price_changes.to_numpy(dtype="float64"),
+        refinery_changes.to_numpy(dtype="float64"),
+        max_lag,
+    )
+    index = pd.MultiIndex.from_product(
+        [
+            range(-max_lag, max_lag + 1),
+            price_changes.columns,
+            refinery_changes.columns,
+        ],
+        names=["Lag", "Price Asset", "Refinery Series"],
+    )
+    result = pd.Series(correlations.ravel(), index=index, name="Correlation")
+    return result.reset_index()[
+        ["Price Asset", "Refinery Series", "Lag", "Correlation"]
+    ]
+
+
+def peak_lags(lead_lag: pd.DataFrame) -> pd.DataFrame:
+    """The lag with the strongest (absolute) correlation for every pair."""
+    strongest = lead_lag.loc[
+        lead_lag["Correlation"]
+        .abs()
+        .groupby([lead_lag["Price Asset"], lead_lag["Refinery Series"]])
+        .idxmax()
+    ]
+    return strongest.reset_index(drop=True)
+
+
+# -----------------------------------------------------------------------------
+# Dashboard Access
+# -----------------------------------------------------------------------------
+
+
+@timed()
+def get_lead_lag() -> tuple[pd.DataFrame, str]:
+    """(lagged correlations, version) for the current price/refinery data."""
+    prices = get_price_matrix()
+    refinery = get_refinery_data()
+    version = f"{get_commodity_data().version}:{refinery.version}"
+    return _compute_lead_lag(version, prices, refinery), version
+
+
+@st.cache_resource(max_entries=1)
+def _compute_lead_lag(
+    version: str, _prices: pd.DataFrame, _refinery: Dataset
+) -> pd.DataFrame:
+    if _prices.empty or _refinery.empty:
+        return pd.DataFrame(
+            columns=["Price Asset", "Refinery Series", "Lag", "Correlation"]
+        )
+    return compute_lead_lag(_prices, monthly_matrix(_refinery))
@@ -0,0 +1,100 @@
+import gzip
+import hashlib
+import json
+import re
+from pathlib import Path
+
+DATA_DIR = Path(__file__).parents[1] / "data"
+
+# Small display-card index the dashboard reads, and the gzip-compressed
+# article bodies (llm_context) only the prediction stage needs
+NEWS_INDEX_FILE = DATA_DIR / "argus_news_index.json"
+NEWS_BODIES_FILE = DATA_DIR / "argus_news_bodies.json.gz"
+
+# Single-file cache written by older versions of the scraper
+LEGACY_CACHE_FILE = DATA_DIR / "argus_news_cache.json"
+
+# Argus article URLs look like .../latest-market-news/2799187-some-slug
+ARGUS_ID_PATTERN = re.compile(r"/(\d+)-[^/]*$")
+
+
+def article_id(link: str) -> str:
+    """Stable id for an article: the Argus id, else a hash of the link."""
+    match = ARGUS_ID_PATTERN.search(link or "")
+    if match:
+        return match.group(1)
+    return hashlib.sha1((link or "").encode("utf-8")).hexdigest()[:12]
+
+
+def save_news(records: list[dict]):
+    """
+    Splits scraped records ({"display_card", "llm_context"}) into the card
+    index and the compressed body store, both keyed by article id.
+    """
+    index, bodies = [], {}
+    for record in records:
+        card = record["display_card"]
+        key = article_id(card.get("link"))
+        index.append({"id": key, "display_card": card})
+        if "llm_context" in record:
+            bodies[key] = record["llm_context"]
+
+    with open(NEWS_INDEX_FILE, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=4)
+
+    # mtime=0 keeps the archive byte-identical when the content is
+    with open(NEWS_BODIES_FILE, "wb") as raw:
+        with gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as f:
+            f.write(json.dumps(bodies, ensure_ascii=False).encode("utf-8"))
+
+
+def load_news_index() -> list[dict]:
+    """Display cards, newest first, as written by the scraper."""
+    try:
+        with open(NEWS_INDEX_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (IOError, json.JSONDecodeError):
+        return []
+
+
+def load_article_bodies(ids=None) -> dict[str, dict]:
+    """llm_context per article id, optionally restricted to `ids`."""
+    try:
+        with gzip.open(NEWS_BODIES_FILE, "rt", encoding="utf-8") as f:
+            bodies = json.load(f)
+    except (IOError, json.JSONDecodeError):
+        return {}
+
+    if ids is None:
+        return bodies
+    return {key: bodies[key] for key in ids if key in bodies}
+
+
+def load_news_records() -> list[dict]:
+    """Index and bodies joined back into full scraper records."""
+    bodies = load_article_bodies()
+    records = []
+    for entry in load_news_index():
+        record = {"display_card": entry["display_card"]}
+        if entry["id"] in bodies:
+            record["llm_context"] = bodies[entry["id"]]
+        records.append(record)
+    return records
+
+
+def migrate_legacy_cache():
+    """Converts data/argus_news_cache.json into the split store."""
+    if not LEGACY_CACHE_FILE.exists():
+        print(f"No legacy cache at {LEGACY_CACHE_FILE}")
+        return
+
+    with open(LEGACY_CACHE_FILE, "r", encoding="utf-8") as f:
+        records = json.load(f)
+
+    save_news(records)
+    LEGACY_CACHE_FILE.unlink()
+    print(f"Migrated {len(records)} articles out of {LEGACY_CACHE_FILE}")
+
+
+if __name__ == "__main__":
+    migrate_legacy_cache()
@@ -0,0 +1,130 @@
+import pandas as pd
+import streamlit as st
+
+from app.dataset import Dataset, get_commodity_data, to_dataset
+from app.timing import timed
+
+JET_FUEL = "Gulf Coast Jet Fuel"
+DIESEL = "Gulf Coast No 2 Diesel"
+GASOLINE = "Gulf Coast Regular Gasoline"
+
+# Derived series name -> (minuend/numerator, subtrahend/denominator)
+SPREADS = {
+    "Jet Fuel − Diesel Spread": (JET_FUEL, DIESEL),
+    "Jet Fuel − Gasoline Spread": (JET_FUEL, GASOLINE),
+}
+RATIOS = {
+    "Jet Fuel / Diesel Ratio": (JET_FUEL, DIESEL),
+    "Jet Fuel / Gasoline Ratio": (JET_FUEL, GASOLINE),
+}
+
+# EIA publishes no spot quotes on market holidays. A missing business day
+# carries the previous quote forward for at most this many days; longer
+# gaps are real outages and stay NaN.
+HOLIDAY_FILL_LIMIT = 3
+
+
+# -----------------------------------------------------------------------------
+# Computation
+# -----------------------------------------------------------------------------
+
+
+def build_wide_matrix(
+    dataset: Dataset, fill_limit: int = HOLIDAY_FILL_LIMIT
+) -> pd.DataFrame:
+    """
+    Pivot a long Dataset into a business-day x asset float64 matrix.
+
+    Every asset is aligned on one business-day calendar spanning the whole
+    history. Holidays are forward-filled up to `fill_limit` days, and
+    leading days before an asset's first quote stay NaN.
+    """
+    if dataset.empty:
+        return pd.DataFrame()
+
+    values = dataset.frame[dataset.value_col]
+    columns = {
+        asset: values.iloc[start:stop]
+        for asset, (start, stop) in dataset.offsets.items()
+    }
+    wide = pd.DataFrame(columns).astype("float64")
+
+    calendar = pd.bdate_range(wide.index.min(), wide.index.max(), name="Date")
+    wide = wide.reindex(wide.index.union(calendar))
+    wide = wide.ffill(limit=fill_limit).reindex(calendar)
+    wide.columns.name = "Asset"
+    return wide
+
+
+def compute_spreads(wide: pd.DataFrame) -> pd.DataFrame:
+    """Vectorized spread and ratio columns over an aligned price matrix."""
+    derived = {}
+    for name, (left, right) in SPREADS.items():
+        if left in wide and right in wide:
+            derived[name] = wide[left] - wide[right]
+    for name, (left, right) in RATIOS.items():
+        if left in wide and right in wide:
+            derived[name] = wide[left] / wide[right]
+    return pd.DataFrame(derived, index=wide.index)
+
+
+def wide_to_long(wide: pd.DataFrame, value_col: str) -> pd.DataFrame:
+    """Back to the (Date, value, Asset) shape parsed loaders produce."""
+    long_df = wide.stack(future_stack=True).dropna()
+    long_df = long_df.rename(value_col).reset_index()
+    long_df.columns = ["Date", "Asset", value_col]
+    return long_df[["Date", value_col, "Asset"]]
+
+
+# -----------------------------------------------------------------------------
+# Dashboard Access
+# -----------------------------------------------------------------------------
+
+
+def get_price_matrix() -> pd.DataFrame:
+    """The aligned spot price matrix for the current data version."""
+    dataset = get_commodity_data()
+    return _build_price_matrix(dataset.version, dataset)
+
+
+@st.cache_resource(max_entries=1)
+def _build_price_matrix(version: str, _dataset: Dataset) -> pd.DataFrame:
+    return build_wide_matrix(_dataset)
+
+
+@timed()
+def get_commodity_series() -> Dataset:
+    """
+    Spot prices plus the derived spread and ratio series as one Dataset, so
+    the commodity section can offer them as regular assets.
+    """
+    dataset = get_commodity_data()
+    return _load_commodity_series(dataset.version, dataset)
+
+
+@st.cache_resource(max_entries=1)
+def _load_commodity_series(version: str, _dataset: Dataset) -> Dataset:
+    # Imported here, like app.dataset: app.shared_store imports Dataset
+    from app.shared_store import load_shared_dataset
+
+    if _dataset.empty:
+        return _dataset
+
+    # Published like the raw datasets, so workers map one shared copy
+    return load_shared_dataset(
+        "commodity_series",
+        version,
+        lambda: _build_commodity_series(version, _dataset),
+    )
+
+
+def _build_commodity_series(version: str, dataset: Dataset) -> Dataset:
+    derived = compute_spreads(_build_price_matrix(version, dataset))
+    combined = pd.concat(
+        [
+            dataset.frame.reset_index()[["Date", "Price", "Asset"]],
+            wide_to_long(derived, "Price"),
+        ],
+        ignore_index=True,
+    )
+    return to_dataset(combined, "Price", version)
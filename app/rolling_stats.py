@@ -0,0 +1,399 @@
+import json
+from collections import deque
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from numpy.lib.stride_tricks import sliding_window_view
+
+from app.dataset import (
+    DATA_DIR,
+    SPOT_PRICES_FILE,
+    load_spot_prices_json,
+    to_dataset,
+)
+from app.fingerprint import data_version, file_fingerprint
+from app.price_matrix import (
+    DIESEL,
+    GASOLINE,
+    JET_FUEL,
+    build_wide_matrix,
+    get_price_matrix,
+)
+from app.timing import timed
+
+ROLLING_STATS_FILE = DATA_DIR / "spot_rolling_stats.json"
+
+PRICE_ASSETS = (JET_FUEL, DIESEL, GASOLINE)
+CORRELATION_PAIRS = {
+    "Jet Fuel ↔ Diesel": (JET_FUEL, DIESEL),
+    "Jet Fuel ↔ Gasoline": (JET_FUEL, GASOLINE),
+    "Diesel ↔ Gasoline": (DIESEL, GASOLINE),
+}
+
+# Trading days per window and per year (for annualizing volatility)
+VOL_WINDOW = 20
+CORR_WINDOW = 60
+TRADING_DAYS = 252
+
+
+# -----------------------------------------------------------------------------
+# Computation
+# -----------------------------------------------------------------------------
+
+
+def log_returns(wide: pd.DataFrame) -> pd.DataFrame:
+    """Daily log returns of the price assets, on days all of them quoted."""
+    prices = wide[[asset for asset in PRICE_ASSETS if asset in wide]]
+    return np.log(prices).diff().dropna(how="any")
+
+
+def windowed_comoments(returns: np.ndarray, window: int):
+    """
+    Cold path: mean vector and co-moment matrix (sum of centered outer
+    products) of every trailing window, computed for all windows at once
+    with a two-pass (centered) formula.
+
+    Returns (means, comoments) of shapes (m, k) and (m, k, k) where
+    m = len(returns) - window + 1 and row j covers returns[j : j + window].
+    """
+    views = sliding_window_view(returns, window, axis=0)  # (m, k, window)
+    means = views.mean(axis=2)
+    centered = views - means[..., None]
+    comoments = np.einsum("mkw,mjw->mkj", centered, centered)
+    return means, comoments
+
+
+class RollingComoments:
+    """
+    Welford-style sliding-window mean and co-moment matrix.
+
+    push() folds in one return vector and, once the window is full, removes
+    the oldest one with the inverse update, so every new day costs O(k^2)
+    regardless of history length.
+    """
+
+    def __init__(self, window, n_assets, returns=(), mean=None, comoment=None):
+        self.window = window
+        self.returns = deque((np.asarray(r, "float64") for r in returns))
+        self.mean = (
+            np.asarray(mean, "float64")
+            if mean is not None
+            else np.zeros(n_assets)
+        )
+        self.comoment = (
+            np.asarray(comoment, "float64")
+            if comoment is not None
+            else np.zeros((n_assets, n_assets))
+        )
+
+    def push(self, x: np.ndarray):
+        x = np.asarray(x, "float64")
+        self.returns.append(x)
+        n = len(self.returns)
+        delta = x - self.mean
+        self.mean = self.mean + delta / n
+        self.comoment = self.comoment + np.outer(delta, x - self.mean)
+
+        if n > self.window:
+            oldest = self.returns.popleft()
+            n -= 1
+            delta = oldest - self.mean
+            self.mean = self.mean - delta / n
+            self.comoment = self.comoment - np.outer(delta, oldest - self.mean)
+
+    @property
+    def full(self) -> bool:
+        return len(self.returns) == self.window
+
+    def to_state(self) -> dict:
+        return {
+            "window": self.window,
+            "returns": [r.tolist() for r in self.returns],
+            "mean": self.mean.tolist(),
+            "comoment": self.comoment.tolist(),
+        }
+
+    @classmethod
+    def from_state(cls, state: dict, n_assets: int):
+        return cls(
+            state["window"],
+            n_assets,
+            state["returns"],
+            state["mean"],
+            state["comoment"],
+        )
+
+
+def volatility_from_comoments(comoments: np.ndarray, window: int):
+    """Annualized realized volatility from (..., k, k) co-moments."""
+    variance = np.diagonal(comoments, axis1=-2, axis2=-1) / (window - 1)
+    return np.sqrt(np.clip(variance, 0, None) * TRADING_DAYS)
+
+
+def correlation_from_comoments(comoments: np.ndarray, assets) -> np.ndarray:
+    """Pairwise correlations, one column per CORRELATION_PAIRS entry."""
+    position = {asset: i for i, asset in enumerate(assets)}
+    columns = []
+    for left, right in CORRELATION_PAIRS.values():
+        i, j = position[left], position[right]
+        denominator = np.sqrt(comoments[..., i, i] * comoments[..., j, j])
+        with np.errstate(invalid="ignore", divide="ignore"):
+            columns.append(comoments[..., i, j] / denominator)
+    return np.stack(columns, axis=-1)
+
+
+def compute_rolling_stats(returns: pd.DataFrame):
+    """
+    Cold computation over the full return history.
+
+    Returns (volatility, correlation, states): two Date-indexed frames and
+    the end-of-history RollingComoments for each window, ready for
+    incremental updates.
+    """
+    values = returns.to_numpy(dtype="float64")
+    assets = list(returns.columns)
+    n = len(values)
+
+    volatility = np.full((n, len(assets)), np.nan)
+    correlation = np.full((n, len(CORRELATION_PAIRS)), np.nan)
+    states = {}
+
+    for window in {VOL_WINDOW, CORR_WINDOW}:
+        if n < window:
+            states[window] = RollingComoments(window, len(assets))
+            for x in values:
+                states[window].push(x)
+            continue
+        means, comoments = windowed_comoments(values, window)
+        if window == VOL_WINDOW:
+            volatility[window - 1 :] = volatility_from_comoments(
+                comoments, window
+            )
+        if window == CORR_WINDOW:
+            correlation[window - 1 :] = correlation_from_comoments(
+                comoments, assets
+            )
+        states[window] = RollingComoments(
+            window, len(assets), values[-window:], means[-1], comoments[-1]
+        )
+
+    return (
+        pd.DataFrame(volatility, index=returns.index, columns=assets),
+        pd.DataFrame(
+            correlation, index=returns.index, columns=list(CORRELATION_PAIRS)
+        ),
+        states,
+    )
+
+
+def fold_in_returns(volatility, correlation, states, new_returns):
+    """
+    Incremental path: push each new day through the window states and
+    append its volatility/correlation rows. Older rows are untouched.
+    """
+    assets = list(new_returns.columns)
+    vol_rows, corr_rows = [], []
+
+    for x in new_returns.to_numpy(dtype="float64"):
+        for state in states.values():
+            state.push(x)
+
+        vol_state, corr_state = states[VOL_WINDOW], states[CORR_WINDOW]
+        vol_rows.append(
+            volatility_from_comoments(vol_state.comoment, VOL_WINDOW)
+            if vol_state.full
+            else np.full(len(assets), np.nan)
+        )
+        corr_rows.append(
+            correlation_from_comoments(corr_state.comoment, assets)
+            if corr_state.full
+            else np.full(len(CORRELATION_PAIRS), np.nan)
+        )
+
+    new_vol = pd.DataFrame(
+        vol_rows, index=new_returns.index, columns=volatility.columns
+    )
+    new_corr = pd.DataFrame(
+        corr_rows, index=new_returns.index, columns=correlation.columns
+    )
+    return (
+        pd.concat([volatility, new_vol]),
+        pd.concat([correlation, new_corr]),
+    )
+
+
+# -----------------------------------------------------------------------------
+# Storage
+# -----------------------------------------------------------------------------
+
+
+def _frame_to_columns(df: pd.DataFrame) -> dict:
+    return {
+        column: [
+            None if np.isnan(v) else round(float(v), 6) for v in df[column]
+        ]
+        for column in df.columns
+    }
+
+
+def write_rolling_stats_file(
+    volatility,
+    correlation,
+    states,
+    last_prices: dict,
+    source_digest: str,
+    filename=ROLLING_STATS_FILE,
+):
+    """Persists the history and window states next to the raw series."""
+    payload = {
+        "source_digest": source_digest,
+        "last_date": volatility.index[-1].strftime("%Y-%m-%d"),
+        "last_prices": last_prices,
+        "states": {str(w): s.to_state() for w, s in states.items()},
+        "dates": [d.strftime("%Y-%m-%d") for d in volatility.index],
+        "volatility": _frame_to_columns(volatility),
+        "correlation": _frame_to_columns(correlation),
+    }
+
+    try:
+        with open(filename, "w") as f:
+            json.dump(payload, f, indent=4)
+        print(f"Successfully saved {len(volatility)} rolling stats rows")
+    except IOError as e:
+        print(f"Error saving rolling stats to {filename}: {e}")
+
+
+def read_rolling_stats_file(filename=ROLLING_STATS_FILE) -> dict | None:
+    """Returns the raw payload, with the history parsed into frames."""
+    try:
+        with open(filename, "r") as f:
+            payload = json.load(f)
+    except (IOError, json.JSONDecodeError):
+        return None
+
+    index = pd.DatetimeIndex(pd.to_datetime(payload["dates"]), name="Date")
+    for key in ("volatility", "correlation"):
+        payload[key] = pd.DataFrame(
+            payload[key], index=index, dtype="float64"
+        )
+    return payload
+
+
+def resumable_state(stored, wide, returns, base_digest, since=None):
+    """
+    True when `stored` can be extended by folding in the days after its
+    last date: it was built from the pre-merge file (`base_digest`), and the
+    merge changed no price it depends on.
+
+    The window states hold the returns of the last CORR_WINDOW days, so
+    the check covers that span: the last day's prices must match, and so
+    must every return still in a window. A merge that revised days from
+    `since` onward is only resumable when `since` falls inside that span;
+    without `since`, revisions older than the span go unnoticed.
+    """
+    if not stored or stored["source_digest"] != base_digest:
+        return False
+    last_date = pd.Timestamp(stored["last_date"])
+    if last_date not in wide.index:
+        return False
+
+    stored_prices = [
+        stored["last_prices"].get(asset, np.nan) for asset in returns.columns
+    ]
+    current = wide.loc[last_date, list(returns.columns)]
+    if not np.allclose(stored_prices, current.to_numpy(dtype="float64")):
+        return False
+
+    held = returns[returns.index <= last_date].to_numpy(dtype="float64")
+    for state in stored["states"].values():
+        window = np.asarray(state["returns"], dtype="float64")
+        if not len(window):
+            continue
+        if len(held) < len(window) or not np.allclose(
+            window, held[-len(window) :]
+        ):
+            return False
+
+    if since is not None:
+        longest = max(len(s["returns"]) for s in stored["states"].values())
+        held_dates = returns.index[returns.index <= last_date]
+        if longest == 0 or pd.Timestamp(since) < held_dates[-longest]:
+            return False
+    return True
+
+
+def refresh_rolling_stats(base_digest=None, since=None):
+    """
+    Bring data/spot_rolling_stats.json in line with data/spot_prices.json.
+
+    `base_digest` is the spot file's digest before the latest merge and
+    `since` the earliest day the merge wrote. When resumable_state() finds
+    the stored windows untouched, only the days after the stored history
+    are folded in; otherwise the history is recomputed cold.
+    """
+    source = file_fingerprint(SPOT_PRICES_FILE)
+    wide = build_wide_matrix(
+        to_dataset(load_spot_prices_json(SPOT_PRICES_FILE), "Price")
+    )
+    if source is None or wide.empty:
+        print("No spot price data for rolling stats.")
+        return
+
+    returns = log_returns(wide)
+    stored = read_rolling_stats_file()
+    resumable = resumable_state(stored, wide, returns, base_digest, since)
+
+    if resumable:
+        last_date = pd.Timestamp(stored["last_date"])
+        new_returns = returns[returns.index > last_date]
+        print(f"Folding {len(new_returns)} new days into rolling stats")
+        states = {
+            int(w): RollingComoments.from_state(s, len(returns.columns))
+            for w, s in stored["states"].items()
+        }
+        volatility, correlation = fold_in_returns(
+            stored["volatility"], stored["correlation"], states, new_returns
+        )
+    else:
+        print("Recomputing rolling stats from full history")
+        volatility, correlation, states = compute_rolling_stats(returns)
+
+    last_prices = {
+        asset: float(wide.loc[volatility.index[-1], asset])
+        for asset in returns.columns
+    }
+    write_rolling_stats_file(
+        volatility, correlation, states, last_prices, source.digest
+    )
+
+
+# -----------------------------------------------------------------------------
+# Dashboard Access
+# -----------------------------------------------------------------------------
+
+
+@timed()
+def get_rolling_stats() -> tuple[pd.DataFrame, pd.DataFrame, str]:
+    """
+    (volatility, correlation, version) for the dashboard. Uses the stored
+    history when it matches the current spot prices, otherwise computes it
+    cold from the price matrix.
+    """
+    version = data_version(ROLLING_STATS_FILE, SPOT_PRICES_FILE)
+    volatility, correlation = _load_rolling_stats(version)
+    return volatility, correlation, version
+
+
+@st.cache_resource(max_entries=1)
+def _load_rolling_stats(version: str):
+    source = file_fingerprint(SPOT_PRICES_FILE)
+    stored = read_rolling_stats_file()
+    if stored and source and stored["source_digest"] == source.digest:
+        return stored["volatility"], stored["correlation"]
+
+    wide = get_price_matrix()
+    if wide.empty:
+        return pd.DataFrame(), pd.DataFrame()
+    volatility, correlation, _ = compute_rolling_stats(log_returns(wide))
+    return volatility, correlation
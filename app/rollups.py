@@ -0,0 +1,189 @@
+import json
+
+import pandas as pd
+import streamlit as st
+
+from app.analytics import BUCKET_PERIODS
+from app.dataset import (
+    DATA_DIR,
+    SPOT_PRICES_FILE,
+    Dataset,
+    load_spot_prices_json,
+    to_dataset,
+)
+from app.fingerprint import data_version, file_fingerprint
+from app.timing import timed
+
+ROLLUPS_FILE = DATA_DIR / "spot_rollups.json"
+
+# UI text -> pandas offset alias / aggregation, as used in app/analytics.py
+ROLLUP_FREQS = {"Weekly": "W", "Monthly": "ME"}
+ROLLUP_AGGS = {"Average Price": "mean", "Close Price": "last"}
+
+
+# -----------------------------------------------------------------------------
+# Computation
+# -----------------------------------------------------------------------------
+
+
+def compute_rollups(spot_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Resample a parsed (Date, Price, Asset) spot frame into every
+    frequency x aggregation combination. Returns one long frame with
+    'freq', 'agg', 'Asset', 'Date' (bucket label) and 'Price' columns.
+    """
+    if spot_df.empty:
+        return pd.DataFrame(columns=["freq", "agg", "Asset", "Date", "Price"])
+
+    series = spot_df.set_index("Date").groupby("Asset")["Price"]
+    views = []
+    for freq in ROLLUP_FREQS.values():
+        resampled = series.resample(freq)
+        for agg in ROLLUP_AGGS.values():
+            view = resampled.agg(agg).dropna().reset_index()
+            view.insert(0, "agg", agg)
+            view.insert(0, "freq", freq)
+            views.append(view)
+
+    return pd.concat(views, ignore_index=True)
+
+
+def bucket_start(freq: str, since) -> pd.Timestamp:
+    """First day of the week/month bucket that `since` falls into."""
+    return pd.Timestamp(since).to_period(BUCKET_PERIODS[freq]).start_time
+
+
+def update_rollups(
+    existing: pd.DataFrame, spot_df: pd.DataFrame, since
+) -> pd.DataFrame:
+    """
+    Incrementally maintain `existing` rollups after new days arrived.
+
+    Buckets that end before the one containing `since` are final and kept
+    as-is; only the trailing (partial) buckets are recomputed from the raw
+    rows that fall inside them.
+    """
+    kept, fresh = [], []
+    for freq in ROLLUP_FREQS.values():
+        start = bucket_start(freq, since)
+        kept.append(
+            existing[(existing["freq"] == freq) & (existing["Date"] < start)]
+        )
+        tail = compute_rollups(spot_df[spot_df["Date"] >= start])
+        fresh.append(tail[tail["freq"] == freq])
+
+    merged = pd.concat(kept + fresh, ignore_index=True)
+    return merged.sort_values(by=["freq", "agg", "Asset", "Date"])
+
+
+# -----------------------------------------------------------------------------
+# Storage
+# -----------------------------------------------------------------------------
+
+
+def read_rollups_file(
+    filename=ROLLUPS_FILE,
+) -> tuple[str | None, pd.DataFrame]:
+    """Returns (source digest, rollups frame) from the materialized file."""
+    try:
+        with open(filename, "r") as f:
+            payload = json.load(f)
+    except (IOError, json.JSONDecodeError):
+        return None, pd.DataFrame()
+
+    rollups = pd.DataFrame(payload.get("rollups", []))
+    if rollups.empty:
+        return payload.get("source_digest"), rollups
+
+    rollups = rollups.rename(
+        columns={"asset": "Asset", "period": "Date", "value": "Price"}
+    )
+    rollups["Date"] = pd.to_datetime(rollups["Date"])
+    return payload.get("source_digest"), rollups
+
+
+def write_rollups_file(
+    rollups: pd.DataFrame, source_digest: str, filename=ROLLUPS_FILE
+):
+    """Persists rollups next to the raw series they were computed from."""
+    records = [
+        {
+            "freq": row.freq,
+            "agg": row.agg,
+            "asset": row.Asset,
+            "period": row.Date.strftime("%Y-%m-%d"),
+            "value": round(float(row.Price), 4),
+        }
+        for row in rollups.itertuples(index=False)
+    ]
+    payload = {"source_digest": source_digest, "rollups": records}
+
+    try:
+        with open(filename, "w") as f:
+            json.dump(payload, f, indent=4)
+        print(f"Successfully saved {len(records)} rollups to {filename}")
+    except IOError as e:
+        print(f"Error saving rollups to {filename}: {e}")
+
+
+def refresh_spot_rollups(since=None, base_digest=None):
+    """
+    Bring data/spot_rollups.json in line with data/spot_prices.json.
+
+    `base_digest` is the spot file's digest before the latest merge. If the
+    stored rollups were built from exactly that file, only the buckets from
+    `since` onward are recomputed; otherwise everything is rebuilt.
+    """
+    spot_df = load_spot_prices_json(SPOT_PRICES_FILE)
+    source = file_fingerprint(SPOT_PRICES_FILE)
+    if spot_df.empty or source is None:
+        print("No spot price data to roll up.")
+        return
+
+    stored_digest, existing = read_rollups_file()
+
+    if since and not existing.empty and stored_digest == base_digest:
+        print(f"Updating rollups from {since}")
+        rollups = update_rollups(existing, spot_df, since)
+    else:
+        print("Rebuilding all rollups")
+        rollups = compute_rollups(spot_df)
+
+    write_rollups_file(rollups, source.digest)
+
+
+# -----------------------------------------------------------------------------
+# Dashboard Access
+# -----------------------------------------------------------------------------
+
+
+@timed()
+def get_spot_rollups() -> dict[tuple[str, str], Dataset]:
+    """
+    Materialized views keyed by UI labels, e.g. ("Weekly", "Close Price").
+    Empty if the rollups file is missing or was built from an older
+    spot_prices.json, in which case callers resample on the fly.
+    """
+    return _load_spot_rollups(data_version(ROLLUPS_FILE, SPOT_PRICES_FILE))
+
+
+def rollups_version(rollups: dict[tuple[str, str], Dataset]) -> str:
+    """Data version the views were loaded under ("" when there are none)."""
+    return next(iter(rollups.values())).version if rollups else ""
+
+
+@st.cache_resource(max_entries=1)
+def _load_spot_rollups(version: str) -> dict[tuple[str, str], Dataset]:
+    source = file_fingerprint(SPOT_PRICES_FILE)
+    stored_digest, rollups = read_rollups_file()
+    if rollups.empty or source is None or stored_digest != source.digest:
+        return {}
+
+    views = {}
+    for freq_label, freq in ROLLUP_FREQS.items():
+        for agg_label, agg in ROLLUP_AGGS.items():
+            view = rollups[(rollups["freq"] == freq) & (rollups["agg"] == agg)]
+            views[(freq_label, agg_label)] = to_dataset(
+                view[["Date", "Price", "Asset"]], "Price", version
+            )
+    return views
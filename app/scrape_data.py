@@ -1,7 +1,6 @@
 import re
 
 import requests
-import streamlit as st
 from bs4 import BeautifulSoup
 
 JETFUEL_EIA = "https://www.eia.gov/dnav/pet/hist/EER_EPJK_PF4_RGC_DPGD.htm"
@@ -33,7 +32,6 @@ def download_data(url, filename):
 
 
 if __name__ == "__main__":
-    st.cache_data.clear()
     jetfuel_download_link = get_download_link(JETFUEL_EIA)
     diesel_download_link = get_download_link(DIESEL_EIA)
 
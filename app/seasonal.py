@@ -0,0 +1,234 @@
+import json
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from app.dataset import (
+    DATA_DIR,
+    REFINERY_FILE,
+    SPOT_PRICES_FILE,
+    load_refinery_json,
+    load_spot_prices_json,
+    to_dataset,
+)
+from app.fingerprint import data_version, file_fingerprint
+from app.price_matrix import build_wide_matrix, compute_spreads
+from app.timing import timed
+
+SEASONAL_FILE = DATA_DIR / "seasonal_cubes.json"
+
+# The band covers this many full years before the latest year in the cube
+BAND_YEARS = 5
+
+# Weekends and holidays carry the last quote forward within a year, but
+# never for longer than this many calendar days
+SEASONAL_FILL_LIMIT = 4
+
+# Days are numbered on a leap-year calendar so Mar 1 is always day 61
+DAYS = range(1, 367)
+MONTHS = range(1, 13)
+
+
+class SeasonalCube(NamedTuple):
+    """
+    One asset's year x period pivot ('doy' for day-of-year, 'month' for
+    month) and the min/max/mean band across the BAND_YEARS years before
+    the latest one.
+    """
+
+    values: pd.DataFrame
+    band: pd.DataFrame
+    band_years: tuple[int, int]
+    period: str
+
+
+# -----------------------------------------------------------------------------
+# Computation
+# -----------------------------------------------------------------------------
+
+
+def leap_day_of_year(index: pd.DatetimeIndex) -> np.ndarray:
+    """Day of year as if every date fell in a leap year."""
+    month_starts = np.array(
+        [1, 32, 61, 92, 122, 153, 183, 214, 245, 275, 306, 336]
+    )
+    return month_starts[index.month - 1] + index.day - 1
+
+
+def seasonal_band(values: pd.DataFrame) -> tuple[pd.DataFrame, tuple]:
+    """Min/max/mean per period over the BAND_YEARS before the latest year."""
+    latest = int(values.index.max())
+    band_years = (latest - BAND_YEARS, latest - 1)
+    history = values.loc[band_years[0] : band_years[1]]
+    band = pd.DataFrame(
+        {
+            "min": history.min(),
+            "max": history.max(),
+            "mean": history.mean(),
+        }
+    )
+    return band, band_years
+
+
+def build_cube(series: pd.Series, period: str) -> SeasonalCube:
+    """Pivot one dated series into a SeasonalCube."""
+    series = series.dropna()
+    index = series.index
+    if period == "doy":
+        keys, columns = leap_day_of_year(index), DAYS
+    else:
+        keys, columns = index.month, MONTHS
+
+    values = (
+        series.groupby([index.year, keys])
+        .mean()
+        .unstack()
+        .reindex(columns=columns)
+        .astype("float64")
+    )
+    values.index.name, values.columns.name = "Year", period
+    if period == "doy":
+        values = values.ffill(axis=1, limit=SEASONAL_FILL_LIMIT)
+
+    band, band_years = seasonal_band(values)
+    return SeasonalCube(values, band, band_years, period)
+
+
+def compute_price_cubes(spot_df: pd.DataFrame) -> dict[str, SeasonalCube]:
+    """Day-of-year cubes for every spot price, spread and ratio series."""
+    if spot_df.empty:
+        return {}
+    wide = build_wide_matrix(to_dataset(spot_df, "Price"))
+    wide = pd.concat([wide, compute_spreads(wide)], axis=1)
+    return {asset: build_cube(wide[asset], "doy") for asset in wide.columns}
+
+
+def compute_refinery_cubes(
+    refinery_df: pd.DataFrame,
+) -> dict[str, SeasonalCube]:
+    """Year x month cubes for every refinery production series."""
+    if refinery_df.empty:
+        return {}
+    series = refinery_df.set_index("Date").groupby("Asset")["Production"]
+    return {asset: build_cube(s, "month") for asset, s in series}
+
+
+# -----------------------------------------------------------------------------
+# Storage
+# -----------------------------------------------------------------------------
+
+
+def _to_list(values) -> list:
+    return [None if np.isnan(v) else round(float(v), 4) for v in values]
+
+
+def _cube_to_dict(cube: SeasonalCube) -> dict:
+    return {
+        "period": cube.period,
+        "years": [int(year) for year in cube.values.index],
+        "values": [_to_list(row) for row in cube.values.to_numpy()],
+        "band_years": list(cube.band_years),
+        "band": {key: _to_list(cube.band[key]) for key in cube.band},
+    }
+
+
+def _cube_from_dict(payload: dict) -> SeasonalCube:
+    columns = DAYS if payload["period"] == "doy" else MONTHS
+    values = pd.DataFrame(
+        payload["values"],
+        index=pd.Index(payload["years"], name="Year"),
+        columns=pd.Index(columns, name=payload["period"]),
+        dtype="float64",
+    )
+    band = pd.DataFrame(payload["band"], index=values.columns, dtype="float64")
+    return SeasonalCube(
+        values, band, tuple(payload["band_years"]), payload["period"]
+    )
+
+
+def write_seasonal_file(
+    prices: dict, refinery: dict, source_digests: dict, filename=SEASONAL_FILE
+):
+    """Persists the cubes with the digests of the files they came from."""
+    payload = {
+        "source_digests": source_digests,
+        "prices": {a: _cube_to_dict(c) for a, c in prices.items()},
+        "refinery": {a: _cube_to_dict(c) for a, c in refinery.items()},
+    }
+
+    try:
+        with open(filename, "w") as f:
+            json.dump(payload, f, indent=4)
+        print(f"Successfully saved seasonal cubes to {filename}")
+    except IOError as e:
+        print(f"Error saving seasonal cubes to {filename}: {e}")
+
+
+def read_seasonal_file(filename=SEASONAL_FILE) -> dict | None:
+    """Returns the source digests and the parsed cubes, or None."""
+    try:
+        with open(filename, "r") as f:
+            payload = json.load(f)
+    except (IOError, json.JSONDecodeError):
+        return None
+
+    for kind in ("prices", "refinery"):
+        payload[kind] = {
+            asset: _cube_from_dict(cube)
+            for asset, cube in payload.get(kind, {}).items()
+        }
+    return payload
+
+
+def _source_digests() -> dict:
+    spot = file_fingerprint(SPOT_PRICES_FILE)
+    refinery = file_fingerprint(REFINERY_FILE)
+    return {
+        "spot": spot.digest if spot else None,
+        "refinery": refinery.digest if refinery else None,
+    }
+
+
+def refresh_seasonal_cubes():
+    """Rebuild data/seasonal_cubes.json if either source file changed."""
+    digests = _source_digests()
+    stored = read_seasonal_file()
+    if stored and stored["source_digests"] == digests:
+        print("Seasonal cubes are already up to date.")
+        return
+
+    print("Rebuilding seasonal cubes")
+    write_seasonal_file(
+        compute_price_cubes(load_spot_prices_json(SPOT_PRICES_FILE)),
+        compute_refinery_cubes(load_refinery_json(REFINERY_FILE)),
+        digests,
+    )
+
+
+# -----------------------------------------------------------------------------
+# Dashboard Access
+# -----------------------------------------------------------------------------
+
+
+@timed()
+def get_seasonal_cubes() -> tuple[dict, str]:
+    """
+    ({"prices": {...}, "refinery": {...}}, version). Uses the stored cubes
+    when they match the current source files, otherwise builds them cold.
+    """
+    version = data_version(SEASONAL_FILE, SPOT_PRICES_FILE, REFINERY_FILE)
+    return _load_seasonal_cubes(version), version
+
+
+@st.cache_resource(max_entries=1)
+def _load_seasonal_cubes(version: str) -> dict:
+    stored = read_seasonal_file()
+    if stored and stored["source_digests"] == _source_digests():
+        return {"prices": stored["prices"], "refinery": stored["refinery"]}
+
+    return {
+        "prices": compute_price_cubes(load_spot_prices_json(SPOT_PRICES_FILE)),
+        "refinery": compute_refinery_cubes(load_refinery_json(REFINERY_FILE)),
+    }
@@ -0,0 +1,151 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+from app.dataset import get_commodity_data
+from app.price_matrix import JET_FUEL
+
+UP, DOWN, FLAT = "⬆️", "⬇️", "➡️"
+
+# Weekly moves smaller than this (in percent) count as flat
+FLAT_THRESHOLD_PCT = 1.0
+
+# e.g. "Jan 13 - Jan 17, 2026", "Jan 13-17, 2026" or
+# "Dec 29, 2025 - Jan 2, 2026"
+DATE_RANGE_PATTERN = re.compile(
+    r"^\s*(?P<m1>[A-Za-z]+)\.?\s+(?P<d1>\d{1,2})(?:,?\s+(?P<y1>\d{4}))?"
+    r"\s*[-–—]\s*"
+    r"(?:(?P<m2>[A-Za-z]+)\.?\s+)?(?P<d2>\d{1,2}),?\s+(?P<y2>\d{4})\s*$"
+)
+
+
+def parse_date_range(text: str | None):
+    """
+    Parses a report's free-text `date_range` into (start, end) Timestamps.
+    Returns None if the text does not look like a week range.
+    """
+    match = DATE_RANGE_PATTERN.match(text or "")
+    if not match:
+        return None
+
+    end_year = int(match["y2"])
+    start_year = int(match["y1"]) if match["y1"] else end_year
+    end_month = match["m2"] or match["m1"]
+
+    try:
+        start = pd.Timestamp(f"{match['m1']} {match['d1']} {start_year}")
+        end = pd.Timestamp(f"{end_month} {match['d2']} {end_year}")
+    except ValueError:
+        return None
+
+    # "Dec 29 - Jan 2, 2026" starts in the previous year, but
+    # "Jan 17 - Jan 13, 2026" is just backwards
+    if start > end and not match["y1"] and start.month > end.month:
+        start = start.replace(year=start_year - 1)
+    return (start, end) if start <= end else None
+
+
+def jet_fuel_closes() -> pd.Series:
+    """Daily Gulf Coast jet fuel spot prices, indexed by date."""
+    dataset = get_commodity_data()
+    if JET_FUEL not in dataset.offsets:
+        return pd.Series(dtype="float64")
+    start, stop = dataset.offsets[JET_FUEL]
+    closes = dataset.frame[dataset.value_col].iloc[start:stop]
+    return closes.astype("float64")
+
+
+def weekly_changes(reports: list[dict], closes: pd.Series) -> pd.DataFrame:
+    """
+    Jet fuel change over each report's week, for all reports at once.
+
+    The week's move is its last close against the last close before the
+    week started. Weeks that cannot be parsed, have no quotes, or are not
+    fully covered by the price history get NaN.
+    """
+    weeks = [report.get("week") for report in reports]
+    ranges = [parse_date_range(r.get("date_range")) for r in reports]
+    starts = pd.DatetimeIndex([r[0] if r else pd.NaT for r in ranges])
+    ends = pd.DatetimeIndex([r[1] if r else pd.NaT for r in ranges])
+
+    dates = closes.index.to_numpy()
+    prices = np.append(closes.to_numpy(dtype="float64"), np.nan)
+    last_date = dates[-1] if len(dates) else np.datetime64("NaT")
+
+    prev_idx = np.searchsorted(dates, starts.to_numpy(), side="left") - 1
+    end_idx = np.searchsorted(dates, ends.to_numpy(), side="right") - 1
+    valid = (
+        starts.notna()
+        & (prev_idx >= 0)
+        & (end_idx > prev_idx)
+        & (ends.to_numpy() <= last_date)
+    )
+
+    # Invalid rows index the trailing NaN
+    prev_close = prices[np.where(valid, prev_idx, -1)]
+    close = prices[np.where(valid, end_idx, -1)]
+
+    return pd.DataFrame(
+        {
+            "Start": starts,
+            "End": ends,
+            "Previous Close": prev_close,
+            "Close": close,
+            "Change %": (close / prev_close - 1) * 100,
+        },
+        index=pd.Index(weeks, name="Week"),
+    )
+
+
+def classify_changes(
+    changes: pd.Series, threshold: float = FLAT_THRESHOLD_PCT
+) -> pd.Series:
+    """Maps percent changes to Up/Down/Flat arrows (None where NaN)."""
+    values = changes.to_numpy(dtype="float64")
+    directions = np.select(
+        [
+            values >= threshold,
+            values <= -threshold,
+            np.abs(values) < threshold,
+        ],
+        [UP, DOWN, FLAT],
+        default=None,
+    )
+    return pd.Series(directions, index=changes.index, dtype="object")
+
+
+def resolve_actuals(
+    reports: list[dict],
+    threshold: float = FLAT_THRESHOLD_PCT,
+    closes: pd.Series | None = None,
+) -> list[dict]:
+    """
+    Sets `actual` on every report whose week can be priced. Returns only
+    the reports that were resolved, as updated copies ready to save.
+    """
+    if not reports:
+        return []
+    if closes is None:
+        closes = jet_fuel_closes()
+
+    changes = weekly_changes(reports, closes)
+    directions = classify_changes(changes["Change %"], threshold)
+
+    resolved = []
+    for report, direction in zip(reports, directions):
+        if direction is not None:
+            resolved.append({**report, "actual": direction})
+    return resolved
+
+
+def accuracy_scorecard(reports: list[dict]) -> dict:
+    """Prediction hit rate over the reports that have an actual."""
+    resolved = [r for r in reports if r.get("actual") is not None]
+    correct = sum(r.get("predicted") == r["actual"] for r in resolved)
+    return {
+        "resolved": len(resolved),
+        "correct": correct,
+        "pending": len(reports) - len(resolved),
+        "accuracy": correct / len(resolved) if resolved else None,
+    }
@@ -1,20 +1,15 @@
-import json
-
 import streamlit as st
 
+from app.sections.analysis.actuals import accuracy_scorecard
 from app.sections.analysis.report_renderer import (
     load_all_reports,
     render_report_body,
 )
-
-CURRENT_WEEK_JSON_DATA = "data/current_week.json"
-CURRENT_WEEK = 1
-
-with open(CURRENT_WEEK_JSON_DATA, "r") as json_file:
-    data = json.load(json_file)
-    CURRENT_WEEK = data.get("current_week", CURRENT_WEEK)
+from app.sections.analysis.report_store import get_report_store
+from app.timing import timed
 
 
+@timed()
 def render_historical_report_section():
     """
     Renders an accuracy table for past reports with expandable
@@ -23,14 +18,28 @@ def render_historical_report_section():
     st.subheader("Historical Analysis Archive")
     st.caption("Review past performance and archived analysis reports.")
 
+    current_week = get_report_store().current_week
     all_reports = load_all_reports()
     # Filter out the current week
-    historical = [r for r in all_reports if r.get("week") != CURRENT_WEEK]
+    historical = [r for r in all_reports if r.get("week") != current_week]
 
     if not historical:
         st.info("No historical reports available yet.")
         return
 
+    # Accuracy Scorecard
+    scorecard = accuracy_scorecard(historical)
+    accuracy = scorecard["accuracy"]
+    s_col1, s_col2, s_col3 = st.columns(3)
+    s_col1.metric(
+        "Prediction Accuracy",
+        f"{accuracy:.0%}" if accuracy is not None else "—",
+    )
+    s_col2.metric(
+        "Correct Calls", f"{scorecard['correct']} / {scorecard['resolved']}"
+    )
+    s_col3.metric("Pending Weeks", scorecard["pending"])
+
     # Table Header
     h_col1, h_col2, h_col3 = st.columns([1, 1, 1])
     h_col1.markdown("**Week**")
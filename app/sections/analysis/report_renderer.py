@@ -1,48 +1,26 @@
-import json
-import glob as glob_module
-from pathlib import Path
-
 import streamlit as st
 
-REPORTS_DIR = Path(__file__).parents[3] / "data" / "reports"
+from app.sections.analysis.report_store import get_report_store
+from app.timing import timed
+
 JOHN_AVATAR = "resources/avatars/john.png"
 
 
+@timed()
 def load_report(week: int) -> dict | None:
-    """Loads a single week's report JSON from data/reports/."""
-    report_path = REPORTS_DIR / f"week_{week}_report.json"
-    if not report_path.exists():
-        return None
-    try:
-        with open(report_path, "r") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
-        return None
+    """Loads a single week's report from the report store."""
+    return get_report_store().get(week)
 
 
+@timed()
 def load_all_reports() -> list[dict]:
-    """Scans directory for all week_*_report.json, sorted by week descending."""
-    pattern = str(REPORTS_DIR / "week_*_report.json")
-    files = glob_module.glob(pattern)
-    reports = []
-    for filepath in files:
-        try:
-            with open(filepath, "r") as f:
-                report = json.load(f)
-                reports.append(report)
-        except (json.JSONDecodeError, IOError):
-            continue
-    reports.sort(key=lambda r: r.get("week", 0), reverse=True)
-    return reports
+    """All reports from the report store, sorted by week descending."""
+    return get_report_store().all()
 
 
 def save_report(report: dict):
     """Writes a report dict to data/reports/week_{N}_report.json."""
-    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
-    week = report["week"]
-    report_path = REPORTS_DIR / f"week_{week}_report.json"
-    with open(report_path, "w") as f:
-        json.dump(report, f, indent=4, ensure_ascii=False)
+    get_report_store().save(report)
 
 
 def _render_direction_badge(report: dict):
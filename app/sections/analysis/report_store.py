@@ -0,0 +1,135 @@
+import copy
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import streamlit as st
+
+DATA_DIR = Path(__file__).parents[3] / "data"
+REPORTS_DIR = DATA_DIR / "reports"
+CURRENT_WEEK_FILE = DATA_DIR / "current_week.json"
+DEFAULT_CURRENT_WEEK = 1
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _atomic_write_json(path: Path, payload: dict):
+    """Writes to a temp file in the same directory, then renames it over."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(payload, f, indent=4, ensure_ascii=False)
+        # mkstemp creates owner-only files; match a plain open()
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class ReportStore:
+    """
+    In-memory index of the weekly reports and the current week setting.
+
+    Reads cost one stat() of the reports directory and of
+    current_week.json; files are only re-read when those mtimes move.
+    Every report file is replaced by rename, which bumps the directory
+    mtime, so writes from other processes are picked up too. Writes made
+    through the store update the index directly.
+    """
+
+    def __init__(
+        self,
+        reports_dir: Path = REPORTS_DIR,
+        current_week_file: Path = CURRENT_WEEK_FILE,
+    ):
+        self.reports_dir = Path(reports_dir)
+        self.current_week_file = Path(current_week_file)
+        self._lock = threading.Lock()
+        self._reports: dict[int, dict] = {}
+        self._dir_mtime: int | None = None
+        self._current_week = DEFAULT_CURRENT_WEEK
+        self._week_mtime: int | None = None
+
+    def _path(self, week: int) -> Path:
+        return self.reports_dir / f"week_{week}_report.json"
+
+    def _refresh_reports(self):
+        mtime = _mtime_ns(self.reports_dir)
+        if mtime is not None and mtime == self._dir_mtime:
+            return
+
+        reports = {}
+        for path in self.reports_dir.glob("week_*_report.json"):
+            try:
+                with open(path, "r") as f:
+                    report = json.load(f)
+            except (json.JSONDecodeError, IOError):
+                continue
+            reports[report.get("week", 0)] = report
+
+        self._reports = reports
+        self._dir_mtime = mtime
+
+    def _refresh_current_week(self):
+        mtime = _mtime_ns(self.current_week_file)
+        if mtime == self._week_mtime:
+            return
+
+        current_week = DEFAULT_CURRENT_WEEK
+        try:
+            with open(self.current_week_file, "r") as f:
+                current_week = json.load(f).get("current_week", current_week)
+        except (json.JSONDecodeError, IOError):
+            pass
+
+        self._current_week = current_week
+        self._week_mtime = mtime
+
+    def get(self, week: int) -> dict | None:
+        """A copy of one week's report, or None if it does not exist."""
+        with self._lock:
+            self._refresh_reports()
+            report = self._reports.get(week)
+        return copy.deepcopy(report) if report is not None else None
+
+    def all(self) -> list[dict]:
+        """Copies of every report, sorted by week descending."""
+        with self._lock:
+            self._refresh_reports()
+            reports = sorted(
+                self._reports.values(),
+                key=lambda r: r.get("week", 0),
+                reverse=True,
+            )
+        return copy.deepcopy(reports)
+
+    def save(self, report: dict):
+        """Writes a report through to disk and into the index."""
+        with self._lock:
+            self._refresh_reports()
+            _atomic_write_json(self._path(report["week"]), report)
+            self._reports[report["week"]] = copy.deepcopy(report)
+            self._dir_mtime = _mtime_ns(self.reports_dir)
+
+    @property
+    def current_week(self) -> int:
+        with self._lock:
+            self._refresh_current_week()
+            return self._current_week
+
+
+@st.cache_resource
+def get_report_store() -> ReportStore:
+    """The process-wide report store."""
+    return ReportStore()
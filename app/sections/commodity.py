@@ -1,162 +1,116 @@
-import json
-import os
-from pathlib import Path
-
 import pandas as pd
 import plotly.express as px
 import streamlit as st
 
-from app.analytics import data_granularity_and_aggregate_stats
+from app.analytics import compute_trends, data_granularity_and_aggregate_stats
+from app.downsample import downsample_long, line_render_mode, target_points
+from app.figure_cache import get_figure_cache
+from app.price_matrix import RATIOS, get_commodity_series
+from app.rollups import get_spot_rollups, rollups_version
+from app.sections.seasonal import CHART_MODES, render_seasonal_overlay
+from app.series_export import render_download_buttons, view_frames
+from app.timing import span, timed
+
+# Trends smaller than this (in cents per gallon per trading day, i.e. per
+# observation) read as flat
+TREND_FLAT_CENTS_PER_TRADING_DAY = 0.05
+
+# Initial widget values (also what app/warmup.py pre-builds)
+DEFAULT_FROM_YEAR = 2020
+FREQ_OPTIONS = ["Daily", "Weekly", "Monthly"]
+AGG_OPTIONS = ["Average Price", "Close Price"]
 
 # -----------------------------------------------------------------------------
 # Helper Functions
 # -----------------------------------------------------------------------------
 
 
-def clean_df(df: pd.DataFrame, commodity_name: str):
-    """
-    Clean up the Excel dataframe:
-    1. Convert 'Date' to datetime.
-    2. Rename the price column to a standard 'Price'.
-    3. Add a metadata column for the 'Asset'.
-    """
-    df["Date"] = pd.to_datetime(df["Date"])
-    # Rename the value column (index 1) to 'Price'
-    df.rename(columns={df.columns[1]: "Price"}, inplace=True)
-    df["Asset"] = commodity_name
-    return df
-
+@timed()
+def build_commodity_figure(
+    dataset,
+    rollups,
+    selected_assets,
+    from_year,
+    to_year,
+    freq_selection,
+    agg_method,
+):
+    """Filters, aggregates and plots the selected commodity prices."""
+    # Filter the data
+    with span("commodity.filter"):
+        filtered_assets_df = dataset.select(
+            selected_assets, from_year, to_year
+        )
 
-def load_spot_prices_json(file_path: Path) -> pd.DataFrame:
-    """
-    Load and transform the EIA spot prices JSON data.
-    Expected JSON keys per record: 'period', 'value', 'series-description'
-    """
-    # Keys are lowercased here to match the normalized column data later
-    JSON_ASSET_NAME_MAP = {
-        "u.s. gulf coast kerosene-type jet fuel spot price fob (dollars per gallon)": "Gulf Coast Jet Fuel",  # noqa E501
-        "u.s. gulf coast ultra-low sulfur no 2 diesel spot price (dollars per gallon)": "Gulf Coast No 2 Diesel",  # noqa E501
-        "u.s. gulf coast conventional gasoline regular spot price fob (dollars per gallon)": "Gulf Coast Regular Gasoline",  # noqa E501
-    }
-
-    try:
-        with open(file_path, "r") as f:
-            data = json.load(f)
-
-        if not data:
-            return pd.DataFrame()
-
-        df = pd.DataFrame(data)
-
-        # 1. Normalize Columns
-        rename_map = {"period": "Date", "value": "Price"}
-        df.rename(columns=rename_map, inplace=True)
-
-        # 2. Determine Initial Asset Name
-        if "series-description" in df.columns:
-            df["Asset"] = df["series-description"]
-        elif "series" in df.columns:
-            df["Asset"] = df["series"]
-        else:
-            df["Asset"] = "Unknown Commodity"
-
-        # 3. Apply Name Mapping
-        # We create a temporary series of lowercased names to lookup in the map
-        mapped_assets = (
-            df["Asset"]
-            .astype(str)
-            .str.lower()
-            .str.strip()
-            .map(JSON_ASSET_NAME_MAP)
+    # Process stats for plotting
+    with span("commodity.aggregate"):
+        df_plot = data_granularity_and_aggregate_stats(
+            freq_selection, agg_method, filtered_assets_df, rollups
         )
-        # We fill NaNs with the original (non-lowercased) names
-        df["Asset"] = mapped_assets.fillna(df["Asset"])
 
-        # 4. Type Conversion
-        df["Date"] = pd.to_datetime(df["Date"])
-        df["Price"] = pd.to_numeric(df["Price"], errors="coerce")
+    with span("commodity.plot"):
+        # Thin long daily histories down to what the chart can show
+        df_plot = downsample_long(df_plot, "Price", target_points())
 
-        return df[["Date", "Price", "Asset"]]
+        title_text = f"{freq_selection} Commodity Prices ({agg_method})"
 
-    except Exception as e:
-        st.warning(f"Error loading JSON data from {file_path.name}: {e}")
-        return pd.DataFrame()
+        fig = px.line(
+            df_plot,
+            x="Date",
+            y="Price",
+            color="Asset",
+            title=title_text,
+            render_mode=line_render_mode(len(df_plot)),
+        )
+    fig.update_layout(
+        legend_title_text="Commodity Name", hovermode="x unified"
+    )
+    fig.update_yaxes(title_text=price_axis_title(selected_assets))
+
+    return fig
 
 
-def join_dfs_on_date(dfs: list[pd.DataFrame]):
-    """Stack multiple dataframes vertically."""
-    merged_df = pd.concat(dfs, axis=0, ignore_index=True)
-    merged_df = merged_df.sort_values(by=["Date", "Asset"])
-    return merged_df
+def price_axis_title(selected_assets) -> str:
+    """Ratios are unitless; say so when they share the axis with prices."""
+    if any(asset in RATIOS for asset in selected_assets):
+        return "Dollars per Gallon / Ratio"
+    return "Dollars per Gallon"
 
 
-def transform_commodity_df(df: pd.DataFrame):
-    """Add Year and Month columns."""
-    df["Year"] = df["Date"].dt.year
-    df["Month"] = df["Date"].dt.month
-    return df
+@timed()
+@st.cache_resource(max_entries=1)
+def get_price_trends(version: str, _dataset) -> pd.DataFrame:
+    """Rolling trend slopes for every asset, computed once per data version."""
+    return compute_trends(_dataset)
 
 
-@st.cache_data
-def get_commodity_data():
+def format_trend_badge(label: str, slope: float) -> str:
     """
-    Grab commodity data.
-    PRIORITY: Checks for 'spot_prices.json' first.
-    If JSON exists and is valid, returns THAT ONLY (ignoring Excel).
-    If JSON fails or is missing, falls back to Excel files.
+    Markdown badge for one trend window, slope given in $/gal per trading
+    day (the slopes are fitted per observation, so weekends don't count).
     """
-    data_dir = Path(__file__).parents[2] / "data"
-
-    if not data_dir.exists():
-        st.error(f"Data directory not found at {data_dir}")
-        return pd.DataFrame(), []
-
-    # ---------------------------------------------------------
-    # 1. Try Loading JSON First (The "Truth" Source)
-    # ---------------------------------------------------------
-    json_path = data_dir / "spot_prices.json"
-    if json_path.exists():
-        json_df = load_spot_prices_json(json_path)
-        if not json_df.empty:
-            # If we successfully loaded JSON, we transform and RETURN.
-            # We do NOT load Excel files to avoid duplicates.
-            commodity_df = transform_commodity_df(json_df)
-            assets = sorted(commodity_df["Asset"].unique().tolist())
-            return commodity_df, assets
-
-    # ---------------------------------------------------------
-    # 2. Fallback: Load Excel Files (Only if JSON missing/empty)
-    # ---------------------------------------------------------
-    commodity_data = []
-    assets = []
-    data_children = os.listdir(data_dir)
-
-    for child in data_children:
-        if child.endswith(".xlsx") and "commodity_" in child:
-            commodity_name = child.replace("commodity_", "").replace(
-                "_prices.xlsx", ""
-            )
-            file_path = data_dir / child
-
-            try:
-                df = pd.read_excel(file_path, skiprows=2, sheet_name="Data 1")
-                df = clean_df(df, commodity_name=commodity_name)
-
-                if not df.empty:
-                    commodity_data.append(df)
-                    if commodity_name not in assets:
-                        assets.append(commodity_name)
-
-            except Exception as e:
-                st.warning(f"Could not process {child}: {e}")
-
-    if not commodity_data:
-        return pd.DataFrame(), assets
-
-    commodity_df = join_dfs_on_date(commodity_data)
-    commodity_df = transform_commodity_df(commodity_df)
-
-    return commodity_df, assets
+    cents = slope * 100
+    if abs(cents) < TREND_FLAT_CENTS_PER_TRADING_DAY:
+        return f":gray-badge[{label} ➡️ flat]"
+    if cents > 0:
+        return f":green-badge[{label} ⬆️ {cents:+.2f}¢/trading day]"
+    return f":red-badge[{label} ⬇️ {cents:+.2f}¢/trading day]"
+
+
+def render_trend_badges(dataset, selected_assets):
+    """One row of trend-window badges per selected price or spread."""
+    trends = get_price_trends(dataset.version, dataset)
+
+    for asset in selected_assets:
+        # Ratio slopes are not in $/gal, so they get no cents-per-day badge
+        if asset not in trends.index or asset in RATIOS:
+            continue
+        badges = [
+            format_trend_badge(label, slope)
+            for label, slope in trends.loc[asset].items()
+            if not pd.isna(slope)
+        ]
+        st.markdown(f"**{asset}** " + " ".join(badges))
 
 
 # -----------------------------------------------------------------------------
@@ -164,6 +118,8 @@ def get_commodity_data():
 # -----------------------------------------------------------------------------
 
 
+@st.fragment
+@timed()
 def render_commodity_section():
     """Renders the Commodity Price Visualization Section."""
 
@@ -173,25 +129,25 @@ def render_commodity_section():
         help="Data sourced from the U.S. Energy Information Administration (EIA).",  # noqa E501
     )
 
-    # Load Data
-    commodity_df, assets = get_commodity_data()
+    # Load Data (spot prices plus derived spread/ratio series)
+    dataset = get_commodity_series()
+    assets = dataset.assets
 
-    if commodity_df.empty:
+    if dataset.empty:
         st.warning("No commodity data available to display.")
         return
 
     col1a, col2a = st.columns(2)
 
     # Year Selection
-    min_value = int(commodity_df["Year"].min())
-    max_value = int(commodity_df["Year"].max())
+    min_value, max_value = dataset.year_range
 
     with col1a:
         from_year, to_year = st.slider(
             "Which years are you interested in?",
             min_value=min_value,
             max_value=max_value,
-            value=[2020, max_value],
+            value=[DEFAULT_FROM_YEAR, max_value],
         )
 
     # Asset Selection
@@ -209,46 +165,87 @@ def render_commodity_section():
             # removed str.capitalize to respect the exact formatting in the map
         )
 
-    # Filter the data
-    filtered_assets_df = commodity_df[
-        (commodity_df["Asset"].isin(selected_assets))
-        & (commodity_df["Year"] <= to_year)
-        & (from_year <= commodity_df["Year"])
-    ]
-
     # Frequency and Aggregation
     col1b, col2b = st.columns(2)
 
     with col1b:
         freq_selection = st.radio(
             "Select Frequency:",
-            options=["Daily", "Weekly", "Monthly"],
+            options=FREQ_OPTIONS,
             horizontal=True,
         )
 
     with col2b:
         agg_method = st.radio(
             "Aggregation Method:",
-            options=["Average Price", "Close Price"],
+            options=AGG_OPTIONS,
             horizontal=True,
         )
 
-    # Process stats for plotting
-    df_plot = data_granularity_and_aggregate_stats(
-        freq_selection, agg_method, filtered_assets_df
+    chart_mode = st.radio(
+        "Chart Mode:",
+        options=CHART_MODES,
+        horizontal=True,
+        key="commodity_chart_mode",
     )
 
-    title_text = f"{freq_selection} Commodity Prices ({agg_method})"
-
-    fig = px.line(
-        df_plot, x="Date", y="Price", color="Asset", title=title_text
+    rollups = get_spot_rollups()
+    version = f"{dataset.version}:{rollups_version(rollups)}"
+    view_params = (
+        tuple(selected_assets),
+        from_year,
+        to_year,
+        freq_selection,
+        agg_method,
     )
-    fig.update_layout(
-        legend_title_text="Commodity Name", hovermode="x unified"
-    )
-    fig.update_yaxes(title_text="Dollars per Gallon")
 
-    st.plotly_chart(fig)
+    if chart_mode == "Seasonal Overlay":
+        render_seasonal_overlay(
+            "prices",
+            selected_assets,
+            from_year,
+            to_year,
+            price_axis_title(selected_assets),
+        )
+    else:
+        # Identical selections share one figure across sessions
+        fig = get_figure_cache().get_or_build(
+            "commodity",
+            version,
+            view_params,
+            lambda: build_commodity_figure(
+                dataset,
+                rollups,
+                selected_assets,
+                from_year,
+                to_year,
+                freq_selection,
+                agg_method,
+            ),
+        )
+        st.plotly_chart(fig)
+
+    # Downloads hold the time series view, which is not what the
+    # overlay shows
+    if selected_assets and chart_mode != "Seasonal Overlay":
+        # The full-resolution rows behind the chart, not the thinned plot
+        render_download_buttons(
+            "commodity",
+            version,
+            view_params,
+            f"commodity_{freq_selection.lower()}_{from_year}-{to_year}",
+            lambda: view_frames(
+                dataset,
+                selected_assets,
+                from_year,
+                to_year,
+                freq_selection,
+                agg_method,
+                rollups,
+            ),
+        )
+
+    render_trend_badges(dataset, selected_assets)
     st.caption(
         "Data Source: U.S. Energy Information Administration (EIA)",
         text_alignment="right",
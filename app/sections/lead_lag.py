@@ -0,0 +1,88 @@
+import plotly.express as px
+import streamlit as st
+
+from app.figure_cache import get_figure_cache
+from app.lead_lag import MAX_LAG_MONTHS, get_lead_lag, peak_lags
+from app.timing import timed
+
+# -----------------------------------------------------------------------------
+# Helper Functions
+# -----------------------------------------------------------------------------
+
+
+@timed()
+def build_lead_lag_figure(lead_lag, refinery_series):
+    """Correlation vs. lag of every price asset against one refinery series."""
+    df_plot = lead_lag[lead_lag["Refinery Series"] == refinery_series]
+
+    fig = px.line(
+        df_plot,
+        x="Lag",
+        y="Correlation",
+        color="Price Asset",
+        markers=True,
+        title=f"Monthly Price vs. {refinery_series} Output",
+    )
+    fig.update_layout(legend_title_text="Price Asset", hovermode="x unified")
+    fig.update_xaxes(
+        title_text="Lag (months, positive = prices lead)", dtick=1
+    )
+    fig.update_yaxes(range=[-1, 1])
+    fig.add_vline(x=0, line_dash="dot", line_color="gray")
+
+    return fig
+
+
+# -----------------------------------------------------------------------------
+# Main Section Render
+# -----------------------------------------------------------------------------
+
+
+@st.fragment
+@timed()
+def render_lead_lag_section():
+    """Renders the price vs. refinery production lead/lag panel."""
+
+    st.header(
+        "Price & Refinery Lead/Lag",
+        divider="gray",
+        help="Cross-correlation of month-over-month changes in average spot prices and refinery net production.",  # noqa E501
+    )
+
+    lead_lag, version = get_lead_lag()
+
+    if lead_lag.empty:
+        st.warning("Not enough overlapping price and refinery history.")
+        return
+
+    refinery_options = list(lead_lag["Refinery Series"].unique())
+    refinery_series = st.selectbox(
+        "Refinery Series:",
+        refinery_options,
+        key="lead_lag_refinery_series",
+    )
+
+    # Identical selections share one figure across sessions
+    fig = get_figure_cache().get_or_build(
+        "lead_lag",
+        version,
+        refinery_series,
+        lambda: build_lead_lag_figure(lead_lag, refinery_series),
+    )
+    st.plotly_chart(fig)
+
+    peaks = peak_lags(lead_lag)
+    st.dataframe(
+        peaks[peaks["Refinery Series"] == refinery_series],
+        hide_index=True,
+        column_config={
+            "Correlation": st.column_config.NumberColumn(format="%.2f"),
+            "Lag": st.column_config.NumberColumn(
+                help=f"Strongest lag within ±{MAX_LAG_MONTHS} months"
+            ),
+        },
+    )
+    st.caption(
+        "Data Source: U.S. Energy Information Administration (EIA)",
+        text_alignment="right",
+    )
@@ -1,22 +1,35 @@
 import json
-import time
 from pathlib import Path
 
 import streamlit as st
 
+from app.fingerprint import data_version
+from app.timing import timed
+
+# Total duration of the outlook's reveal animation, played by the browser
+PREDICTION_REVEAL_SECONDS = 4.0
+
 # -----------------------------------------------------------------------------
 # Helper Functions
 # -----------------------------------------------------------------------------
 
 
+@timed()
 def load_prediction():
-    """Loads the cached prediction file."""
+    """Loads the cached prediction file, reread only when it changes."""
     # Assuming the data is in root/data and this script
     # is app/sections/llm_prediction.py
     data_path = (
         Path(__file__).parents[2] / "data" / "llm_prediction_snapshot.json"
     )
 
+    if not data_path.exists():
+        return None
+    return _read_prediction_file(str(data_path), data_version(data_path))
+
+
+@st.cache_data(max_entries=1)
+def _read_prediction_file(data_path: str, version: str):
     try:
         with open(data_path, "r") as f:
             return json.load(f)
@@ -24,11 +37,24 @@ def load_prediction():
         return None
 
 
-def stream_text(text):
-    """Generator to simulate typing effect."""
-    for word in text.split(" "):
-        yield word + " "
-        time.sleep(0.04)  # Adjust speed here
+def reveal_style(container_key, total_seconds):
+    """
+    CSS that reveals the keyed container's text top to bottom in the
+    browser, so the script run does not wait on the animation. The wipe
+    is continuous: the markdown's source lines do not match its wrapped,
+    rendered lines, so stepping per line would cut lines in half.
+    """
+    return f"""
+    <style>
+    @keyframes prediction-reveal {{
+        from {{ clip-path: inset(0 0 100% 0); opacity: 0.4; }}
+        to {{ clip-path: inset(0 0 0 0); opacity: 1; }}
+    }}
+    .st-key-{container_key} {{
+        animation: prediction-reveal {total_seconds}s linear;
+    }}
+    </style>
+    """
 
 
 # -----------------------------------------------------------------------------
@@ -36,7 +62,9 @@ def stream_text(text):
 # -----------------------------------------------------------------------------
 
 
-def render_llm_section():
+@st.fragment
+@timed()
+def render_llm_section(reveal_seconds=PREDICTION_REVEAL_SECONDS):
     """Renders the Gemini Prediction Interface."""
 
     # 1. Load Data
@@ -67,8 +95,10 @@ def render_llm_section():
             st.session_state.prediction_shown = False
 
         if not st.session_state.prediction_shown:
-            # The Typing Effect
-            st.write_stream(stream_text(prediction_text))
+            # The Typing Effect, animated client-side on first load only
+            st.html(reveal_style("prediction_reveal", reveal_seconds))
+            with st.container(key="prediction_reveal"):
+                st.markdown(prediction_text)
             st.session_state.prediction_shown = True
         else:
             # Static display after first load
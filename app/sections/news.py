@@ -2,20 +2,31 @@ import json
 
 import streamlit as st
 
+from app.fingerprint import data_version, file_fingerprint
+from app.news_store import NEWS_INDEX_FILE
+from app.timing import timed
+
 # -----------------------------------------------------------------------------
 # Data Loading & Processing
 # -----------------------------------------------------------------------------
 
 
-def load_data(filename="data/argus_news_cache.json") -> list:
-    """Returns json news data from cached file."""
-    try:
-        with open(filename, "r") as f:
-            data = json.load(f)
-        return data
-    except FileNotFoundError:
+@timed()
+def load_data(filename=NEWS_INDEX_FILE) -> list:
+    """
+    Returns the news display-card index, reread only on change. Article
+    bodies live in a separate store the dashboard never loads.
+    """
+    if file_fingerprint(filename) is None:
         st.error(f"News data file not found: {filename}")
         return []
+    return _read_news_file(str(filename), data_version(filename))
+
+
+@st.cache_data(max_entries=1)
+def _read_news_file(filename: str, version: str) -> list:
+    with open(filename, "r") as f:
+        return json.load(f)
 
 
 def get_article_details(article) -> tuple[str, str, str, str]:
@@ -76,6 +87,8 @@ def render_news_card(article, index):
             )
 
 
+@st.fragment
+@timed()
 def render_news_section():
     data = load_data()
 
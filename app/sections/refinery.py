@@ -1,111 +1,51 @@
-import json
-from pathlib import Path
-
-import pandas as pd
 import plotly.express as px
 import streamlit as st
 
+from app.dataset import get_refinery_data
+from app.downsample import downsample_long, line_render_mode, target_points
+from app.figure_cache import get_figure_cache
+from app.sections.seasonal import CHART_MODES, render_seasonal_overlay
+from app.series_export import render_download_buttons, view_frames
+from app.timing import span, timed
+
+# Initial widget values (also what app/warmup.py pre-builds)
+DEFAULT_FROM_YEAR = 2018
+DEFAULT_ASSET_INDEX = 1
+
 # -----------------------------------------------------------------------------
 # Helper Functions
 # -----------------------------------------------------------------------------
 
 
-def transform_refinery_df(df: pd.DataFrame):
-    """Add Year and Month columns."""
-    df["Year"] = df["Date"].dt.year
-    df["Month"] = df["Date"].dt.month
-    return df
-
-
-def load_refinery_json(file_path: Path) -> pd.DataFrame:
-    """
-    Load and transform the EIA refinery utilization JSON data.
-    """
-    # Keys are lowercased to match normalized column data
-    REFINERY_NAME_MAP = {
-        "gulf coast (padd 3) refinery net production of distillate fuel oil (thousand barrels per day)": "Gulf Coast Distillate Fuel Oil",  # noqa E501
-        "u.s. refinery net production of other conventional motor gasoline (thousand barrels per day)": "U.S. Motor Gasoline (Other Conv.)",  # noqa E501
-        "gulf coast (padd 3) refinery net production of conventional motor gasoline (thousand barrels per day)": "Gulf Coast Motor Gasoline (Conv.)",  # noqa E501
-        "u.s. refinery net production of commercial kerosene-type jet fuel (thousand barrels per day)": "U.S. Jet Fuel",  # noqa E501
-        "gulf coast (padd 3) refinery net production of commercial kerosene-type jet fuel (thousand barrels per day)": "Gulf Coast Jet Fuel",  # noqa E501
-        "u.s. refinery net production of distillate fuel oil (thousand barrels per day)": "U.S. Distillate Fuel Oil",  # noqa E501
-    }
-
-    try:
-        with open(file_path, "r") as f:
-            data = json.load(f)
-
-        if not data:
-            return pd.DataFrame()
-
-        df = pd.DataFrame(data)
-
-        # 1. Normalize Columns
-        # EIA API usually returns 'period' for date, 'value' for amount
-        rename_map = {"period": "Date", "value": "Production"}
-        df.rename(columns=rename_map, inplace=True)
-
-        # 2. Determine Asset Name (Series Description)
-        # Fallback to 'series' ID if description is missing
-        if "series-description" in df.columns:
-            df["Asset"] = df["series-description"]
-        elif "series" in df.columns:
-            df["Asset"] = df["series"]
-        else:
-            df["Asset"] = "Unknown Series"
-
-        # 3. Filter for 'Barrels per Day' ONLY
-        # We lowercase for consistent filtering, then filter
-        df = df[
-            df["Asset"]
-            .astype(str)
-            .str.lower()
-            .str.contains("thousand barrels per day")
-        ].copy()
-
-        # 4. Apply Name Mapping
-        mapped_assets = (
-            df["Asset"]
-            .astype(str)
-            .str.lower()
-            .str.strip()
-            .map(REFINERY_NAME_MAP)
-        )
-        # Fill NaNs with original name if mapping fails
-        df["Asset"] = mapped_assets.fillna(df["Asset"])
-
-        # 5. Type Conversion
-        df["Date"] = pd.to_datetime(df["Date"])
-        df["Production"] = pd.to_numeric(df["Production"], errors="coerce")
-
-        return df[["Date", "Production", "Asset"]]
-
-    except Exception as e:
-        st.warning(f"Error loading refinery JSON from {file_path.name}: {e}")
-        return pd.DataFrame()
-
-
-@st.cache_data
-def get_refinery_data():
-    """
-    Grab refinery data from JSON.
-    """
-    data_dir = Path(__file__).parents[2] / "data"
-    json_path = data_dir / "refinery_utilization.json"
-
-    if not json_path.exists():
-        st.error(f"Refinery data not found at {json_path}")
-        return pd.DataFrame(), []
+@timed()
+def build_refinery_figure(dataset, selected_assets, from_year, to_year):
+    """Filters and plots the selected refinery production series."""
+    # Filter the data
+    with span("refinery.filter"):
+        filtered_df = dataset.select(selected_assets, from_year, to_year)
 
-    refinery_df = load_refinery_json(json_path)
+    # Visualization
+    with span("refinery.plot"):
+        df_plot = downsample_long(
+            filtered_df.reset_index(), "Production", target_points()
+        )
 
-    if refinery_df.empty:
-        return pd.DataFrame(), []
+        fig = px.line(
+            df_plot,
+            x="Date",
+            y="Production",
+            color="Asset",
+            title="Net Production (Thousand Barrels per Day)",
+            render_mode=line_render_mode(len(df_plot)),
+        )
 
-    refinery_df = transform_refinery_df(refinery_df)
-    assets = sorted(refinery_df["Asset"].unique().tolist())
+    fig.update_layout(
+        legend_title_text="Product",
+        hovermode="x unified",
+        yaxis_title="Production (MBBL/d)",
+    )
 
-    return refinery_df, assets
+    return fig
 
 
 # -----------------------------------------------------------------------------
@@ -113,6 +53,8 @@ def get_refinery_data():
 # -----------------------------------------------------------------------------
 
 
+@st.fragment
+@timed()
 def render_refinery_section():
     """Renders the Refinery Production Visualization Section."""
 
@@ -123,24 +65,24 @@ def render_refinery_section():
     )
 
     # Load Data
-    refinery_df, assets = get_refinery_data()
+    dataset = get_refinery_data()
+    assets = dataset.assets
 
-    if refinery_df.empty:
+    if dataset.empty:
         st.warning("No refinery data available to display.")
         return
 
     col1a, col2a = st.columns(2)
 
     # Year Selection
-    min_value = int(refinery_df["Year"].min())
-    max_value = int(refinery_df["Year"].max())
+    min_value, max_value = dataset.year_range
 
     with col1a:
         from_year, to_year = st.slider(
             "Filter by Year Range:",
             min_value=min_value,
             max_value=max_value,
-            value=[2018, max_value],
+            value=[DEFAULT_FROM_YEAR, max_value],
             key="refinery_year_slider",
         )
 
@@ -149,7 +91,7 @@ def render_refinery_section():
         st.warning("Select at least one product series")
 
     with col2a:
-        default_asset = assets[1] if assets else None
+        default_asset = assets[DEFAULT_ASSET_INDEX] if assets else None
 
         selected_assets = st.multiselect(
             "Select Product Series:",
@@ -158,30 +100,45 @@ def render_refinery_section():
             key="refinery_asset_multiselect",
         )
 
-    # Filter the data
-    filtered_df = refinery_df[
-        (refinery_df["Asset"].isin(selected_assets))
-        & (refinery_df["Year"] <= to_year)
-        & (from_year <= refinery_df["Year"])
-    ].sort_values(by="Date")
-
-    # Visualization
-
-    fig = px.line(
-        filtered_df,
-        x="Date",
-        y="Production",
-        color="Asset",
-        title="Net Production (Thousand Barrels per Day)",
+    chart_mode = st.radio(
+        "Chart Mode:",
+        options=CHART_MODES,
+        horizontal=True,
+        key="refinery_chart_mode",
     )
 
-    fig.update_layout(
-        legend_title_text="Product",
-        hovermode="x unified",
-        yaxis_title="Production (MBBL/d)",
-    )
+    if chart_mode == "Seasonal Overlay":
+        render_seasonal_overlay(
+            "refinery",
+            selected_assets,
+            from_year,
+            to_year,
+            "Production (MBBL/d)",
+        )
+    else:
+        # Identical selections share one figure across sessions
+        fig = get_figure_cache().get_or_build(
+            "refinery",
+            dataset.version,
+            (tuple(selected_assets), from_year, to_year),
+            lambda: build_refinery_figure(
+                dataset, selected_assets, from_year, to_year
+            ),
+        )
+        st.plotly_chart(fig)
+
+    # Downloads hold the time series view, which is not what the
+    # overlay shows
+    if selected_assets and chart_mode != "Seasonal Overlay":
+        # The full-resolution rows behind the chart, not the thinned plot
+        render_download_buttons(
+            "refinery",
+            dataset.version,
+            (tuple(selected_assets), from_year, to_year),
+            f"refinery_{from_year}-{to_year}",
+            lambda: view_frames(dataset, selected_assets, from_year, to_year),
+        )
 
-    st.plotly_chart(fig)
     st.caption(
         "Data Source: U.S. Energy Information Administration (EIA)",
         text_alignment="right",
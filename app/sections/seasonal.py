@@ -0,0 +1,117 @@
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from app.figure_cache import get_figure_cache
+from app.seasonal import get_seasonal_cubes
+from app.timing import timed
+
+CHART_MODES = ["Time Series", "Seasonal Overlay"]
+
+# Day-of-year columns are plotted on a leap-year calendar
+_LEAP_YEAR_START = pd.Timestamp("2000-01-01")
+
+# -----------------------------------------------------------------------------
+# Helper Functions
+# -----------------------------------------------------------------------------
+
+
+def _x_axis(cube):
+    if cube.period == "doy":
+        return _LEAP_YEAR_START + pd.to_timedelta(cube.values.columns - 1, "D")
+    return [pd.Timestamp(2000, month, 1) for month in cube.values.columns]
+
+
+@timed()
+def build_seasonal_figure(cube, asset, from_year, to_year, y_title):
+    """One line per year in range over the shaded 5-year min/max band."""
+    x = _x_axis(cube)
+    first, last = cube.band_years
+    fig = go.Figure()
+
+    fig.add_trace(
+        go.Scatter(
+            x=x,
+            y=cube.band["max"],
+            line={"width": 0},
+            hoverinfo="skip",
+            showlegend=False,
+        )
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=x,
+            y=cube.band["min"],
+            fill="tonexty",
+            fillcolor="rgba(128, 128, 128, 0.25)",
+            line={"width": 0},
+            name=f"{first}–{last} Range",
+            hoverinfo="skip",
+        )
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=x,
+            y=cube.band["mean"],
+            line={"color": "gray", "dash": "dash"},
+            name=f"{first}–{last} Average",
+        )
+    )
+
+    # Only the requested years are sliced out of the cube
+    years = cube.values.loc[from_year:to_year]
+    latest = int(cube.values.index.max())
+    for year, row in years.iterrows():
+        fig.add_trace(
+            go.Scatter(
+                x=x,
+                y=row,
+                name=str(year),
+                line={"width": 3 if year == latest else 1.5},
+            )
+        )
+
+    tickformat = "%b %d" if cube.period == "doy" else "%b"
+    fig.update_layout(
+        title=f"{asset} Seasonal Overlay",
+        legend_title_text="Year",
+        hovermode="x unified",
+        yaxis_title=y_title,
+    )
+    fig.update_xaxes(tickformat=tickformat, hoverformat=tickformat)
+
+    return fig
+
+
+# -----------------------------------------------------------------------------
+# Main Section Render
+# -----------------------------------------------------------------------------
+
+
+@timed()
+def render_seasonal_overlay(
+    kind, selected_assets, from_year, to_year, y_title
+):
+    """
+    Renders one seasonal overlay chart per selected asset from the
+    precomputed `kind` ("prices" or "refinery") cubes.
+    """
+    cubes, version = get_seasonal_cubes()
+
+    for asset in selected_assets:
+        cube = cubes[kind].get(asset)
+        if cube is None:
+            st.warning(f"No seasonal data available for {asset}.")
+            continue
+
+        # Identical selections share one figure across sessions. The axis
+        # title depends on the whole selection, so it is part of the key
+        fig = get_figure_cache().get_or_build(
+            "seasonal",
+            version,
+            (kind, asset, from_year, to_year, y_title),
+            lambda: build_seasonal_figure(
+                cube, asset, from_year, to_year, y_title
+            ),
+        )
+        st.plotly_chart(fig)
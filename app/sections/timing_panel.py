@@ -0,0 +1,59 @@
+import os
+
+import pandas as pd
+import streamlit as st
+
+from app.figure_cache import get_figure_cache
+from app.timing import (
+    METRICS_FILE_ENV,
+    debug_env_enabled,
+    reset_spans,
+    span_stats,
+)
+
+
+def debug_enabled() -> bool:
+    """The panel shows with ?debug=1 in the URL or JETDASH_DEBUG=1."""
+    return st.query_params.get("debug") == "1" or debug_env_enabled()
+
+
+def render_timing_panel():
+    """Sidebar table of per-section render timings for this process."""
+    if not debug_enabled():
+        return
+
+    with st.sidebar:
+        st.subheader("Render Timings")
+
+        stats = span_stats()
+        if stats:
+            st.dataframe(
+                pd.DataFrame(stats),
+                hide_index=True,
+                column_config={
+                    "p50_ms": st.column_config.NumberColumn(format="%.1f"),
+                    "p95_ms": st.column_config.NumberColumn(format="%.1f"),
+                    "last_ms": st.column_config.NumberColumn(format="%.1f"),
+                },
+            )
+        else:
+            st.caption("No timings recorded yet.")
+
+        cache = get_figure_cache().stats()
+        st.caption(
+            f"Figure cache: {cache['hits']} hits, {cache['misses']} misses "
+            f"({cache['hit_rate']:.0%}), "
+            f"{cache['entries']}/{cache['max_entries']} entries"
+        )
+
+        metrics_file = os.getenv(METRICS_FILE_ENV)
+        if metrics_file:
+            st.caption(f"Also appending spans to `{metrics_file}`")
+
+        if st.button("Reset timings", key="reset_timings"):
+            reset_spans()
+            st.rerun()
+
+        # Fragment reruns record spans too, but only a full rerun
+        # redraws this table
+        st.caption("Updates on full page reruns.")
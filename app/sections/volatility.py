@@ -0,0 +1,113 @@
+import plotly.express as px
+import streamlit as st
+
+from app.downsample import line_render_mode
+from app.figure_cache import get_figure_cache
+from app.rolling_stats import CORR_WINDOW, VOL_WINDOW, get_rolling_stats
+from app.timing import timed
+
+# Initial widget values (also what app/warmup.py pre-builds)
+METRIC_OPTIONS = ["Volatility", "Correlation"]
+DEFAULT_YEARS_SHOWN = 3
+
+# -----------------------------------------------------------------------------
+# Helper Functions
+# -----------------------------------------------------------------------------
+
+
+@timed()
+def build_rolling_stats_figure(frame, metric, from_year, to_year):
+    """Plots one wide rolling-stat frame (one line per column)."""
+    df_plot = (
+        frame.loc[str(from_year) : str(to_year)]
+        .rename_axis(columns="Series")
+        .reset_index()
+        .melt(id_vars="Date", var_name="Series", value_name=metric)
+        .dropna()
+    )
+
+    if metric == "Volatility":
+        title = f"{VOL_WINDOW}-Day Realized Volatility (Annualized)"
+    else:
+        title = f"{CORR_WINDOW}-Day Rolling Correlation of Daily Returns"
+
+    fig = px.line(
+        df_plot,
+        x="Date",
+        y=metric,
+        color="Series",
+        title=title,
+        render_mode=line_render_mode(len(df_plot)),
+    )
+    fig.update_layout(legend_title_text="Series", hovermode="x unified")
+
+    if metric == "Volatility":
+        fig.update_yaxes(tickformat=".0%")
+    else:
+        fig.update_yaxes(range=[-1, 1])
+
+    return fig
+
+
+# -----------------------------------------------------------------------------
+# Main Section Render
+# -----------------------------------------------------------------------------
+
+
+@st.fragment
+@timed()
+def render_volatility_section():
+    """Renders rolling volatility and cross-product correlation."""
+
+    st.header(
+        "Spot Price Volatility & Correlation",
+        divider="gray",
+        help="Computed from daily log returns of EIA Gulf Coast spot prices.",
+    )
+
+    volatility, correlation, version = get_rolling_stats()
+
+    if volatility.empty:
+        st.warning("No volatility data available to display.")
+        return
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        metric = st.radio(
+            "Metric:",
+            options=METRIC_OPTIONS,
+            horizontal=True,
+            key="rolling_stats_metric",
+        )
+
+    min_value = int(volatility.index[0].year)
+    max_value = int(volatility.index[-1].year)
+
+    with col2:
+        from_year, to_year = st.slider(
+            "Filter by Year Range:",
+            min_value=min_value,
+            max_value=max_value,
+            value=[
+                max(min_value, max_value - DEFAULT_YEARS_SHOWN),
+                max_value,
+            ],
+            key="rolling_stats_year_slider",
+        )
+
+    frame = volatility if metric == "Volatility" else correlation
+
+    # Identical selections share one figure across sessions
+    fig = get_figure_cache().get_or_build(
+        "volatility",
+        version,
+        (metric, from_year, to_year),
+        lambda: build_rolling_stats_figure(frame, metric, from_year, to_year),
+    )
+
+    st.plotly_chart(fig)
+    st.caption(
+        "Data Source: U.S. Energy Information Administration (EIA)",
+        text_alignment="right",
+    )
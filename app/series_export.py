@@ -0,0 +1,218 @@
+import io
+from typing import Callable, Iterable, Iterator
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import streamlit as st
+
+from app.analytics import data_granularity_and_aggregate_stats
+from app.dataset import Dataset
+
+# Rows serialized per chunk
+CHUNK_ROWS = 5_000
+
+# Exported files kept per process, keyed by section, version and filters
+EXPORT_CACHE_ENTRIES = 16
+
+# Columnar chunks are (Date, Asset, value) with these stable dtypes, so
+# every chunk of one file shares a schema. Values are stored as float32
+# (see app.dataset), so float32 loses nothing.
+_ASSET_DTYPE = "string"
+_VALUE_DTYPE = "float32"
+
+# Decimals written to JSON; float32 values widen to noisy float64 digits
+JSON_DECIMALS = 6
+
+
+# -----------------------------------------------------------------------------
+# Chunking
+# -----------------------------------------------------------------------------
+
+
+def frame_chunks(frames: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    """
+    Splits each frame into row slices of at most CHUNK_ROWS. An empty
+    frame is passed through once, so headers and schemas still get
+    written for an empty result.
+    """
+    for frame in frames:
+        if frame.empty:
+            yield frame
+            continue
+        for start in range(0, len(frame), CHUNK_ROWS):
+            yield frame.iloc[start : start + CHUNK_ROWS]
+
+
+def view_frames(
+    dataset: Dataset,
+    assets,
+    from_year: int,
+    to_year: int,
+    freq_selection: str = "Daily",
+    agg_method: str = "Average Price",
+    rollups=None,
+) -> Iterator[pd.DataFrame]:
+    """
+    The (Date, Asset, value) rows a section's chart is drawn from, at full
+    resolution, one asset at a time. Daily rows are slices of the shared
+    dataset and stored rollups are slices of their views, so only the
+    asset being serialized is ever held as a frame of its own.
+    """
+    columns = ["Date", "Asset", dataset.value_col]
+    found = False
+    for asset in assets:
+        rows = dataset.select([asset], from_year, to_year)
+        if rows.empty:
+            continue
+        if freq_selection == "Daily":
+            frame = rows.reset_index()
+        else:
+            frame = data_granularity_and_aggregate_stats(
+                freq_selection, agg_method, rows, rollups
+            )
+        found = True
+        yield frame[columns]
+
+    if not found:
+        # Still a valid file: just the header / schema
+        yield dataset.frame.iloc[:0].reset_index()[columns]
+
+
+def _normalize(chunk: pd.DataFrame) -> pd.DataFrame:
+    value_col = chunk.columns[-1]
+    return chunk.astype({"Asset": _ASSET_DTYPE, value_col: _VALUE_DTYPE})
+
+
+# -----------------------------------------------------------------------------
+# Serialization
+# -----------------------------------------------------------------------------
+
+
+def stream_csv(chunks: Iterable[pd.DataFrame]) -> Iterator[bytes]:
+    for i, chunk in enumerate(chunks):
+        if i and chunk.empty:
+            continue
+        yield chunk.to_csv(
+            index=False, header=(i == 0), date_format="%Y-%m-%d"
+        ).encode()
+
+
+def stream_json(chunks: Iterable[pd.DataFrame]) -> Iterator[bytes]:
+    yield b"["
+    first = True
+    for chunk in chunks:
+        if chunk.empty:
+            continue
+        records = chunk.to_json(
+            orient="records",
+            date_format="iso",
+            date_unit="s",
+            double_precision=JSON_DECIMALS,
+        )
+        # Splice each chunk's array contents into one outer array
+        yield (b"" if first else b",") + records[1:-1].encode()
+        first = False
+    yield b"]"
+
+
+def _drain(buffer: io.BytesIO) -> bytes:
+    data = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return data
+
+
+def stream_arrow(chunks: Iterable[pd.DataFrame]) -> Iterator[bytes]:
+    """Arrow IPC stream: the schema, then one record batch per chunk."""
+    buffer = io.BytesIO()
+    writer = None
+    for chunk in chunks:
+        table = pa.Table.from_pandas(_normalize(chunk), preserve_index=False)
+        if writer is None:
+            writer = pa.ipc.new_stream(buffer, table.schema)
+        writer.write_table(table)
+        yield _drain(buffer)
+    if writer is not None:
+        # Closing writes the end-of-stream marker
+        writer.close()
+        yield _drain(buffer)
+
+
+def stream_parquet(chunks: Iterable[pd.DataFrame]) -> Iterator[bytes]:
+    """Parquet file with one row group per chunk."""
+    buffer = io.BytesIO()
+    writer = None
+    for chunk in chunks:
+        table = pa.Table.from_pandas(_normalize(chunk), preserve_index=False)
+        if writer is None:
+            writer = pq.ParquetWriter(buffer, table.schema)
+        writer.write_table(table)
+        yield _drain(buffer)
+    if writer is not None:
+        # Closing writes the footer
+        writer.close()
+        yield _drain(buffer)
+
+
+# -----------------------------------------------------------------------------
+# Dashboard Downloads
+# -----------------------------------------------------------------------------
+
+# Download label -> (serializer, file extension, mime type)
+DOWNLOAD_FORMATS = {
+    "CSV": (stream_csv, "csv", "text/csv"),
+    "Parquet": (stream_parquet, "parquet", "application/vnd.apache.parquet"),
+}
+
+
+@st.cache_resource(max_entries=EXPORT_CACHE_ENTRIES)
+def export_bytes(
+    section: str,
+    version: str,
+    params,
+    fmt: str,
+    _frames: Callable[[], Iterable[pd.DataFrame]],
+) -> bytes:
+    """
+    The file for one section view, serialized chunk by chunk into a single
+    buffer and cached per (section, version, params, format).
+    """
+    stream, _, _ = DOWNLOAD_FORMATS[fmt]
+    buffer = io.BytesIO()
+    for data in stream(frame_chunks(_frames())):
+        buffer.write(data)
+    # With no views of the buffer open, getvalue() hands over the bytes
+    # BytesIO already holds instead of copying them (bytes(getbuffer())
+    # would copy)
+    return buffer.getvalue()
+
+
+def render_download_buttons(
+    section: str,
+    version: str,
+    params,
+    file_stem: str,
+    frames: Callable[[], Iterable[pd.DataFrame]],
+):
+    """
+    One download button per format for the section's current view. Files
+    are only generated when a button is clicked.
+    """
+    columns = st.columns(len(DOWNLOAD_FORMATS))
+    for column, (fmt, (_, ext, mime)) in zip(
+        columns, DOWNLOAD_FORMATS.items()
+    ):
+        with column:
+            st.download_button(
+                f"Download {fmt}",
+                data=lambda fmt=fmt: export_bytes(
+                    section, version, params, fmt, frames
+                ),
+                file_name=f"{file_stem}.{ext}",
+                mime=mime,
+                icon=":material/download:",
+                on_click="ignore",
+                key=f"{section}_download_{ext}",
+                width="stretch",
+            )
@@ -0,0 +1,25 @@
+"""
+Starts the Streamlit server with the shared caches warmed in the
+background, so the first visitor after a restart does not pay the cold
+loads. Extra arguments are passed on to `streamlit run`:
+
+    uv run python -m app.serve --server.port 8501
+"""
+
+import sys
+
+from streamlit.web import cli as stcli
+
+from app.warmup import start_warmup_thread
+
+ENTRYPOINT = "Welcome.py"
+
+
+def main():
+    start_warmup_thread()
+    sys.argv = ["streamlit", "run", ENTRYPOINT, *sys.argv[1:]]
+    sys.exit(stcli.main())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from app.dataset import Dataset
+
+# Where published datasets live. /dev/shm is RAM-backed, so every worker
+# process maps the same physical pages. Set JETDASH_SHARED_DIR to another
+# directory, or to "off" to keep a private copy per process.
+SHARED_DIR_ENV = "JETDASH_SHARED_DIR"
+DEFAULT_SHARED_DIR = (
+    Path("/dev/shm/jetdash")
+    if Path("/dev/shm").is_dir()
+    else Path(tempfile.gettempdir()) / "jetdash"
+)
+
+# Published versions kept per dataset (current + the one before it)
+KEEP_VERSIONS = 2
+
+# Part of every published directory name. /dev/shm outlives deploys, so
+# bump this whenever parsing, derived series or the stored columns and
+# dtypes change; a new build then never maps an old layout.
+LAYOUT_VERSION = 1
+
+_COLUMNS = ("dates", "codes", "values", "year", "month")
+
+
+def shared_dir() -> Path | None:
+    """The publish directory, or None if sharing is switched off."""
+    configured = os.getenv(SHARED_DIR_ENV)
+    if configured is None:
+        return DEFAULT_SHARED_DIR
+    if configured.strip().lower() in ("", "off", "0", "false"):
+        return None
+    return Path(configured)
+
+
+def _version_dir(root: Path, name: str, version: str) -> Path:
+    return root / f"{name}-v{LAYOUT_VERSION}-{version}"
+
+
+# -----------------------------------------------------------------------------
+# Publishing
+# -----------------------------------------------------------------------------
+
+
+def _write_columns(target: Path, dataset: Dataset):
+    frame = dataset.frame
+    columns = {
+        "dates": frame.index.to_numpy(),
+        "codes": frame["Asset"].cat.codes.to_numpy(),
+        "values": frame[dataset.value_col].to_numpy(),
+        "year": frame["Year"].to_numpy(),
+        "month": frame["Month"].to_numpy(),
+    }
+    for column, values in columns.items():
+        np.save(target / f"{column}.npy", values)
+
+    meta = {
+        "version": dataset.version,
+        "value_col": dataset.value_col,
+        "assets": list(dataset.assets),
+        "offsets": {a: list(bounds) for a, bounds in dataset.offsets.items()},
+    }
+    with open(target / "meta.json", "w") as f:
+        json.dump(meta, f, indent=4)
+
+
+def _prune(root: Path, name: str):
+    """
+    Drops all but the newest KEEP_VERSIONS published versions. Processes
+    still mapping a removed version keep their mapping until they let go.
+    """
+    published = sorted(
+        (p for p in root.glob(f"{name}-*") if p.is_dir()),
+        key=lambda p: p.stat().st_mtime_ns,
+        reverse=True,
+    )
+    for stale in published[KEEP_VERSIONS:]:
+        shutil.rmtree(stale, ignore_errors=True)
+
+
+def publish_dataset(name: str, dataset: Dataset, root: Path) -> Path:
+    """
+    Writes the dataset's columns as .npy files into a new version
+    directory, built under a temp name and then renamed into place.
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    final = _version_dir(root, name, dataset.version)
+
+    if not final.exists():
+        staging = Path(tempfile.mkdtemp(dir=root, prefix=f".{name}-"))
+        try:
+            _write_columns(staging, dataset)
+            os.rename(staging, final)
+        except OSError:
+            # Another worker published the same version first
+            shutil.rmtree(staging, ignore_errors=True)
+            if not final.exists():
+                raise
+
+    _prune(root, name)
+    return final
+
+
+# -----------------------------------------------------------------------------
+# Attaching
+# -----------------------------------------------------------------------------
+
+
+def attach_dataset(name: str, version: str, root: Path) -> Dataset | None:
+    """
+    Maps a published version read-only. Column buffers are views of the
+    shared files, so attaching costs no private copy of the data.
+    """
+    source = _version_dir(root, name, version)
+    try:
+        with open(source / "meta.json", "r") as f:
+            meta = json.load(f)
+        # Plain ndarray views over the read-only maps
+        columns = {
+            column: np.asarray(
+                np.load(source / f"{column}.npy", mmap_mode="r")
+            )
+            for column in _COLUMNS
+        }
+    except (FileNotFoundError, json.JSONDecodeError, ValueError):
+        return None
+
+    assets = tuple(meta["assets"])
+    dates = pd.DatetimeIndex(columns["dates"], name="Date", copy=False)
+    frame = pd.DataFrame(
+        {
+            "Asset": pd.Categorical.from_codes(
+                columns["codes"], categories=list(assets), validate=False
+            ),
+            meta["value_col"]: columns["values"],
+            "Year": columns["year"],
+            "Month": columns["month"],
+        },
+        index=dates,
+        copy=False,
+    )
+    offsets = {a: tuple(bounds) for a, bounds in meta["offsets"].items()}
+    return Dataset(frame, assets, meta["value_col"], version, offsets)
+
+
+def load_shared_dataset(
+    name: str, version: str, build: Callable[[], Dataset]
+) -> Dataset:
+    """
+    The `version` of dataset `name` from shared memory. The first process
+    to ask for a version builds and publishes it; every other process just
+    maps it. Falls back to a private `build()` if sharing is off or fails.
+    """
+    root = shared_dir()
+    if root is None or not version:
+        return build()
+
+    shared = attach_dataset(name, version, root)
+    if shared is not None:
+        return shared
+
+    dataset = build()
+    if dataset.empty:
+        return dataset
+
+    try:
+        publish_dataset(name, dataset, root)
+    except OSError as e:
+        print(f"Could not publish {name} to {root}: {e}")
+        return dataset
+    return attach_dataset(name, version, root) or dataset
@@ -0,0 +1,122 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+import numpy as np
+
+# Set to a path to also append every span to a JSONL file
+METRICS_FILE_ENV = "JETDASH_METRICS_FILE"
+# Set to 1 to show the timing panel without ?debug=1
+DEBUG_ENV = "JETDASH_DEBUG"
+
+# Recent durations kept per span for the percentiles
+MAX_SAMPLES = 512
+
+_SAMPLES: dict[str, deque] = defaultdict(lambda: deque(maxlen=MAX_SAMPLES))
+_COUNTS: dict[str, int] = defaultdict(int)
+_LOCK = threading.Lock()
+
+
+def debug_env_enabled() -> bool:
+    return os.getenv(DEBUG_ENV, "").strip().lower() in ("1", "true", "yes")
+
+
+# -----------------------------------------------------------------------------
+# Recording
+# -----------------------------------------------------------------------------
+
+
+def _append_metric(name: str, seconds: float, path: str):
+    line = json.dumps(
+        {
+            "ts": round(time.time(), 3),
+            "span": name,
+            "ms": round(seconds * 1000, 3),
+            "pid": os.getpid(),
+        }
+    )
+    try:
+        # One short O_APPEND write per line, so processes can share a file
+        with open(path, "a") as f:
+            f.write(line + "\n")
+    except OSError as e:
+        print(f"Could not write metrics to {path}: {e}")
+
+
+def record_span(name: str, seconds: float):
+    """Adds one duration to the in-process stats (and the metrics file)."""
+    with _LOCK:
+        _SAMPLES[name].append(seconds)
+        _COUNTS[name] += 1
+
+    metrics_file = os.getenv(METRICS_FILE_ENV)
+    if metrics_file:
+        _append_metric(name, seconds, metrics_file)
+
+
+@contextmanager
+def span(name: str):
+    """Times the enclosed block as `name`, even if it raises."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_span(name, time.perf_counter() - start)
+
+
+def timed(name: str | None = None):
+    """
+    Decorator form of span(). The span defaults to '<module>.<function>',
+    e.g. 'commodity.render_commodity_section'.
+    """
+
+    def decorator(func):
+        label = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(label):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# -----------------------------------------------------------------------------
+# Stats
+# -----------------------------------------------------------------------------
+
+
+def span_stats() -> list[dict]:
+    """
+    Per-span call count and p50/p95/last duration in milliseconds over
+    the most recent MAX_SAMPLES calls, slowest p95 first.
+    """
+    with _LOCK:
+        snapshot = {name: list(samples) for name, samples in _SAMPLES.items()}
+        counts = dict(_COUNTS)
+
+    stats = []
+    for name, samples in snapshot.items():
+        p50, p95 = np.percentile(samples, [50, 95]) * 1000
+        stats.append(
+            {
+                "span": name,
+                "calls": counts[name],
+                "p50_ms": float(p50),
+                "p95_ms": float(p95),
+                "last_ms": samples[-1] * 1000,
+            }
+        )
+    return sorted(stats, key=lambda s: s["p95_ms"], reverse=True)
+
+
+def reset_spans():
+    with _LOCK:
+        _SAMPLES.clear()
+        _COUNTS.clear()
@@ -0,0 +1,128 @@
+import logging
+import threading
+import time
+
+from streamlit.runtime import Runtime
+
+from app import default_views
+from app.dataset import get_commodity_data, get_refinery_data
+from app.price_matrix import get_commodity_series
+from app.rolling_stats import get_rolling_stats
+from app.rollups import get_spot_rollups
+from app.seasonal import get_seasonal_cubes
+from app.sections import commodity
+from app.sections.llm_prediction import load_prediction
+from app.sections.news import load_data
+
+# How long to wait for the Streamlit runtime before warming anyway
+RUNTIME_WAIT_SECONDS = 30
+WARMUP_THREAD_NAME = "cache-warmup"
+
+_STATUS = {
+    "state": "idle",
+    "started_at": None,
+    "duration_s": None,
+    "steps": {},
+    "error": None,
+}
+_LOCK = threading.Lock()
+
+
+def _set_status(**changes):
+    with _LOCK:
+        _STATUS.update(changes)
+
+
+def warmup_status() -> dict:
+    """
+    Snapshot of the startup warmup: 'state' is idle, running, ready or
+    failed; 'steps' maps each step to its duration in seconds.
+    """
+    with _LOCK:
+        return {**_STATUS, "steps": dict(_STATUS["steps"])}
+
+
+# -----------------------------------------------------------------------------
+# Steps
+# -----------------------------------------------------------------------------
+
+
+def _warm_commodity_figure():
+    """The default commodity chart plus the trend badges under it."""
+    if default_views.commodity_figure() is None:
+        return
+    dataset = get_commodity_series()
+    commodity.get_price_trends(dataset.version, dataset)
+
+
+WARMUP_STEPS = {
+    "datasets": lambda: (get_commodity_data(), get_refinery_data()),
+    "rollups": get_spot_rollups,
+    "commodity_series": get_commodity_series,
+    "rolling_stats": get_rolling_stats,
+    "seasonal_cubes": get_seasonal_cubes,
+    "news": load_data,
+    "prediction": load_prediction,
+    "commodity_figure": _warm_commodity_figure,
+    "volatility_figure": default_views.volatility_figure,
+    "refinery_figure": default_views.refinery_figure,
+    "lead_lag_figure": default_views.lead_lag_figure,
+}
+
+
+# -----------------------------------------------------------------------------
+# Warmup
+# -----------------------------------------------------------------------------
+
+
+def warm_caches():
+    """Runs every warmup step in order, recording per-step durations."""
+    started = time.perf_counter()
+    _set_status(state="running", started_at=time.time(), steps={})
+
+    try:
+        for name, step in WARMUP_STEPS.items():
+            step_started = time.perf_counter()
+            step()
+            with _LOCK:
+                _STATUS["steps"][name] = time.perf_counter() - step_started
+    except Exception as e:
+        _set_status(state="failed", error=repr(e))
+        print(f"Cache warmup failed: {e!r}")
+        return
+    finally:
+        _set_status(duration_s=time.perf_counter() - started)
+
+    _set_status(state="ready")
+    print(f"Cache warmup ready in {_STATUS['duration_s']:.2f}s")
+
+
+class _NoSessionWarningFilter(logging.Filter):
+    """The warmup thread has no session by design; drop that warning."""
+
+    def filter(self, record):
+        return not (
+            record.threadName == WARMUP_THREAD_NAME
+            and "missing ScriptRunContext" in record.getMessage()
+        )
+
+
+def _wait_and_warm():
+    # st.cache_data lives in the runtime's storage, so let it start first
+    deadline = time.monotonic() + RUNTIME_WAIT_SECONDS
+    while not Runtime.exists() and time.monotonic() < deadline:
+        time.sleep(0.1)
+    warm_caches()
+
+
+def start_warmup_thread() -> threading.Thread:
+    """Warms the shared caches in the background and returns the thread."""
+    logging.getLogger(
+        "streamlit.runtime.scriptrunner_utils.script_run_context"
+    ).addFilter(_NoSessionWarningFilter())
+
+    thread = threading.Thread(
+        target=_wait_and_warm, name=WARMUP_THREAD_NAME, daemon=True
+    )
+    thread.start()
+    return thread
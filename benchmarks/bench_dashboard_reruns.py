@@ -0,0 +1,82 @@
+"""
+Measure the server time of one Dashboard interaction when the whole page
+reruns versus when only the section (fragment) owning the widget reruns.
+
+AppTest always executes the full script it is given, so the fragment case
+runs a script containing just that section: exactly the code a
+fragment-scoped rerun executes.
+
+Run from the repository root:
+
+    uv run python -m benchmarks.bench_dashboard_reruns
+"""
+
+import statistics
+import time
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+DASHBOARD = Path(__file__).parents[1] / "pages" / "1_Dashboard.py"
+RERUNS = 20
+
+# name -> (section module, render function, interaction)
+INTERACTIONS = {
+    "news next/prev": (
+        "app.sections.news",
+        "render_news_section",
+        lambda at, i: at.button(
+            key="news_next" if i % 2 == 0 else "news_prev"
+        ).click(),
+    ),
+    "commodity mode": (
+        "app.sections.commodity",
+        "render_commodity_section",
+        lambda at, i: at.radio(key="commodity_chart_mode").set_value(
+            ["Seasonal Overlay", "Time Series"][i % 2]
+        ),
+    ),
+    "volatility metric": (
+        "app.sections.volatility",
+        "render_volatility_section",
+        lambda at, i: at.radio(key="rolling_stats_metric").set_value(
+            ["Correlation", "Volatility"][i % 2]
+        ),
+    ),
+    "refinery mode": (
+        "app.sections.refinery",
+        "render_refinery_section",
+        lambda at, i: at.radio(key="refinery_chart_mode").set_value(
+            ["Seasonal Overlay", "Time Series"][i % 2]
+        ),
+    ),
+}
+
+
+def measure(at: AppTest, interact) -> tuple[float, float]:
+    """Returns (median ms, p95 ms) of interaction + rerun."""
+    at.run()  # Cold run, fills the caches
+
+    timings = []
+    for i in range(RERUNS):
+        interact(at, i)
+        start = time.perf_counter()
+        at.run()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    return statistics.median(timings), p95
+
+
+if __name__ == "__main__":
+    print(f"{'interaction':<20}{'scope':<10}{'median ms':>12}{'p95 ms':>12}")
+    for name, (module, function, interact) in INTERACTIONS.items():
+        full = AppTest.from_file(str(DASHBOARD), default_timeout=120)
+        fragment = AppTest.from_string(
+            f"from {module} import {function}\n{function}()",
+            default_timeout=120,
+        )
+        for scope, at in [("page", full), ("fragment", fragment)]:
+            median, p95 = measure(at, interact)
+            print(f"{name:<20}{scope:<10}{median:>12.1f}{p95:>12.1f}")
@@ -0,0 +1,75 @@
+"""
+Compare the per-rerun cost of handing the dashboard datasets to a session
+through `st.cache_data` (pickled copy per call) versus `st.cache_resource`
+(one shared read-only instance).
+
+Run from the repository root:
+
+    uv run python -m benchmarks.bench_dataset_cache
+"""
+
+import statistics
+import time
+import tracemalloc
+
+import streamlit as st
+
+from app.dataset import (
+    REFINERY_FILE,
+    SPOT_PRICES_FILE,
+    load_refinery_json,
+    load_spot_prices_json,
+    to_dataset,
+)
+
+RERUNS = 50
+
+
+def _load_both():
+    return (
+        to_dataset(load_spot_prices_json(SPOT_PRICES_FILE), "Price"),
+        to_dataset(load_refinery_json(REFINERY_FILE), "Production"),
+    )
+
+
+@st.cache_data
+def load_with_cache_data():
+    return _load_both()
+
+
+@st.cache_resource
+def load_with_cache_resource():
+    return _load_both()
+
+
+def measure(loader):
+    """Returns (median rerun ms, p95 rerun ms, bytes retained per session)."""
+    loader()  # Cold load, not part of the rerun numbers
+
+    timings = []
+    for _ in range(RERUNS):
+        start = time.perf_counter()
+        loader()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    # Each session keeps whatever the rerun handed back alive until the
+    # next rerun, so what is allocated by one call is the per-session cost.
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    held = loader()  # noqa: F841
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings.sort()
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    return statistics.median(timings), p95, after - before
+
+
+if __name__ == "__main__":
+    print(f"{'layer':<16}{'median ms':>12}{'p95 ms':>12}{'KiB/session':>14}")
+    for name, loader in [
+        ("cache_data", load_with_cache_data),
+        ("cache_resource", load_with_cache_resource),
+    ]:
+        median, p95, retained = measure(loader)
+        print(f"{name:<16}{median:>12.3f}{p95:>12.3f}{retained / 1024:>14.1f}")
@@ -0,0 +1,35 @@
+"""
+Measure the Dashboard's time to full render for a new session: the server
+time from the start of the first script run until every section has been
+sent, with the data caches already warm.
+
+Run from the repository root:
+
+    uv run python -m benchmarks.bench_first_render
+"""
+
+import statistics
+import time
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+DASHBOARD = Path(__file__).parents[1] / "pages" / "1_Dashboard.py"
+SESSIONS = 5
+
+
+def first_render_ms() -> float:
+    """One new session's first run of the Dashboard, in milliseconds."""
+    at = AppTest.from_file(str(DASHBOARD), default_timeout=120)
+    start = time.perf_counter()
+    at.run()
+    return (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    first_render_ms()  # Warm the shared caches, not part of the numbers
+
+    timings = [first_render_ms() for _ in range(SESSIONS)]
+    print(f"{'sessions':<10}{'median ms':>12}{'max ms':>12}")
+    median, worst = statistics.median(timings), max(timings)
+    print(f"{SESSIONS:<10}{median:>12.1f}{worst:>12.1f}")
@@ -0,0 +1,93 @@
+"""
+Compare the private (unshared) memory a worker process pays for the spot
+and refinery datasets when it parses its own copy versus when it maps the
+copy published by app.shared_store. Linux only (reads /proc smaps_rollup).
+
+Run from the repository root:
+
+    uv run python -m benchmarks.bench_shared_dataset
+"""
+
+import multiprocessing as mp
+import tempfile
+from pathlib import Path
+
+from app.dataset import (
+    REFINERY_FILE,
+    SPOT_PRICES_FILE,
+    load_refinery_json,
+    load_spot_prices_json,
+    to_dataset,
+)
+from app.fingerprint import data_version
+from app.shared_store import attach_dataset, publish_dataset
+
+WORKERS = 4
+
+
+def private_kib() -> int:
+    """Private_Clean + Private_Dirty of this process, in KiB."""
+    total = 0
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            if line.startswith(("Private_Clean:", "Private_Dirty:")):
+                total += int(line.split()[1])
+    return total
+
+
+def _build(versions):
+    return (
+        to_dataset(
+            load_spot_prices_json(SPOT_PRICES_FILE), "Price", versions[0]
+        ),
+        to_dataset(
+            load_refinery_json(REFINERY_FILE), "Production", versions[1]
+        ),
+    )
+
+
+def _touch(datasets):
+    # Read every column so mapped pages are actually faulted in
+    return sum(float(d.frame[d.value_col].sum()) for d in datasets)
+
+
+def worker(mode, root, versions, results):
+    before = private_kib()
+    if mode == "private":
+        datasets = _build(versions)
+    else:
+        datasets = (
+            attach_dataset("commodity", versions[0], root),
+            attach_dataset("refinery", versions[1], root),
+        )
+    _touch(datasets)
+    results.put(private_kib() - before)
+
+
+def measure(mode, root, versions) -> list[int]:
+    results = mp.Queue()
+    procs = [
+        mp.Process(target=worker, args=(mode, root, versions, results))
+        for _ in range(WORKERS)
+    ]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+    return [results.get() for _ in procs]
+
+
+if __name__ == "__main__":
+    mp.set_start_method("fork")
+    versions = (data_version(SPOT_PRICES_FILE), data_version(REFINERY_FILE))
+    spot, refinery = _build(versions)
+
+    with tempfile.TemporaryDirectory(dir="/dev/shm") as tmp:
+        root = Path(tmp)
+        publish_dataset("commodity", spot, root)
+        publish_dataset("refinery", refinery, root)
+
+        print(f"{'mode':<10}{'private KiB per worker':>26}")
+        for mode in ("private", "shared"):
+            per_worker = measure(mode, root, versions)
+            print(f"{mode:<10}{max(per_worker):>26}")
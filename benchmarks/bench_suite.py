@@ -0,0 +1,321 @@
+"""
+Times and measures peak memory of the data pipeline on synthetic EIA data
+at 1x, 10x and 100x the real size (see benchmarks/synthetic_eia.py):
+
+- save_merged_data: a weekly update merged into the full history file
+- load_spot_prices_json / load_refinery_json
+- data_granularity_and_aggregate_stats, resampled and from rollups
+- the dashboard filter step (Dataset.select)
+
+Results are written as JSON. With --compare, a stored baseline is loaded
+and any case that got slower or hungrier past the thresholds is flagged
+(exit status 1). Run from the repository root:
+
+    uv run python -m benchmarks.bench_suite --output benchmarks/baseline.json
+    uv run python -m benchmarks.bench_suite --compare benchmarks/baseline.json
+"""
+
+import argparse
+import contextlib
+import datetime as dt
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# app.get_data refuses to import without a key; nothing here calls EIA
+os.environ.setdefault("EIA_API_KEY", "benchmark")
+
+from app.analytics import data_granularity_and_aggregate_stats  # noqa E402
+from app.dataset import (  # noqa E402
+    load_refinery_json,
+    load_spot_prices_json,
+    to_dataset,
+)
+from app.get_data import save_merged_data  # noqa E402
+from app.rollups import ROLLUP_AGGS, ROLLUP_FREQS, compute_rollups  # noqa E402
+from benchmarks.synthetic_eia import (  # noqa E402
+    SCALES,
+    refinery_records,
+    spot_records,
+)
+
+DEFAULT_OUTPUT = Path("benchmarks/results/latest.json")
+
+# Timed repetitions per case; fewer at the sizes where one run is slow
+REPEATS = {1: 7, 10: 5, 100: 3}
+
+# Flag a case when it is this much slower / uses this much more memory
+TIME_THRESHOLD = 0.25
+MEMORY_THRESHOLD = 0.10
+# Differences below these are noise, whatever the ratio
+TIME_FLOOR_MS = 1.0
+MEMORY_FLOOR_KIB = 256
+
+# Business days in the weekly update merged by save_merged_data
+UPDATE_DAYS = 5
+
+
+# -----------------------------------------------------------------------------
+# Measurement
+# -----------------------------------------------------------------------------
+
+
+def measure(fn, repeats: int, setup=None) -> dict:
+    """
+    Median/min wall time over `repeats` runs, then one traced run for the
+    peak memory. `setup` runs untimed before each run.
+    """
+    timings = []
+    for _ in range(repeats):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    if setup:
+        setup()
+    # Separate run: tracemalloc slows allocation-heavy code down
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "min_ms": round(min(timings), 3),
+        "peak_kib": round(peak / 1024, 1),
+        "repeats": repeats,
+    }
+
+
+def _quiet(fn):
+    """The pipeline prints progress; keep it out of the results table."""
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return fn()
+
+    return run
+
+
+def _rollup_views(spot_df: pd.DataFrame) -> dict:
+    """The same views app.rollups serves to the dashboard."""
+    rollups = compute_rollups(spot_df)
+    views = {}
+    for freq_label, freq in ROLLUP_FREQS.items():
+        for agg_label, agg in ROLLUP_AGGS.items():
+            view = rollups[(rollups["freq"] == freq) & (rollups["agg"] == agg)]
+            views[(freq_label, agg_label)] = to_dataset(
+                view[["Date", "Price", "Asset"]], "Price"
+            )
+    return views
+
+
+# -----------------------------------------------------------------------------
+# Cases
+# -----------------------------------------------------------------------------
+
+
+def run_scale(scale: int, workdir: Path) -> dict:
+    """Every case at one scale: {case name: measurement}."""
+    repeats = REPEATS[scale]
+    spot = spot_records(scale)
+    refinery = refinery_records(scale)
+
+    spot_file = workdir / f"spot_prices_{scale}x.json"
+    refinery_file = workdir / f"refinery_utilization_{scale}x.json"
+    with open(spot_file, "w") as f:
+        json.dump(spot, f, indent=4)
+    with open(refinery_file, "w") as f:
+        json.dump(refinery, f, indent=4)
+
+    # A weekly update: the newest days again (revised) plus the history
+    latest = sorted({r["period"] for r in spot}, reverse=True)[:UPDATE_DAYS]
+    update = [r for r in spot if r["period"] in latest]
+    merge_file = workdir / f"merge_{scale}x.json"
+
+    def reset_merge_file():
+        # Every merge starts from the full history
+        shutil.copyfile(spot_file, merge_file)
+
+    spot_df = load_spot_prices_json(spot_file)
+    dataset = to_dataset(spot_df, "Price")
+    rollups = _rollup_views(spot_df)
+    assets = list(dataset.assets)
+    min_year, max_year = dataset.year_range
+    from_year = max(min_year, max_year - 5)
+    filtered = dataset.select(assets, min_year, max_year)
+
+    cases = {
+        "save_merged_data": _quiet(
+            lambda: save_merged_data(update, str(merge_file))
+        ),
+        "load_spot_prices_json": lambda: load_spot_prices_json(spot_file),
+        "load_refinery_json": lambda: load_refinery_json(refinery_file),
+        "aggregate_weekly_mean_resample": lambda: (
+            data_granularity_and_aggregate_stats(
+                "Weekly", "Average Price", filtered
+            )
+        ),
+        "aggregate_weekly_mean_rollups": lambda: (
+            data_granularity_and_aggregate_stats(
+                "Weekly", "Average Price", filtered, rollups
+            )
+        ),
+        "aggregate_monthly_close_rollups": lambda: (
+            data_granularity_and_aggregate_stats(
+                "Monthly", "Close Price", filtered, rollups
+            )
+        ),
+        "filter_one_asset_5y": lambda: dataset.select(
+            assets[:1], from_year, max_year
+        ),
+        "filter_all_assets_5y": lambda: dataset.select(
+            assets, from_year, max_year
+        ),
+    }
+
+    setups = {"save_merged_data": reset_merge_file}
+
+    results = {}
+    for name, fn in cases.items():
+        results[name] = measure(fn, repeats, setups.get(name))
+        print(f"  {name:<34}{results[name]['median_ms']:>12.2f} ms")
+    results["_size"] = {
+        "spot_records": len(spot),
+        "refinery_records": len(refinery),
+        "spot_assets": len(assets),
+    }
+    return results
+
+
+def run_suite(scales) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for scale in scales:
+            print(f"scale {scale}x")
+            results[f"{scale}x"] = run_scale(scale, Path(tmp))
+
+    return {
+        "meta": {
+            "created": dt.datetime.now(dt.timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+# -----------------------------------------------------------------------------
+# Comparison
+# -----------------------------------------------------------------------------
+
+
+def compare(
+    baseline: dict,
+    current: dict,
+    time_threshold: float = TIME_THRESHOLD,
+    memory_threshold: float = MEMORY_THRESHOLD,
+) -> list[str]:
+    """
+    Prints a side-by-side table and returns the cases that regressed:
+    slower or bigger by more than the threshold ratio and the noise floor.
+    """
+    regressions = []
+    print(
+        f"{'case':<42}{'base ms':>10}{'now ms':>10}{'Δ':>8}"
+        f"{'base KiB':>12}{'now KiB':>12}{'Δ':>8}"
+    )
+    for scale, cases in current["results"].items():
+        base_cases = baseline.get("results", {}).get(scale, {})
+        for name, now in cases.items():
+            base = base_cases.get(name)
+            if name.startswith("_") or base is None:
+                continue
+
+            time_delta = now["median_ms"] / max(base["median_ms"], 1e-9) - 1
+            mem_delta = now["peak_kib"] / max(base["peak_kib"], 1e-9) - 1
+            slower = (
+                time_delta > time_threshold
+                and now["median_ms"] - base["median_ms"] > TIME_FLOOR_MS
+            )
+            bigger = (
+                mem_delta > memory_threshold
+                and now["peak_kib"] - base["peak_kib"] > MEMORY_FLOOR_KIB
+            )
+            flag = " <- REGRESSION" if slower or bigger else ""
+            if flag:
+                regressions.append(f"{scale}/{name}")
+
+            print(
+                f"{scale + '/' + name:<42}"
+                f"{base['median_ms']:>10.2f}{now['median_ms']:>10.2f}"
+                f"{time_delta:>+8.0%}"
+                f"{base['peak_kib']:>12.0f}{now['peak_kib']:>12.0f}"
+                f"{mem_delta:>+8.0%}{flag}"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Data pipeline benchmarks")
+    parser.add_argument(
+        "--scales",
+        type=int,
+        nargs="+",
+        default=list(SCALES),
+        choices=list(SCALES),
+    )
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument(
+        "--compare", type=Path, help="baseline results to check against"
+    )
+    parser.add_argument(
+        "--results",
+        type=Path,
+        help="compare these stored results instead of running the suite",
+    )
+    parser.add_argument("--time-threshold", type=float, default=TIME_THRESHOLD)
+    parser.add_argument(
+        "--memory-threshold", type=float, default=MEMORY_THRESHOLD
+    )
+    args = parser.parse_args()
+
+    if args.results:
+        with open(args.results, "r") as f:
+            current = json.load(f)
+    else:
+        current = run_suite(args.scales)
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=4)
+        print(f"Saved results to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+        regressions = compare(
+            baseline, current, args.time_threshold, args.memory_threshold
+        )
+        if regressions:
+            print(f"Regressions: {', '.join(regressions)}")
+            sys.exit(1)
+        print("No regressions against the baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Synthetic EIA API v2 records shaped like data/spot_prices.json and
+data/refinery_utilization.json, for benchmarking at scaled sizes.
+
+A scale multiplies the real data size by adding series and extending the
+history back in time (see SCALES). Output is deterministic per seed.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Scale -> (series multiplier, history multiplier)
+SCALES = {1: (1, 1), 10: (2, 5), 100: (10, 10)}
+
+# Roughly the size of the real files at 1x
+SPOT_END = "2026-03-09"
+SPOT_BUSINESS_DAYS = 1_706
+REFINERY_END = "2025-12"
+REFINERY_MONTHS = 396
+
+# (series id, product, product name, description) of the real spot series
+SPOT_SERIES = [
+    (
+        "EER_EPJK_PF4_RGC_DPG",
+        "EPJK",
+        "Kerosene-Type Jet Fuel",
+        "U.S. Gulf Coast Kerosene-Type Jet Fuel Spot Price FOB (Dollars per Gallon)",  # noqa E501
+    ),
+    (
+        "EER_EPD2DXL0_PF4_RGC_DPG",
+        "EPD2DXL0",
+        "No 2 Diesel Low Sulfur (0-15 ppm)",
+        "U.S. Gulf Coast Ultra-Low Sulfur No 2 Diesel Spot Price (Dollars per Gallon)",  # noqa E501
+    ),
+    (
+        "EER_EPMRU_PF4_RGC_DPG",
+        "EPMRU",
+        "Conventional Regular Gasoline",
+        "U.S. Gulf Coast Conventional Gasoline Regular Spot Price FOB (Dollars per Gallon)",  # noqa E501
+    ),
+]
+
+# (area, area name, series prefix, product, product name) of the real
+# refinery series; each comes in a monthly total and a per-day variant
+REFINERY_SERIES = [
+    ("NUS", "U.S.", "MDIRX_NUS", "EPD0", "Distillate Fuel Oil"),
+    ("R30", "PADD 3", "MDIRX_R30", "EPD0", "Distillate Fuel Oil"),
+    ("R30", "PADD 3", "MG4RX_R30", "EPM0CAG", "Conventional Motor Gasoline"),
+    ("NUS", "U.S.", "MG6RX_NUS", "EPM0CO", "Other Conventional Motor Gasoline"),  # noqa E501
+    ("NUS", "U.S.", "M_EPJKC_YPY_NUS", "EPJKC", "Commercial Kerosene-Type Jet Fuel"),  # noqa E501
+    ("R30", "PADD 3", "M_EPJKC_YPY_R30", "EPJKC", "Commercial Kerosene-Type Jet Fuel"),  # noqa E501
+]
+_AREA_LABELS = {"NUS": "U.S.", "R30": "Gulf Coast (PADD 3)"}
+
+
+def _random_walk(rng, n: int, start: float, step: float) -> np.ndarray:
+    walk = start + np.cumsum(rng.normal(0, step, n))
+    return np.maximum(walk, start * 0.1)
+
+
+def _spot_series(multiplier: int):
+    """The real spot series, plus synthetic Gulf Coast products."""
+    series = list(SPOT_SERIES)
+    for i in range(len(SPOT_SERIES) * (multiplier - 1)):
+        series.append(
+            (
+                f"EER_SYN{i:03d}_PF4_RGC_DPG",
+                f"SYN{i:03d}",
+                f"Synthetic Product {i}",
+                f"U.S. Gulf Coast Synthetic Product {i} Spot Price FOB (Dollars per Gallon)",  # noqa E501
+            )
+        )
+    return series
+
+
+def spot_records(scale: int = 1, seed: int = 0) -> list[dict]:
+    """Daily spot price records, newest first like the EIA API."""
+    series_mult, history_mult = SCALES[scale]
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(
+        end=SPOT_END, periods=SPOT_BUSINESS_DAYS * history_mult
+    ).strftime("%Y-%m-%d")[::-1]
+
+    records = []
+    for series_id, product, product_name, description in _spot_series(
+        series_mult
+    ):
+        values = _random_walk(rng, len(dates), 2.5, 0.03)
+        for period, value in zip(dates, values):
+            records.append(
+                {
+                    "period": period,
+                    "duoarea": "RGC",
+                    "area-name": "NA",
+                    "product": product,
+                    "product-name": product_name,
+                    "process": "PF4",
+                    "process-name": "Spot Price FOB",
+                    "series": series_id,
+                    "series-description": description,
+                    "value": f"{value:.3f}",
+                    "units": "$/GAL",
+                }
+            )
+    records.sort(key=lambda r: r["period"], reverse=True)
+    return records
+
+
+def _refinery_series(multiplier: int):
+    series = list(REFINERY_SERIES)
+    for i in range(len(REFINERY_SERIES) * (multiplier - 1)):
+        area = "R30" if i % 2 else "NUS"
+        series.append(
+            (
+                area,
+                "PADD 3" if area == "R30" else "U.S.",
+                f"MSYN{i:03d}_{area}",
+                f"SYN{i:03d}",
+                f"Synthetic Product {i}",
+            )
+        )
+    return series
+
+
+def refinery_records(scale: int = 1, seed: int = 0) -> list[dict]:
+    """
+    Monthly refinery net production records, newest first. Every series
+    has a 'Thousand Barrels' and a 'Thousand Barrels per Day' variant, as
+    in the real file, so the loader's per-day filter has work to do.
+    """
+    series_mult, history_mult = SCALES[scale]
+    rng = np.random.default_rng(seed)
+    periods = pd.period_range(
+        end=REFINERY_END, periods=REFINERY_MONTHS * history_mult, freq="M"
+    )
+    labels = periods.strftime("%Y-%m")[::-1]
+    days = periods.days_in_month.to_numpy()[::-1]
+
+    records = []
+    for area, area_name, prefix, product, product_name in _refinery_series(
+        series_mult
+    ):
+        per_day = _random_walk(rng, len(labels), 800.0, 15.0)
+        description = (
+            f"{_AREA_LABELS[area]} Refinery Net Production of {product_name}"
+        )
+        for suffix, units, values in [
+            ("1", "MBBL", per_day * days),
+            ("2", "MBBL/D", per_day),
+        ]:
+            unit_label = (
+                "Thousand Barrels" if units == "MBBL"
+                else "Thousand Barrels per Day"
+            )
+            for period, value in zip(labels, values):
+                records.append(
+                    {
+                        "period": period,
+                        "duoarea": area,
+                        "area-name": area_name,
+                        "product": product,
+                        "product-name": product_name,
+                        "process": "YPY",
+                        "process-name": "Refinery Net Production",
+                        "series": f"{prefix}_{suffix}",
+                        "series-description": f"{description} ({unit_label})",
+                        "value": f"{value:.0f}",
+                        "units": units,
+                    }
+                )
+    records.sort(key=lambda r: r["period"], reverse=True)
+    return records
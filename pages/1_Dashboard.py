@@ -1,9 +1,12 @@
 import streamlit as st
 
 from app.sections.commodity import render_commodity_section
+from app.sections.lead_lag import render_lead_lag_section
 from app.sections.llm_prediction import render_llm_section
 from app.sections.news import render_news_section
 from app.sections.refinery import render_refinery_section
+from app.sections.timing_panel import render_timing_panel
+from app.sections.volatility import render_volatility_section
 
 st.set_page_config(
     page_title="Dashboard",
@@ -17,23 +20,37 @@ st.markdown(
     """
     ## Index
     1. Jet Fuel & Other Middle Distillates Spot Prices
-    2. US Refinery Utilization Rates for Relevant Products
-    3. Jet Fuel Current Events and News
-    4. Market Analysis by John the Eagle (LLM)
+    2. Spot Price Volatility & Correlation
+    3. US Refinery Utilization Rates for Relevant Products
+    4. Price & Refinery Lead/Lag
+    5. Jet Fuel Current Events and News
+    6. Market Analysis by John the Eagle (LLM)
     """
 )
 
+# Every render_*_section below is an st.fragment: touching a widget reruns
+# only the section it belongs to, not the rest of the page.
 
 # -----------------------------------------------------------------------------
 # Commodity Price Visualization Section (commodity.py)
 # -----------------------------------------------------------------------------
 render_commodity_section()
 
+# -----------------------------------------------------------------------------
+# Volatility & Correlation Section (volatility.py)
+# -----------------------------------------------------------------------------
+render_volatility_section()
+
 # -----------------------------------------------------------------------------
 # Refinery Section (refinery.py)
 # -----------------------------------------------------------------------------
 render_refinery_section()
 
+# -----------------------------------------------------------------------------
+# Lead/Lag Section (lead_lag.py)
+# -----------------------------------------------------------------------------
+render_lead_lag_section()
+
 # -----------------------------------------------------------------------------
 # News Section (news.py)
 # Powered by Argus Media
@@ -67,6 +84,11 @@ st.write("Check out our weekly market report on U.S. Gulf Coast Jetfuel.")
 
 st.page_link("pages/2_Analysis.py", label="Go to Analysis Page", icon="📈")
 
+# -----------------------------------------------------------------------------
+# Render Timings (timing_panel.py), shown with ?debug=1
+# -----------------------------------------------------------------------------
+render_timing_panel()
+
 # -----------------------------------------------------------------------------
 # Footer Section (footer.py)
 # -----------------------------------------------------------------------------
@@ -4,6 +4,7 @@ from app.sections.analysis.current_report import render_current_report_section
 from app.sections.analysis.historical_reports import (
     render_historical_report_section,
 )
+from app.sections.timing_panel import render_timing_panel
 
 st.title("Market Analysis")
 
@@ -15,3 +16,6 @@ st.write("")
 
 # 2. Historical Archive
 render_historical_report_section()
+
+# Render timings, shown with ?debug=1
+render_timing_panel()
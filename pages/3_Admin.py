@@ -1,23 +1,25 @@
-import json
-
 import streamlit as st
 
 from app.extract_article import extract_article_info
+from app.sections.analysis.actuals import (
+    FLAT_THRESHOLD_PCT,
+    jet_fuel_closes,
+    resolve_actuals,
+    weekly_changes,
+)
 from app.sections.analysis.report_renderer import (
     load_all_reports,
     load_report,
     save_report,
 )
+from app.sections.analysis.report_store import get_report_store
+from app.sections.news import get_article_details, load_data
+from app.warmup import warmup_status
 
 st.set_page_config(page_title="Admin", page_icon="\U0001f512")
 
 # Load current week
-CURRENT_WEEK_JSON_DATA = "data/current_week.json"
-CURRENT_WEEK = 1
-
-with open(CURRENT_WEEK_JSON_DATA, "r") as json_file:
-    data = json.load(json_file)
-    CURRENT_WEEK = data.get("current_week", CURRENT_WEEK)
+CURRENT_WEEK = get_report_store().current_week
 
 # ---------------------------------------------------------------------------
 # Authentication Gate
@@ -43,11 +45,23 @@ if not st.session_state.admin_authenticated:
 # Authenticated content below
 # ---------------------------------------------------------------------------
 
+# Startup cache warmup (only runs when served through app/serve.py)
+warmup = warmup_status()
+if warmup["state"] == "ready":
+    st.caption(f"Cache warmup: ready in {warmup['duration_s']:.2f}s")
+elif warmup["state"] == "failed":
+    st.caption(f"Cache warmup: failed ({warmup['error']})")
+else:
+    st.caption(f"Cache warmup: {warmup['state']}")
+
+existing_report = load_report(CURRENT_WEEK)
+
 # Initialize session state for articles
 if "admin_articles" not in st.session_state:
-    existing = load_report(CURRENT_WEEK)
-    if existing:
-        st.session_state.admin_articles = existing.get("selected_articles", [])
+    if existing_report:
+        st.session_state.admin_articles = existing_report.get(
+            "selected_articles", []
+        )
     else:
         st.session_state.admin_articles = []
 
@@ -59,8 +73,6 @@ if "extracted_article" not in st.session_state:
 # ---------------------------------------------------------------------------
 st.header(f"Create/Edit Week {CURRENT_WEEK} Report", divider="gray")
 
-existing_report = load_report(CURRENT_WEEK)
-
 DIRECTION_OPTIONS = ["\u2b06\ufe0f Up", "\u2b07\ufe0f Down", "\u27a1\ufe0f Flat", "\u2753 Uncertain"]
 DIRECTION_MAP = {
     "\u2b06\ufe0f Up": "\u2b06\ufe0f",
@@ -111,15 +123,61 @@ with st.form("report_form"):
 # ---------------------------------------------------------------------------
 st.subheader("Add Articles")
 
-url_input = st.text_input("Paste article URL:", key="article_url_input")
+# Argus articles already scraped into the news cache, keyed by link
+cached_articles = {}
+for cached in load_data():
+    title, summary, date, link = get_article_details(cached)
+    if link:
+        cached_articles[link] = {
+            "title": title,
+            "summary": summary,
+            "date": date,
+            "link": link,
+        }
+
+added_links = {art.get("link") for art in st.session_state.admin_articles}
+pickable_links = [
+    link for link in cached_articles if link not in added_links
+]
+
+if pickable_links:
+    picked_link = st.selectbox(
+        "Pick from cached Argus articles (type to search):",
+        pickable_links,
+        index=None,
+        format_func=lambda link: (
+            f"{cached_articles[link]['date']} — "
+            f"{cached_articles[link]['title']}"
+        ),
+        key="cached_article_picker",
+    )
+
+    if st.button("Add Selected Article", disabled=picked_link is None):
+        picked = cached_articles[picked_link]
+        st.session_state.admin_articles.append(
+            {
+                "title": picked["title"],
+                "summary": picked["summary"],
+                "analyst_note": None,
+                "date": picked["date"],
+                "link": picked["link"],
+            }
+        )
+        st.rerun()
+
+url_input = st.text_input("Or paste article URL:", key="article_url_input")
 
 if st.button("Extract with Gemini"):
-    if url_input.strip():
+    url = url_input.strip()
+    if url in cached_articles:
+        # Already scraped, no need to fetch the page or call Gemini
+        st.session_state.extracted_article = dict(cached_articles[url])
+    elif url:
         with st.spinner("Extracting article info..."):
-            result = extract_article_info(url_input.strip())
+            result = extract_article_info(url)
         if result:
             st.session_state.extracted_article = result
-            st.session_state.extracted_article["link"] = url_input.strip()
+            st.session_state.extracted_article["link"] = url
         else:
             st.error("Failed to extract article information.")
     else:
@@ -166,6 +224,11 @@ if st.session_state.admin_articles:
 # ---------------------------------------------------------------------------
 st.header("Update Historical Actuals", divider="gray")
 
+# Set just before a rerun, so it shows on the page the rerun draws
+actuals_message = st.session_state.pop("actuals_message", None)
+if actuals_message:
+    st.success(actuals_message)
+
 all_reports = load_all_reports()
 pending_reports = [
     r for r in all_reports
@@ -175,6 +238,38 @@ pending_reports = [
 if not pending_reports:
     st.info("No historical weeks with pending actuals.")
 else:
+    # Resolve from Gulf Coast jet fuel spot prices
+    threshold = st.number_input(
+        "Flat threshold (% weekly change):",
+        min_value=0.0,
+        value=FLAT_THRESHOLD_PCT,
+        step=0.25,
+        key="actuals_flat_threshold",
+    )
+    closes = jet_fuel_closes()
+    st.dataframe(
+        weekly_changes(pending_reports, closes),
+        column_config={
+            "Start": st.column_config.DateColumn(),
+            "End": st.column_config.DateColumn(),
+            "Change %": st.column_config.NumberColumn(format="%.2f%%"),
+        },
+    )
+
+    if st.button("Auto-resolve from Spot Prices", key="auto_resolve_actuals"):
+        resolved = resolve_actuals(pending_reports, threshold, closes)
+        for report in resolved:
+            save_report(report)
+        if resolved:
+            weeks = ", ".join(str(r["week"]) for r in resolved)
+            st.session_state.actuals_message = (
+                f"Resolved actuals for week(s) {weeks}."
+            )
+            st.rerun()
+        else:
+            st.warning("No pending week is fully covered by spot prices yet.")
+
+    st.markdown("**Or set actuals manually:**")
     for report in pending_reports:
         week = report["week"]
         pred = report.get("predicted", "❓")
@@ -196,5 +291,7 @@ else:
             if st.button("Save", key=f"save_actual_{week}"):
                 report["actual"] = DIRECTION_MAP[actual]
                 save_report(report)
-                st.success(f"Week {week} actual updated!")
+                st.session_state.actuals_message = (
+                    f"Week {week} actual updated!"
+                )
                 st.rerun()
@@ -0,0 +1,39 @@
+"""Small synthetic datasets shared by the tests."""
+
+import numpy as np
+import pandas as pd
+
+from app.dataset import to_dataset
+from app.rollups import ROLLUP_AGGS, ROLLUP_FREQS, compute_rollups
+
+
+def spot_frame() -> pd.DataFrame:
+    """Two assets of business-day prices over 2019-2022."""
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range("2019-01-01", "2022-12-31")
+    frames = [
+        pd.DataFrame(
+            {
+                "Date": dates,
+                "Price": start + np.cumsum(rng.normal(0, 0.05, len(dates))),
+                "Asset": asset,
+            }
+        )
+        for asset, start in [("Jet Fuel", 2.5), ("Diesel", 2.8)]
+    ]
+    return pd.concat(frames, ignore_index=True)
+
+
+def rollup_views(spot_df: pd.DataFrame) -> dict:
+    """The stored rollups as app.rollups serves them to the dashboard."""
+    rollups = compute_rollups(spot_df)
+    return {
+        (freq_label, agg_label): to_dataset(
+            rollups[(rollups["freq"] == freq) & (rollups["agg"] == agg)][
+                ["Date", "Price", "Asset"]
+            ],
+            "Price",
+        )
+        for freq_label, freq in ROLLUP_FREQS.items()
+        for agg_label, agg in ROLLUP_AGGS.items()
+    }
@@ -0,0 +1,123 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from app.sections.analysis.actuals import (
+    DOWN,
+    FLAT,
+    UP,
+    classify_changes,
+    parse_date_range,
+    resolve_actuals,
+    weekly_changes,
+)
+
+
+def closes(prices: dict) -> pd.Series:
+    return pd.Series(
+        list(prices.values()),
+        index=pd.DatetimeIndex(list(prices), name="Date"),
+        dtype="float64",
+    )
+
+
+class ParseDateRangeTest(unittest.TestCase):
+    def test_formats(self):
+        for text, start, end in [
+            ("Jan 13 - Jan 17, 2026", "2026-01-13", "2026-01-17"),
+            ("Jan 13-17, 2026", "2026-01-13", "2026-01-17"),
+            ("Dec 29, 2025 - Jan 2, 2026", "2025-12-29", "2026-01-02"),
+            ("Dec 29 - Jan 2, 2026", "2025-12-29", "2026-01-02"),
+        ]:
+            with self.subTest(text=text):
+                self.assertEqual(
+                    parse_date_range(text),
+                    (pd.Timestamp(start), pd.Timestamp(end)),
+                )
+
+    def test_unparseable(self):
+        for text in (
+            None,
+            "",
+            "Week 3",
+            "Jan 13 - 17",
+            "Foo 13 - 17, 2026",
+            "Feb 30 - Mar 3, 2026",
+            "Jan 17 - Jan 13, 2026",
+        ):
+            with self.subTest(text=text):
+                self.assertIsNone(parse_date_range(text))
+
+
+class WeeklyChangesTest(unittest.TestCase):
+    CLOSES = closes(
+        {
+            "2026-01-09": 2.00,
+            "2026-01-12": 2.02,
+            "2026-01-16": 2.10,
+            # No quotes at all in the week of Jan 19
+            "2026-01-26": 2.05,
+            "2026-01-30": 2.20,
+        }
+    )
+
+    def changes(self, *date_ranges):
+        reports = [
+            {"week": week, "date_range": text}
+            for week, text in enumerate(date_ranges, start=1)
+        ]
+        return weekly_changes(reports, self.CLOSES)
+
+    def test_week_against_the_previous_close(self):
+        row = self.changes("Jan 12 - Jan 16, 2026").iloc[0]
+        self.assertEqual(row["Previous Close"], 2.00)
+        self.assertEqual(row["Close"], 2.10)
+        self.assertAlmostEqual(row["Change %"], 5.0)
+
+    def test_week_without_prices(self):
+        row = self.changes("Jan 19 - Jan 23, 2026").iloc[0]
+        self.assertTrue(np.isnan(row["Change %"]))
+
+    def test_unpriceable_weeks(self):
+        changes = self.changes(
+            "not a range",
+            # Nothing quoted before the week starts
+            "Jan 5 - Jan 9, 2026",
+            # Runs past the last close
+            "Jan 26 - Feb 3, 2026",
+            "Jan 26 - Jan 30, 2026",
+        )
+        self.assertTrue(changes["Change %"].iloc[:3].isna().all())
+        # Against Jan 16, across the week without quotes
+        self.assertAlmostEqual(
+            changes["Change %"].iloc[3], (2.20 / 2.10 - 1) * 100
+        )
+
+    def test_only_priced_weeks_resolve(self):
+        reports = [
+            {"week": 1, "date_range": "Jan 12 - Jan 16, 2026"},
+            {"week": 2, "date_range": "Jan 19 - Jan 23, 2026"},
+        ]
+        resolved = resolve_actuals(reports, closes=self.CLOSES)
+        self.assertEqual(resolved, [{**reports[0], "actual": UP}])
+
+
+class ClassifyChangesTest(unittest.TestCase):
+    def test_exactly_at_the_threshold_is_a_move(self):
+        changes = pd.Series([1.0, -1.0, 0.999, -0.999, 0.0, np.nan])
+        self.assertEqual(
+            classify_changes(changes, threshold=1.0).tolist(),
+            [UP, DOWN, FLAT, FLAT, FLAT, None],
+        )
+
+    def test_zero_threshold(self):
+        changes = pd.Series([0.0, 0.01, -0.01])
+        self.assertEqual(
+            classify_changes(changes, threshold=0.0).tolist(),
+            [UP, UP, DOWN],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from app.analytics import (
+    data_granularity_and_aggregate_stats,
+    rolling_ols_slopes,
+)
+from app.dataset import to_dataset
+from tests.synthetic import rollup_views, spot_frame
+
+
+class RollupsMatchResampleTest(unittest.TestCase):
+    """Stored rollups must give the chart the same rows as resampling."""
+
+    @classmethod
+    def setUpClass(cls):
+        spot_df = spot_frame()
+        cls.dataset = to_dataset(spot_df, "Price")
+        cls.rollups = rollup_views(spot_df)
+
+    def assert_same_view(self, assets, from_year, to_year, rollups=None):
+        rollups = rollups or self.rollups
+        filtered = self.dataset.select(assets, from_year, to_year)
+        for freq, agg in rollups:
+            with self.subTest(freq=freq, agg=agg, years=(from_year, to_year)):
+                expected = (
+                    data_granularity_and_aggregate_stats(freq, agg, filtered)
+                    .dropna(subset=["Price"])
+                    .sort_values(by=["Asset", "Date"])
+                    .reset_index(drop=True)
+                )
+                actual = (
+                    data_granularity_and_aggregate_stats(
+                        freq, agg, filtered, rollups
+                    )
+                    .sort_values(by=["Asset", "Date"])
+                    .reset_index(drop=True)
+                )
+                pd.testing.assert_frame_equal(
+                    actual[["Asset", "Date", "Price"]],
+                    expected[["Asset", "Date", "Price"]],
+                    check_dtype=False,
+                    check_categorical=False,
+                    atol=1e-4,
+                )
+
+    def test_weeks_straddling_the_selection_edges(self):
+        # 2020-12-31 is a Thursday and 2021-12-31 a Friday, so the first
+        # and last weeks both run past the selected years
+        self.assert_same_view(["Jet Fuel", "Diesel"], 2021, 2021)
+        self.assert_same_view(["Jet Fuel"], 2020, 2021)
+
+    def test_full_history(self):
+        self.assert_same_view(["Jet Fuel", "Diesel"], 2019, 2022)
+
+    def test_assets_without_a_rollup(self):
+        # Like the derived spreads: only some series have stored views
+        spot_df = spot_frame()
+        jet_only = rollup_views(spot_df[spot_df["Asset"] == "Jet Fuel"])
+        self.assert_same_view(["Jet Fuel", "Diesel"], 2020, 2021, jet_only)
+
+
+class RollingSlopesTest(unittest.TestCase):
+    """The prefix-sum slopes must match a direct fit of every window."""
+
+    WINDOWS = [2, 5, 20, 60]
+
+    def assert_matches_polyfit(self, values, atol):
+        slopes = rolling_ols_slopes(values, self.WINDOWS)
+        self.assertEqual(slopes.shape, (len(self.WINDOWS), len(values)))
+        for k, w in enumerate(self.WINDOWS):
+            with self.subTest(window=w):
+                self.assertTrue(np.isnan(slopes[k, : w - 1]).all())
+                expected = [
+                    np.polyfit(np.arange(w), values[i - w + 1 : i + 1], 1)[0]
+                    for i in range(w - 1, len(values))
+                ]
+                np.testing.assert_allclose(
+                    slopes[k, w - 1 :], expected, rtol=0, atol=atol
+                )
+
+    def test_matches_polyfit(self):
+        rng = np.random.default_rng(0)
+        values = 2.5 + np.cumsum(rng.normal(0, 0.02, 500))
+        self.assert_matches_polyfit(values, atol=1e-10)
+
+    def test_large_offset_keeps_precision(self):
+        # Raw prefix sums of values near 1e6 cancel most of their digits
+        rng = np.random.default_rng(1)
+        values = 1e6 + np.cumsum(rng.normal(0, 0.02, 3000))
+        self.assert_matches_polyfit(values, atol=1e-8)
+
+    def test_shorter_than_the_window(self):
+        slopes = rolling_ols_slopes(np.array([1.0, 2.0]), [5])
+        self.assertTrue(np.isnan(slopes).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+import threading
+import unittest
+from http.client import HTTPConnection
+from http.server import ThreadingHTTPServer
+from unittest import mock
+
+import pandas as pd
+
+from app.data_api import DataAPIHandler, load_series, parse_query
+from app.dataset import to_dataset
+from tests.synthetic import rollup_views, spot_frame
+
+
+class SeriesRangeTest(unittest.TestCase):
+    """Buckets cut by 'from'/'to' aggregate only the days inside them."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.spot_df = spot_frame()
+        cls.dataset = to_dataset(cls.spot_df, "Price")
+        cls.rollups = rollup_views(cls.spot_df)
+
+    def query(self, freq, agg, start, end, rollups):
+        params = {
+            "asset": ["Jet Fuel"],
+            "freq": [freq],
+            "agg": [agg],
+            "from": [start],
+            "to": [end],
+        }
+        query = parse_query(params, self.dataset)
+        return load_series(query, self.dataset, rollups)
+
+    def daily(self, start, end) -> pd.Series:
+        jet = self.spot_df[self.spot_df["Asset"] == "Jet Fuel"]
+        jet = jet.set_index("Date")["Price"].astype("float32")
+        return jet.loc[start:end]
+
+    def assert_edges(self, freq, start, end, first_label, last_label):
+        days = self.daily(start, end)
+        period = days.index.to_period("W-SUN" if freq == "weekly" else "M")
+        first_days = days[period == period[0]]
+        last_days = days[period == period[-1]]
+        for rollups in (None, self.rollups):
+            for agg, expect_first, expect_last in [
+                ("mean", first_days.mean(), last_days.mean()),
+                ("last", first_days.iloc[-1], last_days.iloc[-1]),
+            ]:
+                with self.subTest(agg=agg, rollups=rollups is not None):
+                    series = self.query(freq, agg, start, end, rollups)
+                    first, last = series.iloc[0], series.iloc[-1]
+                    self.assertEqual(first["Date"], pd.Timestamp(first_label))
+                    self.assertEqual(last["Date"], pd.Timestamp(last_label))
+                    self.assertAlmostEqual(
+                        first["Price"], expect_first, places=5
+                    )
+                    self.assertAlmostEqual(
+                        last["Price"], expect_last, places=5
+                    )
+
+    def test_weekly_bounds_mid_week(self):
+        # 2021-03-10 and 2021-06-16 are Wednesdays
+        self.assert_edges(
+            "weekly", "2021-03-10", "2021-06-16", "2021-03-14", "2021-06-20"
+        )
+
+    def test_monthly_bounds_mid_month(self):
+        self.assert_edges(
+            "monthly", "2021-03-10", "2021-06-16", "2021-03-31", "2021-06-30"
+        )
+
+    def test_year_bound_keeps_the_last_partial_week(self):
+        # 2021-12-31 is a Friday in the week labelled 2022-01-02
+        series = self.query("weekly", "last", "2021", "2021", self.rollups)
+        last = series.iloc[-1]
+        self.assertEqual(last["Date"], pd.Timestamp("2022-01-02"))
+        self.assertAlmostEqual(
+            last["Price"], self.daily("2021", "2021").iloc[-1], places=5
+        )
+
+
+class QuietHandler(DataAPIHandler):
+    def log_message(self, *args):
+        pass
+
+
+class ConditionalSeriesTest(unittest.TestCase):
+    """A held ETag answers 304 only for a query that would succeed."""
+
+    VERSION = "v1"
+
+    @classmethod
+    def setUpClass(cls):
+        dataset = to_dataset(spot_frame(), "Price")
+        cls.source = mock.patch(
+            "app.data_api.open_source",
+            return_value=(dataset, None, cls.VERSION),
+        )
+        cls.source.start()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), QuietHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.source.stop()
+
+    def status(self, query, if_none_match):
+        conn = HTTPConnection(*self.server.server_address)
+        try:
+            conn.request(
+                "GET",
+                f"/series?{query}",
+                headers={"If-None-Match": if_none_match},
+            )
+            response = conn.getresponse()
+            response.read()
+            return response.status
+        finally:
+            conn.close()
+
+    def test_current_tag_is_not_modified(self):
+        for tag in (f'"{self.VERSION}"', f'W/"{self.VERSION}"', "*"):
+            with self.subTest(tag=tag):
+                self.assertEqual(self.status("asset=Diesel", tag), 304)
+
+    def test_stale_tag_gets_the_body(self):
+        self.assertEqual(self.status("asset=Diesel", '"v0"'), 200)
+
+    def test_bad_query_is_rejected_despite_the_tag(self):
+        tag = f'"{self.VERSION}"'
+        for query in (
+            "asset=Kerosene",
+            "asset=Diesel&freq=hourly",
+            "asset=Diesel&agg=median",
+            "asset=Diesel&from=soon",
+            "asset=Diesel&from=2022&to=2021",
+            "freq=weekly",
+        ):
+            with self.subTest(query=query):
+                self.assertEqual(self.status(query, tag), 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
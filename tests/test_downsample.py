@@ -0,0 +1,76 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from app.downsample import downsample_long, lttb_indices
+
+
+class LTTBTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.x = np.arange(5000, dtype="int64")
+        self.y = np.cumsum(rng.normal(0, 0.01, len(self.x)))
+
+    def test_keeps_first_and_last(self):
+        for n_out in (3, 10, 700):
+            with self.subTest(n_out=n_out):
+                idx = lttb_indices(self.x, self.y, n_out)
+                self.assertEqual(len(idx), n_out)
+                self.assertEqual(idx[0], 0)
+                self.assertEqual(idx[-1], len(self.x) - 1)
+                self.assertTrue((np.diff(idx) > 0).all())
+
+    def test_keeps_a_single_peak(self):
+        for peak in (1, 1234, 4998):
+            for n_out in (3, 50, 700):
+                with self.subTest(peak=peak, n_out=n_out):
+                    y = self.y.copy()
+                    y[peak] += 10
+                    self.assertIn(peak, lttb_indices(self.x, y, n_out))
+
+    def test_short_series_untouched(self):
+        for n_out in (len(self.x), len(self.x) + 1, 2):
+            with self.subTest(n_out=n_out):
+                np.testing.assert_array_equal(
+                    lttb_indices(self.x, self.y, n_out), self.x
+                )
+
+
+class DownsampleLongTest(unittest.TestCase):
+    def frame(self, lengths: dict) -> pd.DataFrame:
+        rng = np.random.default_rng(1)
+        parts = [
+            pd.DataFrame(
+                {
+                    "Date": pd.bdate_range("2020-01-01", periods=n),
+                    "Asset": asset,
+                    "Price": np.cumsum(rng.normal(0, 0.01, n)),
+                }
+            )
+            for asset, n in lengths.items()
+        ]
+        return pd.concat(parts, ignore_index=True)
+
+    def test_all_short_is_the_same_frame(self):
+        df = self.frame({"Jet Fuel": 100, "Diesel": 50})
+        self.assertIs(downsample_long(df, "Price", 100), df)
+
+    def test_only_long_series_are_thinned(self):
+        df = self.frame({"Jet Fuel": 2000, "Diesel": 50})
+        df.loc[df.index[-1], "Price"] = np.nan
+        out = downsample_long(df, "Price", 100)
+
+        jet = out[out["Asset"] == "Jet Fuel"]
+        self.assertEqual(len(jet), 100)
+        self.assertEqual(jet["Date"].iloc[0], df["Date"].iloc[0])
+        self.assertEqual(jet["Date"].iloc[-1], df["Date"].iloc[1999])
+
+        diesel = out[out["Asset"] == "Diesel"].reset_index(drop=True)
+        pd.testing.assert_frame_equal(
+            diesel, df[df["Asset"] == "Diesel"].reset_index(drop=True)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
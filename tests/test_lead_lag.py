@@ -0,0 +1,62 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from app.lead_lag import (
+    MAX_LAG_MONTHS,
+    compute_lead_lag,
+    fft_cross_correlation,
+    peak_lags,
+)
+
+
+class LeadLagSignTest(unittest.TestCase):
+    """Positive lags must mean prices lead refinery output."""
+
+    MONTHS = pd.date_range("2010-01-01", periods=120, freq="MS")
+
+    def shifted_pair(self, lead):
+        """Price and refinery levels whose changes repeat `lead` months on."""
+        rng = np.random.default_rng(lead)
+        changes = rng.normal(0, 0.05, len(self.MONTHS) + lead)
+        price = np.exp(np.cumsum(changes[lead:]))
+        refinery = np.exp(np.cumsum(changes[: len(self.MONTHS)]))
+        return (
+            pd.DataFrame({"Jet Fuel": price}, index=self.MONTHS),
+            pd.DataFrame({"Jet Output": refinery}, index=self.MONTHS),
+        )
+
+    def test_peak_at_the_known_lead(self):
+        for lead in (1, 3, MAX_LAG_MONTHS):
+            with self.subTest(lead=lead):
+                prices, refinery = self.shifted_pair(lead)
+                peak = peak_lags(compute_lead_lag(prices, refinery))
+                self.assertEqual(len(peak), 1)
+                self.assertEqual(peak["Lag"].iloc[0], lead)
+                self.assertGreater(peak["Correlation"].iloc[0], 0.9)
+
+    def test_matches_direct_correlation(self):
+        rng = np.random.default_rng(0)
+        x = rng.normal(size=(80, 2))
+        y = rng.normal(size=(80, 3))
+        max_lag = 4
+        cross = fft_cross_correlation(x, y, max_lag)
+        self.assertEqual(cross.shape, (2 * max_lag + 1, 2, 3))
+
+        n = len(x)
+        xs = (x - x.mean(axis=0)) / x.std(axis=0)
+        ys = (y - y.mean(axis=0)) / y.std(axis=0)
+        for k in range(-max_lag, max_lag + 1):
+            # corr(x[t], y[t + k]) over the overlapping t, scaled by 1/n
+            if k >= 0:
+                expected = xs[: n - k].T @ ys[k:] / n
+            else:
+                expected = xs[-k:].T @ ys[: n + k] / n
+            np.testing.assert_allclose(
+                cross[max_lag + k], expected, atol=1e-12
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
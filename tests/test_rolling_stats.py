@@ -0,0 +1,149 @@
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from app.rolling_stats import (
+    CORR_WINDOW,
+    PRICE_ASSETS,
+    RollingComoments,
+    compute_rolling_stats,
+    fold_in_returns,
+    log_returns,
+    read_rolling_stats_file,
+    resumable_state,
+    write_rolling_stats_file,
+)
+
+
+def price_matrix(days=300, seed=0) -> pd.DataFrame:
+    """Wide Date x asset frame of correlated random-walk prices."""
+    rng = np.random.default_rng(seed)
+    common = rng.normal(0, 0.015, days)[:, None]
+    steps = common + rng.normal(0, 0.01, (days, len(PRICE_ASSETS)))
+    return pd.DataFrame(
+        2.5 * np.exp(np.cumsum(steps, axis=0)),
+        index=pd.bdate_range("2022-01-03", periods=days, name="Date"),
+        columns=list(PRICE_ASSETS),
+    )
+
+
+class IncrementalRollingStatsTest(unittest.TestCase):
+    """Folding in new days must land where a cold recompute does."""
+
+    SPLIT = 200
+
+    def setUp(self):
+        self.wide = price_matrix()
+        self.returns = log_returns(self.wide)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def stored(self, wide, digest="base"):
+        """Round-trips the cold stats of `wide` through the stats file."""
+        returns = log_returns(wide)
+        volatility, correlation, states = compute_rolling_stats(returns)
+        last = volatility.index[-1]
+        filename = Path(self.tmp.name) / "stats.json"
+        with redirect_stdout(io.StringIO()):
+            write_rolling_stats_file(
+                volatility,
+                correlation,
+                states,
+                {asset: float(wide.loc[last, asset]) for asset in wide},
+                digest,
+                filename=filename,
+            )
+        return read_rolling_stats_file(filename)
+
+    def test_fold_in_matches_cold(self):
+        head = self.returns.iloc[: self.SPLIT]
+        volatility, correlation, states = compute_rolling_stats(head)
+        volatility, correlation = fold_in_returns(
+            volatility, correlation, states, self.returns.iloc[self.SPLIT :]
+        )
+
+        cold_volatility, cold_correlation, cold_states = (
+            compute_rolling_stats(self.returns)
+        )
+        pd.testing.assert_frame_equal(volatility, cold_volatility, atol=1e-9)
+        pd.testing.assert_frame_equal(
+            correlation, cold_correlation, atol=1e-9
+        )
+        for window, state in states.items():
+            np.testing.assert_allclose(
+                state.comoment, cold_states[window].comoment, atol=1e-12
+            )
+
+    def test_resume_from_the_stats_file(self):
+        stored = self.stored(self.wide.iloc[: self.SPLIT])
+        last_date = pd.Timestamp(stored["last_date"])
+        self.assertTrue(
+            resumable_state(
+                stored, self.wide, self.returns, "base", since=last_date
+            )
+        )
+
+        states = {
+            int(w): RollingComoments.from_state(s, len(PRICE_ASSETS))
+            for w, s in stored["states"].items()
+        }
+        volatility, correlation = fold_in_returns(
+            stored["volatility"],
+            stored["correlation"],
+            states,
+            self.returns[self.returns.index > last_date],
+        )
+        cold_volatility, cold_correlation, _ = compute_rolling_stats(
+            self.returns
+        )
+        # The stored history is rounded to 6 decimals, new rows are not
+        pd.testing.assert_frame_equal(
+            volatility, cold_volatility, atol=1e-6, check_freq=False
+        )
+        pd.testing.assert_frame_equal(
+            correlation, cold_correlation, atol=1e-6, check_freq=False
+        )
+        new = volatility.index > last_date
+        np.testing.assert_allclose(
+            volatility[new], cold_volatility[new], atol=1e-9
+        )
+
+    def test_revisions_force_a_cold_recompute(self):
+        stored = self.stored(self.wide.iloc[: self.SPLIT])
+        last_date = pd.Timestamp(stored["last_date"])
+
+        revised = self.wide.copy()
+        revised.iloc[self.SPLIT - 10, 0] *= 1.01
+        self.assertFalse(
+            resumable_state(stored, revised, log_returns(revised), "base")
+        )
+
+        revised = self.wide.copy()
+        revised.loc[last_date, PRICE_ASSETS[1]] += 0.05
+        self.assertFalse(
+            resumable_state(stored, revised, log_returns(revised), "base")
+        )
+
+    def test_merge_reaching_before_the_windows(self):
+        stored = self.stored(self.wide.iloc[: self.SPLIT])
+        too_early = self.wide.index[self.SPLIT - CORR_WINDOW - 5]
+        self.assertFalse(
+            resumable_state(
+                stored, self.wide, self.returns, "base", since=too_early
+            )
+        )
+
+    def test_other_base_file(self):
+        stored = self.stored(self.wide.iloc[: self.SPLIT], digest="older")
+        self.assertFalse(
+            resumable_state(stored, self.wide, self.returns, "base")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()